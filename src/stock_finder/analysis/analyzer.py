@@ -60,7 +60,7 @@ class TrendlineAnalyzer:
         self.provider = provider
         self.db = db
         self.config = config or TrendlineConfig()
-        self.parallel_config = parallel_config or ParallelConfig()
+        self.parallel_config = (parallel_config or ParallelConfig()).resolve(provider)
 
     def analyze_stock(
         self,
@@ -197,7 +197,7 @@ class CriteriaDeriver:
                 (start_date, end_date, min_gain),
             ).fetchall()
 
-            return [dict(r) for r in winners], [dict(r) for r in non_winners]
+            return winners, non_winners
 
     def _derive_threshold(
         self,
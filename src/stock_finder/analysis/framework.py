@@ -165,7 +165,7 @@ class AnalysisFramework:
                 """,
                 (start_date, end_date, min_gain_pct),
             ).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def _get_all_data(
         self,
@@ -188,7 +188,7 @@ class AnalysisFramework:
                 """,
                 (start_date, end_date),
             ).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def _store_result(self, result: AnalysisResult, notes: str | None = None) -> None:
         """Store analysis results in the database."""
@@ -164,7 +164,7 @@ def cli(ctx: click.Context, verbose: bool, config: str | None) -> None:
     "--workers",
     type=int,
     default=None,
-    help="Number of parallel workers (default: 10, use 1 for sequential)",
+    help="Number of parallel workers (default: sized to the data provider, use 1 for sequential)",
 )
 @click.pass_context
 def scan(
@@ -229,7 +229,7 @@ def scan(
     data_provider, _ = create_data_provider(settings, provider, no_cache)
 
     # Configure parallel processing
-    parallel_config = settings.parallel.model_copy()
+    parallel_config = settings.parallel.resolve(data_provider)
     if workers is not None:
         parallel_config.max_workers = workers
         parallel_config.enabled = workers > 1
@@ -254,11 +254,15 @@ def scan(
         )
         console.print(f"[cyan]Saving to database: {db.db_path} (run #{scan_run_id})[/cyan]")
 
-        # Callback to save each result incrementally
+        # Callback to queue each result for the background writer
+        pending = []
+
         def on_result(result):
-            db.add_result(scan_run_id, result)
+            pending.append(db.queue_results(scan_run_id, [result]))
 
         results = scanner.scan(ticker_list, show_progress=True, on_result=on_result)
+        for future in pending:
+            future.result()
         db.complete_scan_run(scan_run_id)
     else:
         results = scanner.scan(ticker_list, show_progress=True)
@@ -490,8 +494,8 @@ def import_csv(
         ticker_count=len(rows),
     )
 
-    # Import each row
-    imported = 0
+    # Parse each row, then insert them in one batch
+    parsed = []
     for row in rows:
         try:
             result = ScanResult(
@@ -504,11 +508,11 @@ def import_csv(
                 current_price=float(row["current_price"].replace("$", "").replace(",", "")),
                 days_to_peak=int(row["days_to_peak"]),
             )
-            db.add_result(scan_run_id, result)
-            imported += 1
+            parsed.append(result)
         except Exception as e:
             console.print(f"[red]Error importing {row.get('ticker', 'unknown')}: {e}[/red]")
 
+    imported = len(db.add_results(scan_run_id, parsed))
     db.complete_scan_run(scan_run_id)
 
     console.print(f"[green]Imported {imported} results to database[/green]")
@@ -565,7 +569,7 @@ def neumann() -> None:
     "--workers",
     type=int,
     default=None,
-    help="Number of parallel workers (default: 10, use 1 for sequential)",
+    help="Number of parallel workers (default: sized to the data provider, use 1 for sequential)",
 )
 @click.option(
     "--scoring-mode",
@@ -608,7 +612,7 @@ def score(
     data_provider, _ = create_data_provider(settings, provider, no_cache)
 
     # Configure parallel processing
-    parallel_config = settings.parallel.model_copy()
+    parallel_config = settings.parallel.resolve(data_provider)
     if workers is not None:
         parallel_config.max_workers = workers
         parallel_config.enabled = workers > 1
@@ -653,9 +657,6 @@ def score(
                 score_result = scorer.score_stock(result)
                 scores.append(score_result)
 
-                if save:
-                    db.add_neumann_score(score_result)
-
                 progress.update(
                     task,
                     advance=1,
@@ -665,6 +666,9 @@ def score(
                 console.print(f"[red]Error scoring {result['ticker']}: {e}[/red]")
                 progress.update(task, advance=1)
 
+    if save:
+        db.add_neumann_scores(scores)
+
     # Show summary
     if scores:
         avg_score = sum(s.score for s in scores) / len(scores)
@@ -750,9 +754,6 @@ def neumann_results(
         return
 
     if output_format == "json":
-        # Remove criteria_json (it's duplicated in criteria_results)
-        for s in scores:
-            s.pop("criteria_json", None)
         click.echo(json_module.dumps(scores, indent=2, default=str))
         return
 
@@ -862,7 +863,7 @@ def trendline() -> None:
     "--workers",
     type=int,
     default=None,
-    help="Number of parallel workers (default: 10, use 1 for sequential)",
+    help="Number of parallel workers (default: sized to the data provider, use 1 for sequential)",
 )
 @click.pass_context
 def analyze(
@@ -899,7 +900,7 @@ def analyze(
     data_provider, _ = create_data_provider(settings, provider, no_cache)
 
     # Configure parallel processing
-    parallel_config = settings.parallel.model_copy()
+    parallel_config = settings.parallel.resolve(data_provider)
     if workers is not None:
         parallel_config.max_workers = workers
         parallel_config.enabled = workers > 1
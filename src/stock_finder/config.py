@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 from pydantic import BaseModel, Field
@@ -14,6 +14,11 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, rely on environment variables
 
+if TYPE_CHECKING:
+    from stock_finder.data.base import DataProvider
+
+DEFAULT_MAX_WORKERS = 10
+
 
 class FMPConfig(BaseModel):
     """Configuration for FMP (Financial Modeling Prep) API."""
@@ -21,6 +26,7 @@ class FMPConfig(BaseModel):
     api_key: str | None = Field(default=None, description="FMP API key (loaded from FMP_API_KEY env var)")
     base_url: str = Field(default="https://financialmodelingprep.com/api/v3")
     batch_size: int = Field(default=50, description="Max tickers per batch request")
+    max_workers: int = Field(default=8, description="Concurrent batch requests")
     timeout: int = Field(default=30)
 
     @classmethod
@@ -50,6 +56,7 @@ class DataConfig(BaseModel):
 
     cache: CacheConfig = Field(default_factory=CacheConfig)
     rate_limit_delay: float = Field(default=0.1, description="Seconds between API calls")
+    max_workers: int = Field(default=4, description="Concurrent batch downloads")
     timeout: int = Field(default=30)
 
 
@@ -69,9 +76,38 @@ class LoggingConfig(BaseModel):
 class ParallelConfig(BaseModel):
     """Configuration for parallel processing."""
 
-    max_workers: int = Field(default=10, description="Maximum concurrent workers")
+    max_workers: int | None = Field(
+        default=None,
+        description="Maximum concurrent workers (None: the data provider's suggested concurrency)",
+    )
     enabled: bool = Field(default=True, description="Enable parallel processing")
 
+    def resolve(self, provider: "DataProvider | None" = None) -> "ResolvedParallelConfig":
+        """
+        Return a copy with max_workers filled in when it is unset.
+
+        Args:
+            provider: Data provider whose suggested_concurrency sizes the pool
+
+        Returns:
+            ResolvedParallelConfig with a concrete max_workers
+        """
+        workers = self.max_workers
+        if workers is None:
+            workers = getattr(provider, "suggested_concurrency", None)
+        if not isinstance(workers, int):
+            # Duck-typed providers without the property get the fixed default
+            workers = DEFAULT_MAX_WORKERS
+        return ResolvedParallelConfig(
+            **self.model_dump(exclude={"max_workers"}), max_workers=workers
+        )
+
+
+class ResolvedParallelConfig(ParallelConfig):
+    """ParallelConfig whose max_workers has been filled in by resolve()."""
+
+    max_workers: int = Field(description="Maximum concurrent workers")
+
 
 class Settings(BaseModel):
     """Main settings container."""
@@ -1,16 +1,38 @@
 """Abstract base class for data providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 
 import pandas as pd
+import structlog
 
+from stock_finder.config import DEFAULT_MAX_WORKERS
 from stock_finder.models.results import StockData
 
+logger = structlog.get_logger()
+
 
 class DataProvider(ABC):
     """Abstract base class for stock data providers."""
 
+    @property
+    def suggested_concurrency(self) -> int:
+        """
+        Number of concurrent fetches this provider serves well.
+
+        Fetches wait on the network rather than the CPU, so the right pool
+        size is set by how much parallel traffic the remote API tolerates.
+        Providers override this with a value suited to their API.
+        """
+        return DEFAULT_MAX_WORKERS
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether get_historical_batch fetches many tickers per request rather than one by one."""
+        return hasattr(self, "get_historical_batch")
+
     @abstractmethod
     def get_historical(
         self,
@@ -65,3 +87,44 @@ class DataProvider(ABC):
         if stock_data is None:
             return None
         return stock_data.data
+
+    def iter_historical(
+        self,
+        tickers: list[str],
+        start: date,
+        end: date,
+        max_workers: int = 16,
+    ) -> Iterator[StockData]:
+        """
+        Fetch historical data for many tickers concurrently, yielding as each completes.
+
+        Fetches are I/O-bound, so a thread pool overlaps their network waits;
+        results arrive in completion order so slow tickers don't hold up fast
+        ones. Tickers without data (or whose fetch raises) are skipped.
+
+        Args:
+            tickers: Stock ticker symbols
+            start: Start date
+            end: End date
+            max_workers: Maximum concurrent fetches
+
+        Yields:
+            StockData for each ticker with data
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_historical, ticker, start, end): ticker for ticker in tickers
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        stock_data = future.result()
+                    except Exception as e:
+                        logger.error("Failed to fetch data", ticker=futures[future], error=str(e))
+                        continue
+                    if stock_data is not None:
+                        yield stock_data
+            finally:
+                # Stop queued fetches if the caller stops iterating early
+                for future in futures:
+                    future.cancel()
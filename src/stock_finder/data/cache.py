@@ -1,6 +1,7 @@
 """Disk-based caching for historical stock data."""
 
 import logging
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -22,6 +23,9 @@ class CacheManager:
     # Data older than this is considered historical and never expires
     HISTORICAL_THRESHOLD_DAYS = 365
 
+    # Parquet codec: zstd gives smaller files than snappy at similar read speed
+    COMPRESSION = "zstd"
+
     def __init__(self, config: CacheConfig):
         """
         Initialize the cache manager.
@@ -96,6 +100,22 @@ class CacheManager:
 
         return age > max_age
 
+    def _iter_entries(self, ticker: str) -> Iterator[tuple[Path, date, date]]:
+        """Yield (cache_path, cached_start, cached_end) for each of a ticker's entries."""
+        pattern = f"{ticker}_*.parquet"
+        for cache_file in self.cache_dir.glob(pattern):
+            try:
+                # Parse the filename to get date range
+                name = cache_file.stem  # e.g., "AAPL_2023-01-01_2023-12-31"
+                parts = name.split("_")
+                if len(parts) != 3:
+                    continue
+
+                yield cache_file, date.fromisoformat(parts[1]), date.fromisoformat(parts[2])
+
+            except (ValueError, IndexError):
+                continue
+
     def _find_superset_cache(
         self,
         ticker: str,
@@ -113,26 +133,55 @@ class CacheManager:
         Returns:
             Tuple of (cache_path, cached_start, cached_end) or None
         """
-        pattern = f"{ticker}_*.parquet"
-        for cache_file in self.cache_dir.glob(pattern):
-            try:
-                # Parse the filename to get date range
-                name = cache_file.stem  # e.g., "AAPL_2023-01-01_2023-12-31"
-                parts = name.split("_")
-                if len(parts) != 3:
-                    continue
+        for cache_file, cached_start, cached_end in self._iter_entries(ticker):
+            # Check if cached range contains requested range
+            if cached_start <= start and cached_end >= end:
+                return cache_file, cached_start, cached_end
 
-                cached_start = date.fromisoformat(parts[1])
-                cached_end = date.fromisoformat(parts[2])
+        return None
 
-                # Check if cached range contains requested range
-                if cached_start <= start and cached_end >= end:
-                    return cache_file, cached_start, cached_end
+    def get_prefix(
+        self,
+        ticker: str,
+        start: date,
+        end: date,
+    ) -> pd.DataFrame | None:
+        """
+        Get cached data that starts the requested range but ends before it does.
 
-            except (ValueError, IndexError):
-                continue
+        Lets a caller fetch only the missing tail rather than the whole range,
+        e.g. when yesterday's scan cached everything up to yesterday. The entry
+        reaching furthest toward end is used; expiry is not checked, since the
+        caller re-fetches from the last cached bar and can compare the overlap.
 
-        return None
+        Args:
+            ticker: Stock ticker symbol
+            start: Start date
+            end: End date
+
+        Returns:
+            Cached DataFrame from start onward, or None if no entry covers start
+        """
+        if not self.config.enabled:
+            return None
+
+        prefixes = [
+            (cached_end, cache_file)
+            for cache_file, cached_start, cached_end in self._iter_entries(ticker)
+            if cached_start <= start <= cached_end < end
+        ]
+        if not prefixes:
+            return None
+
+        _, cache_path = max(prefixes)
+        try:
+            df = self._read(cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to read cache for {ticker}: {e}")
+            return None
+
+        df = df[df.index >= pd.Timestamp(start)]
+        return None if df.empty else df
 
     def get(
         self,
@@ -160,13 +209,13 @@ class CacheManager:
 
         if cache_path.exists():
             if self._is_expired(cache_path, end):
-                logger.debug(f"Cache expired for {ticker} ({start} to {end})")
+                logger.debug("Cache expired for %s (%s to %s)", ticker, start, end)
                 cache_path.unlink()
                 return None
 
             try:
-                df = pd.read_parquet(cache_path)
-                logger.debug(f"Cache HIT for {ticker} ({start} to {end})")
+                df = self._read(cache_path)
+                logger.debug("Cache HIT for %s (%s to %s)", ticker, start, end)
                 return df
             except Exception as e:
                 logger.warning(f"Failed to read cache for {ticker}: {e}")
@@ -178,25 +227,29 @@ class CacheManager:
             cache_path, cached_start, cached_end = superset
 
             if self._is_expired(cache_path, cached_end):
-                logger.debug(f"Cache expired for {ticker} superset")
+                logger.debug("Cache expired for %s superset", ticker)
                 cache_path.unlink()
                 return None
 
             try:
-                df = pd.read_parquet(cache_path)
+                df = self._read(cache_path)
                 # Filter to requested date range
-                mask = (df.index >= pd.Timestamp(start)) & (df.index <= pd.Timestamp(end))
-                filtered = df[mask]
+                if df.index.is_monotonic_increasing:
+                    # Binary search on the sorted index instead of a full mask
+                    filtered = df.loc[pd.Timestamp(start) : pd.Timestamp(end)]
+                else:
+                    mask = (df.index >= pd.Timestamp(start)) & (df.index <= pd.Timestamp(end))
+                    filtered = df[mask]
                 logger.debug(
-                    f"Cache HIT (subset) for {ticker} ({start} to {end}) "
-                    f"from cached ({cached_start} to {cached_end})"
+                    "Cache HIT (subset) for %s (%s to %s) from cached (%s to %s)",
+                    ticker, start, end, cached_start, cached_end,
                 )
                 return filtered
             except Exception as e:
                 logger.warning(f"Failed to read cache for {ticker}: {e}")
                 return None
 
-        logger.debug(f"Cache MISS for {ticker} ({start} to {end})")
+        logger.debug("Cache MISS for %s (%s to %s)", ticker, start, end)
         return None
 
     def set(
@@ -225,10 +278,20 @@ class CacheManager:
         cache_path = self._get_cache_path(key)
 
         try:
-            data.to_parquet(cache_path, index=True)
-            logger.debug(f"Cached {ticker} ({start} to {end})")
+            data.to_parquet(cache_path, index=True, compression=self.COMPRESSION)
+            logger.debug("Cached %s (%s to %s)", ticker, start, end)
         except Exception as e:
             logger.warning(f"Failed to cache {ticker}: {e}")
+            return
+
+        # Entries inside the new range are now redundant
+        for cache_file, cached_start, cached_end in self._iter_entries(ticker):
+            if cache_file != cache_path and start <= cached_start and cached_end <= end:
+                cache_file.unlink(missing_ok=True)
+
+    def _read(self, cache_path: Path) -> pd.DataFrame:
+        """Read a cache file, memory-mapping it rather than copying it in."""
+        return pd.read_parquet(cache_path, memory_map=True)
 
     def exists(
         self,
@@ -350,6 +413,6 @@ class CacheManager:
             try:
                 cache_file.unlink()
                 current_size -= file_size
-                logger.debug(f"Evicted {cache_file.name} (LRU)")
+                logger.debug("Evicted %s (LRU)", cache_file.name)
             except Exception as e:
                 logger.warning(f"Failed to evict {cache_file}: {e}")
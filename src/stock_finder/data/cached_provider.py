@@ -1,8 +1,12 @@
 """Cached data provider wrapper."""
 
 import logging
+import os
 from datetime import date
 
+import numpy as np
+import pandas as pd
+
 from stock_finder.data.base import DataProvider
 from stock_finder.data.cache import CacheManager
 from stock_finder.models.results import StockData
@@ -30,6 +34,16 @@ class CachedDataProvider(DataProvider):
         self.provider = provider
         self.cache = cache_manager
 
+    @property
+    def suggested_concurrency(self) -> int:
+        """Cache hits are local disk reads, so use at least one worker per CPU."""
+        return max(self.provider.suggested_concurrency, os.cpu_count() or 1)
+
+    @property
+    def supports_batch(self) -> bool:
+        """Cache misses are only batched when the wrapped provider batches them."""
+        return hasattr(self.provider, "get_historical_batch")
+
     def get_historical(
         self,
         ticker: str,
@@ -53,12 +67,19 @@ class CachedDataProvider(DataProvider):
         if not bypass_cache:
             cached_df = self.cache.get(ticker, start, end)
             if cached_df is not None:
-                logger.debug(f"Cache HIT for {ticker} ({start} to {end})")
+                logger.debug("Cache HIT for %s (%s to %s)", ticker, start, end)
                 return StockData(ticker=ticker, data=cached_df)
 
-        # Cache miss - fetch from provider
-        logger.debug(f"Cache MISS for {ticker} ({start} to {end})")
-        result = self.provider.get_historical(ticker, start, end)
+        # Cache miss - fetch only the new tail if an earlier range is cached,
+        # otherwise the whole range
+        logger.debug("Cache MISS for %s (%s to %s)", ticker, start, end)
+        result = None
+        prefix = None if bypass_cache else self.cache.get_prefix(ticker, start, end)
+        if prefix is not None:
+            tail = self.provider.get_historical(ticker, self._tail_start(prefix), end)
+            result = self._extend(ticker, prefix, tail)
+        if result is None:
+            result = self.provider.get_historical(ticker, start, end)
 
         # Cache the result
         if result is not None:
@@ -66,6 +87,113 @@ class CachedDataProvider(DataProvider):
 
         return result
 
+    def get_historical_batch(
+        self,
+        tickers: list[str],
+        start: date,
+        end: date,
+    ) -> dict[str, StockData]:
+        """
+        Fetch historical data for many tickers, downloading only cache misses.
+
+        Misses go through the wrapped provider's get_historical_batch when it
+        has one, otherwise through get_historical one ticker at a time.
+
+        Args:
+            tickers: Stock ticker symbols
+            start: Start date
+            end: End date
+
+        Returns:
+            Dictionary mapping ticker to StockData; tickers without data are omitted
+        """
+        results: dict[str, StockData] = {}
+        misses: list[str] = []
+        for ticker in tickers:
+            cached_df = self.cache.get(ticker, start, end)
+            if cached_df is not None:
+                results[ticker] = StockData(ticker=ticker, data=cached_df)
+            else:
+                misses.append(ticker)
+
+        logger.debug("Cache batch: %s hits, %s misses", len(results), len(misses))
+        if not misses:
+            return results
+
+        # Tickers cached up to an earlier day only need their tail; group them
+        # by where the tail starts so each group is one batch fetch
+        prefixes: dict[str, pd.DataFrame] = {}
+        tail_groups: dict[date, list[str]] = {}
+        for ticker in misses:
+            prefix = self.cache.get_prefix(ticker, start, end)
+            if prefix is not None:
+                prefixes[ticker] = prefix
+                tail_groups.setdefault(self._tail_start(prefix), []).append(ticker)
+
+        fetched: dict[str, StockData] = {}
+        for tail_start, group in tail_groups.items():
+            tails = self._fetch(group, tail_start, end)
+            for ticker in group:
+                extended = self._extend(ticker, prefixes[ticker], tails.get(ticker))
+                if extended is not None:
+                    fetched[ticker] = extended
+
+        remaining = [ticker for ticker in misses if ticker not in fetched]
+        if remaining:
+            fetched.update(self._fetch(remaining, start, end))
+
+        for ticker, result in fetched.items():
+            self.cache.set(ticker, start, end, result.data)
+        results.update(fetched)
+
+        return results
+
+    def _fetch(self, tickers: list[str], start: date, end: date) -> dict[str, StockData]:
+        """Fetch from the wrapped provider, batched when it supports it."""
+        if hasattr(self.provider, "get_historical_batch"):
+            return self.provider.get_historical_batch(tickers, start, end)
+
+        fetched = {}
+        for ticker in tickers:
+            result = self.provider.get_historical(ticker, start, end)
+            if result is not None:
+                fetched[ticker] = result
+        return fetched
+
+    @staticmethod
+    def _tail_start(prefix: pd.DataFrame) -> date:
+        """Tail fetches start at the last cached bar so the two overlap by a day."""
+        return pd.Timestamp(prefix.index[-1]).date()
+
+    @staticmethod
+    def _extend(
+        ticker: str,
+        prefix: pd.DataFrame,
+        tail: StockData | None,
+    ) -> StockData | None:
+        """
+        Append a freshly fetched tail to cached data.
+
+        Returns None (so the caller re-fetches the whole range) when the tail
+        is missing or its closes on the overlapping bars differ from the cached
+        ones, e.g. because a split or dividend re-adjusted the history.
+        """
+        if tail is None or tail.data.empty:
+            return None
+
+        overlap = prefix.index.intersection(tail.data.index)
+        if overlap.empty or not np.allclose(
+            prefix.loc[overlap, "Close"].to_numpy(dtype=np.float64),
+            tail.data.loc[overlap, "Close"].to_numpy(dtype=np.float64),
+            rtol=1e-6,
+            equal_nan=True,
+        ):
+            logger.debug("Cached history for %s no longer matches, refetching", ticker)
+            return None
+
+        head = prefix[prefix.index < tail.data.index[0]]
+        return StockData(ticker=ticker, data=pd.concat([head, tail.data]))
+
     def get_current_price(self, ticker: str) -> float | None:
         """
         Get the current/latest price for a ticker.
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import queue
 import sqlite3
-from datetime import datetime
-from pathlib import Path
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from stock_finder.models.results import NeumannScore, ScanResult
+from stock_finder.utils.serialization import json_dumps, json_loads
 
 if TYPE_CHECKING:
     from stock_finder.analysis.models import TrendlineAnalysis
@@ -20,6 +25,275 @@ logger = structlog.get_logger()
 
 DEFAULT_DB_PATH = Path("data/stock_finder.db")
 
+# Stored in PRAGMA user_version; bump on any change to the _init_db script
+SCHEMA_VERSION = 2
+
+# Maximum number of queued writes committed in a single transaction
+WRITE_BATCH_SIZE = 100
+
+# Rows pulled per fetchmany() call when streaming large result sets
+FETCH_BATCH_SIZE = 1000
+
+# Smallest Neumann score batch worth dropping and rebuilding the indexes for;
+# the batch must also outnumber the rows already in the table
+BULK_LOAD_MIN_ROWS = 1000
+
+# Enum-like columns are stored as small INTEGER codes to keep records compact.
+SCAN_STATUS_CODES = {"running": 0, "completed": 1, "failed": 2}
+TIMEFRAME_CODES = {"daily": 0, "weekly": 1}
+
+_SCAN_STATUS_NAMES = {code: name for name, code in SCAN_STATUS_CODES.items()}
+_TIMEFRAME_NAMES = {code: name for name, code in TIMEFRAME_CODES.items()}
+
+
+def _decode(value, names: dict[int, str]):
+    """Translate a stored INTEGER code back to its name (legacy TEXT passes through)."""
+    try:
+        return names[int(value)]
+    except (TypeError, ValueError, KeyError):
+        return value
+
+
+# Per-connection tuning applied whenever a connection is opened. auto_vacuum
+# must precede journal_mode and only takes effect on a fresh file; existing
+# files need a VACUUM to switch.
+CONNECTION_PRAGMAS = """
+    PRAGMA auto_vacuum = INCREMENTAL;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
+# Hot-path statements are kept as constants so the identical SQL text hits the
+# connection's prepared-statement cache on every call
+INSERT_RESULT_SQL = """
+    INSERT INTO scan_results
+    (scan_run_id, ticker, gain_pct, low_price, low_date, high_price, high_date, current_price, days_to_peak)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_NEUMANN_SCORE_SQL = """
+    INSERT INTO neumann_scores (
+        scan_result_id, ticker, score, criteria_json,
+        drawdown, days_since_high, range_position,
+        pct_from_sma50, pct_from_sma200, vol_ratio,
+        market_cap_estimate, sma_crossover, gain_pct, days_to_peak
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Covers every column the research queries read (all but criteria_json), led
+# by their shared gain_pct range filter, so each analysis is an index-only scan
+NEUMANN_RESEARCH_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_neumann_research ON neumann_scores(
+        gain_pct, drawdown, days_since_high, vol_ratio, days_to_peak, score,
+        range_position, pct_from_sma50, pct_from_sma200, ticker, scan_result_id
+    )
+"""
+
+INSERT_FINDING_SQL = """
+    INSERT INTO research_findings
+    (run_id, finding_type, finding_key, metric_name, metric_value,
+     sample_size, time_window_start, time_window_end, parameters)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Secondary indexes on neumann_scores, rebuilt after bulk loads
+NEUMANN_SCORE_INDEXES = {
+    "idx_neumann_score": "CREATE INDEX IF NOT EXISTS idx_neumann_score ON neumann_scores(score DESC)",
+    "idx_neumann_ticker": "CREATE INDEX IF NOT EXISTS idx_neumann_ticker ON neumann_scores(ticker)",
+    "idx_neumann_scan_result": (
+        "CREATE INDEX IF NOT EXISTS idx_neumann_scan_result ON neumann_scores(scan_result_id)"
+    ),
+    "idx_neumann_research": NEUMANN_RESEARCH_INDEX_SQL,
+}
+
+INSERT_TRENDLINE_SQL = """
+    INSERT INTO trendline_analysis (
+        scan_result_id, ticker, timeframe,
+        trendline_formed, days_to_form, swing_low_count,
+        r_squared, slope_pct_per_day,
+        touch_count, avg_bounce_pct, max_deviation_pct,
+        break_date, break_price,
+        gain_pct, days_to_peak
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _query_variants(select: str, conditions: tuple[str, ...], order_by: str) -> dict[tuple, str]:
+    """
+    Precompute SQL for every combination of optional filters plus an optional LIMIT.
+
+    Keys are tuples of booleans, one per condition and a final one for LIMIT,
+    marking which parameters are present.
+    """
+    variants = {}
+    for flags in itertools.product((False, True), repeat=len(conditions) + 1):
+        *present, has_limit = flags
+        clauses = [cond for cond, on in zip(conditions, present, strict=True) if on]
+        query = select
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {order_by}"
+        if has_limit:
+            query += " LIMIT ?"
+        variants[flags] = query
+    return variants
+
+
+def _pick_query(variants: dict[tuple, str], values: tuple) -> tuple[str, list]:
+    """Select the precomputed query for the given optional values and bind the present ones."""
+    flags = tuple(v is not None for v in values)
+    return variants[flags], [v for v in values if v is not None]
+
+
+# Read queries with optional filters, fixed at import so each filter shape
+# always sends the same SQL text to the statement cache
+RESULTS_QUERIES = _query_variants(
+    "SELECT * FROM scan_results",
+    ("scan_run_id = ?", "gain_pct >= ?"),
+    "gain_pct DESC",
+)
+
+NEUMANN_SCORES_QUERIES = _query_variants(
+    "SELECT * FROM neumann_scores",
+    ("score >= ?",),
+    "score DESC, gain_pct DESC",
+)
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+STATEMENT_CACHE_SIZE = 256
+
+
+def _connect(db_path: Path, **kwargs) -> sqlite3.Connection:
+    """Open a connection with WAL journaling and the standard PRAGMAs applied."""
+    conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE, **kwargs)
+    conn.executescript(CONNECTION_PRAGMAS)
+    return conn
+
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory that builds plain dicts directly from the result tuple."""
+    return {col[0]: value for col, value in zip(cursor.description, row, strict=True)}
+
+
+def _decode_scan_run(row: dict) -> dict:
+    """Restore the status name on a scan_runs row."""
+    row["status"] = _decode(row.get("status"), _SCAN_STATUS_NAMES)
+    return row
+
+
+def _decode_trendline(row: dict) -> dict:
+    """Restore the timeframe name on a trendline_analysis row."""
+    row["timeframe"] = _decode(row.get("timeframe"), _TIMEFRAME_NAMES)
+    return row
+
+
+def _inserted_ids(conn: sqlite3.Connection, cursor: sqlite3.Cursor, count: int) -> list[int]:
+    """
+    Return the rowids assigned by an executemany INSERT.
+
+    The insert holds the write lock for the whole batch, so AUTOINCREMENT
+    hands out consecutive ids ending at last_insert_rowid().
+    """
+    if cursor.rowcount != count:
+        raise sqlite3.DatabaseError(f"Expected {count} inserted rows, got {cursor.rowcount}")
+    last_id = conn.execute("SELECT last_insert_rowid() AS id").fetchone()["id"]
+    return list(range(last_id - count + 1, last_id + 1))
+
+
+def _neumann_score_row(score: NeumannScore) -> tuple:
+    """Bind parameters for INSERT_NEUMANN_SCORE_SQL."""
+    return (
+        score.scan_result_id,
+        score.ticker,
+        score.score,
+        json_dumps(score.criteria_dict()),
+        score.drawdown,
+        score.days_since_high,
+        score.range_position,
+        score.pct_from_sma50,
+        score.pct_from_sma200,
+        score.vol_ratio,
+        score.market_cap_estimate,
+        None if score.sma_crossover is None else int(score.sma_crossover),
+        score.gain_pct,
+        score.days_to_peak,
+    )
+
+
+def _load_neumann_score_rows(conn: sqlite3.Connection, rows: list[tuple]) -> list[int]:
+    """Insert Neumann score rows with the table's indexes dropped, then rebuild them."""
+    for name in NEUMANN_SCORE_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    cursor = conn.executemany(INSERT_NEUMANN_SCORE_SQL, rows)
+    ids = _inserted_ids(conn, cursor, len(rows))
+    for create_sql in NEUMANN_SCORE_INDEXES.values():
+        conn.execute(create_sql)
+    # Refresh planner statistics for the rebuilt indexes
+    conn.execute("ANALYZE neumann_scores")
+    return ids
+
+
+def _run_write_batch(conn: sqlite3.Connection, batch: list[tuple[Callable, Future]]) -> None:
+    """Apply a batch of write jobs in one transaction, isolating each in a savepoint."""
+    outcomes: list[tuple[Future, Any, Exception | None]] = []
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for fn, future in batch:
+            conn.execute("SAVEPOINT write_job")
+            try:
+                outcomes.append((future, fn(conn), None))
+            except Exception as e:
+                conn.execute("ROLLBACK TO write_job")
+                outcomes.append((future, None, e))
+            conn.execute("RELEASE write_job")
+        conn.execute("COMMIT")
+    except Exception as e:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        logger.warning("Write batch failed", size=len(batch), error=str(e))
+        for _, future in batch:
+            future.set_exception(e)
+        return
+
+    for future, result, error in outcomes:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+def _writer_loop(db_path: Path, write_q: queue.Queue) -> None:
+    """Drain queued write jobs and group-commit them until a None sentinel arrives."""
+    conn = _connect(db_path, isolation_level=None)
+    conn.row_factory = _dict_factory
+    try:
+        while True:
+            job = write_q.get()
+            if job is None:
+                return
+            batch = [job]
+            stop = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    job = write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+            _run_write_batch(conn, batch)
+            if stop:
+                return
+    finally:
+        conn.close()
+
 
 class Database:
     """SQLite database for persisting scan results."""
@@ -27,36 +301,121 @@ class Database:
     def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = _connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = _dict_factory
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
         self._init_db()
 
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager for the shared database connection.
+
+        The connection is reused across calls and threads; the lock serializes
+        access and only the outermost block commits or rolls back.
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self._conn
+                if self._depth == 1:
+                    self._conn.commit()
+            except Exception:
+                if self._depth == 1:
+                    self._conn.rollback()
+                raise
+            finally:
+                self._depth -= 1
+
+    def _write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Run a write job on the shared connection and return its result.
+
+        Used by callers that wait for the result. A transaction the calling
+        thread already holds through _get_connection() is joined rather than
+        waited on, and the job runs in a savepoint so a failure leaves the
+        rest of that transaction intact.
+
+        Args:
+            fn: Callable that receives the connection and returns a value
+        """
+        with self._get_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            conn.execute("SAVEPOINT write_job")
+            try:
+                result = fn(conn)
+            except Exception:
+                conn.execute("ROLLBACK TO write_job")
+                raise
+            finally:
+                conn.execute("RELEASE write_job")
+            return result
+
+    def _submit_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Queue a write job for the background writer thread.
+
+        Jobs from all threads are committed together in batches of up to
+        WRITE_BATCH_SIZE, so callers that do not wait for each row share one
+        transaction. Waiting on the Future while holding a transaction on
+        the shared connection blocks until busy_timeout; use _write() there.
+
+        Args:
+            fn: Callable that receives the writer connection and returns a value
+
+        Returns:
+            Future resolved with the callable's return value once committed
+        """
+        future: Future = Future()
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=_writer_loop,
+                    args=(self.db_path, self._write_q),
+                    name="stock-finder-db-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._write_q.put((fn, future))
+        return future
+
+    def close(self) -> None:
+        """Flush pending writes, stop the writer thread and close the connection."""
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                self._write_q.put(None)
+                self._writer.join()
+            self._writer = None
+        with self._lock:
+            self._conn.close()
+
+    def __del__(self):
         try:
-            yield conn
-            conn.commit()
+            self.close()
         except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+            pass
 
     def _init_db(self):
-        """Initialize database schema."""
+        """Initialize database schema, skipping it when already at SCHEMA_VERSION."""
         with self._get_connection() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()["user_version"] == SCHEMA_VERSION:
+                return
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS scan_runs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    started_at TIMESTAMP NOT NULL,
+                    started_at TIMESTAMP NOT NULL DEFAULT (datetime('now', 'localtime')),
                     completed_at TIMESTAMP,
                     min_gain_pct REAL NOT NULL,
                     lookback_years INTEGER NOT NULL,
                     universe TEXT,
                     ticker_count INTEGER,
                     results_count INTEGER DEFAULT 0,
-                    status TEXT DEFAULT 'running'
+                    status INTEGER DEFAULT 0
                 );
 
                 CREATE TABLE IF NOT EXISTS scan_results (
@@ -76,7 +435,16 @@ class Database:
 
                 CREATE INDEX IF NOT EXISTS idx_results_ticker ON scan_results(ticker);
                 CREATE INDEX IF NOT EXISTS idx_results_gain ON scan_results(gain_pct DESC);
-                CREATE INDEX IF NOT EXISTS idx_results_scan_run ON scan_results(scan_run_id);
+                -- Serves scan_run_id lookups and their gain_pct ordering without a sort
+                CREATE INDEX IF NOT EXISTS idx_results_run_gain ON scan_results(scan_run_id, gain_pct DESC);
+                DROP INDEX IF EXISTS idx_results_scan_run;
+                CREATE INDEX IF NOT EXISTS idx_results_ticker_gain ON scan_results(ticker, gain_pct DESC);
+
+                -- Keep scan_runs.results_count in step with inserted results
+                CREATE TRIGGER IF NOT EXISTS trg_results_count AFTER INSERT ON scan_results
+                BEGIN
+                    UPDATE scan_runs SET results_count = results_count + 1 WHERE id = NEW.scan_run_id;
+                END;
 
                 CREATE TABLE IF NOT EXISTS neumann_scores (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -91,7 +459,7 @@ class Database:
                     pct_from_sma200 REAL,
                     vol_ratio REAL,
                     market_cap_estimate REAL,
-                    sma_crossover BOOLEAN,
+                    sma_crossover INTEGER,
                     gain_pct REAL,
                     days_to_peak INTEGER,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -106,10 +474,10 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     scan_result_id INTEGER NOT NULL,
                     ticker TEXT NOT NULL,
-                    timeframe TEXT NOT NULL,
+                    timeframe INTEGER NOT NULL,
 
                     -- Formation
-                    trendline_formed BOOLEAN NOT NULL,
+                    trendline_formed INTEGER NOT NULL,
                     days_to_form INTEGER,
                     swing_low_count INTEGER,
 
@@ -138,6 +506,9 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_trendline_r_squared ON trendline_analysis(r_squared DESC);
                 CREATE INDEX IF NOT EXISTS idx_trendline_timeframe ON trendline_analysis(timeframe);
                 CREATE INDEX IF NOT EXISTS idx_trendline_scan_result ON trendline_analysis(scan_result_id);
+                CREATE INDEX IF NOT EXISTS idx_trendline_formed_rsq
+                    ON trendline_analysis(r_squared DESC, gain_pct DESC)
+                    WHERE trendline_formed = 1;
 
                 -- Research tables for tracking themes, findings, and watchlists
 
@@ -278,9 +649,50 @@ class Database:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_criteria_thresholds_set ON criteria_thresholds(criteria_set_id);
+
+                -- Convert rows written before enum columns were stored as codes
+                UPDATE scan_runs SET status = CASE status
+                    WHEN 'running' THEN 0 WHEN 'completed' THEN 1 ELSE 2 END
+                WHERE status IN ('running', 'completed', 'failed');
+                UPDATE trendline_analysis SET timeframe = CASE timeframe
+                    WHEN 'weekly' THEN 1 ELSE 0 END
+                WHERE timeframe IN ('daily', 'weekly');
             """)
+            conn.execute(NEUMANN_RESEARCH_INDEX_SQL)
+            # Give the planner statistics for the new indexes
+            conn.execute("ANALYZE")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         logger.info("Database initialized", path=str(self.db_path))
 
+    def maintain(self, analyze: bool = True, vacuum: bool = False) -> None:
+        """
+        Run periodic maintenance on a long-lived database.
+
+        Args:
+            analyze: Refresh planner statistics with ANALYZE
+            vacuum: Rebuild the whole file with VACUUM (slow on large databases);
+                otherwise free pages are reclaimed incrementally
+
+        VACUUM runs on its own short-lived connection, because SQLite refuses
+        to vacuum through a connection with statements in progress (such as an
+        unfinished iter_results() generator). Open readers keep their snapshot;
+        a write transaction held elsewhere makes VACUUM wait for busy_timeout
+        and then raise sqlite3.OperationalError.
+        """
+        with self._get_connection() as conn:
+            if analyze:
+                conn.execute("ANALYZE")
+            if not vacuum:
+                conn.execute("PRAGMA incremental_vacuum(1000)").fetchall()
+            conn.execute("PRAGMA optimize")
+        if vacuum:
+            vacuum_conn = _connect(self.db_path, isolation_level=None)
+            try:
+                vacuum_conn.execute("VACUUM")
+            finally:
+                vacuum_conn.close()
+        logger.info("Database maintained", analyze=analyze, vacuum=vacuum)
+
     def start_scan_run(
         self,
         min_gain_pct: float,
@@ -293,9 +705,9 @@ class Database:
             cursor = conn.execute(
                 """
                 INSERT INTO scan_runs (started_at, min_gain_pct, lookback_years, universe, ticker_count)
-                VALUES (?, ?, ?, ?, ?)
+                VALUES (datetime('now', 'localtime'), ?, ?, ?, ?)
                 """,
-                (datetime.now(), min_gain_pct, lookback_years, universe, ticker_count),
+                (min_gain_pct, lookback_years, universe, ticker_count),
             )
             scan_run_id = cursor.lastrowid
             logger.info("Started scan run", scan_run_id=scan_run_id)
@@ -303,38 +715,72 @@ class Database:
 
     def add_result(self, scan_run_id: int, result: ScanResult) -> int:
         """Add a single scan result. Returns the result ID."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO scan_results
-                (scan_run_id, ticker, gain_pct, low_price, low_date, high_price, high_date, current_price, days_to_peak)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    scan_run_id,
-                    result.ticker,
-                    result.gain_pct,
-                    result.low_price,
-                    result.low_date,
-                    result.high_price,
-                    result.high_date,
-                    result.current_price,
-                    result.days_to_peak,
-                ),
-            )
-            # Update results count
-            conn.execute(
-                "UPDATE scan_runs SET results_count = results_count + 1 WHERE id = ?",
-                (scan_run_id,),
+        return self.add_results(scan_run_id, [result])[-1]
+
+    def add_results(self, scan_run_id: int, results: list[ScanResult]) -> list[int]:
+        """
+        Add multiple scan results in one transaction.
+
+        Args:
+            scan_run_id: Scan run the results belong to
+            results: Results to insert
+
+        Returns:
+            IDs of the inserted results, in input order
+        """
+        if not results:
+            return []
+        return self._write(self._insert_results(scan_run_id, results))
+
+    def queue_results(self, scan_run_id: int, results: list[ScanResult]) -> Future:
+        """
+        Queue scan results for the background writer without waiting.
+
+        Rows queued from any thread are group-committed together; call
+        ``result()`` on the returned Future (e.g. before complete_scan_run)
+        to wait for the commit and surface insert errors.
+
+        Args:
+            scan_run_id: Scan run the results belong to
+            results: Results to insert
+
+        Returns:
+            Future resolved with the inserted IDs, in input order
+        """
+        return self._submit_write(self._insert_results(scan_run_id, results))
+
+    @staticmethod
+    def _insert_results(
+        scan_run_id: int, results: list[ScanResult]
+    ) -> Callable[[sqlite3.Connection], list[int]]:
+        """Build the write job that inserts scan results."""
+        rows = [
+            (
+                scan_run_id,
+                r.ticker,
+                r.gain_pct,
+                r.low_price,
+                r.low_date,
+                r.high_price,
+                r.high_date,
+                r.current_price,
+                r.days_to_peak,
             )
-            return cursor.lastrowid
+            for r in results
+        ]
+
+        def insert(conn: sqlite3.Connection) -> list[int]:
+            cursor = conn.executemany(INSERT_RESULT_SQL, rows)
+            return _inserted_ids(conn, cursor, len(rows))
+
+        return insert
 
     def complete_scan_run(self, scan_run_id: int, status: str = "completed"):
         """Mark a scan run as completed."""
         with self._get_connection() as conn:
             conn.execute(
-                "UPDATE scan_runs SET completed_at = ?, status = ? WHERE id = ?",
-                (datetime.now(), status, scan_run_id),
+                "UPDATE scan_runs SET completed_at = datetime('now', 'localtime'), status = ? WHERE id = ?",
+                (SCAN_STATUS_CODES.get(status, status), scan_run_id),
             )
             logger.info("Completed scan run", scan_run_id=scan_run_id, status=status)
 
@@ -344,7 +790,7 @@ class Database:
             row = conn.execute(
                 "SELECT * FROM scan_runs WHERE id = ?", (scan_run_id,)
             ).fetchone()
-            return dict(row) if row else None
+            return row and _decode_scan_run(row)
 
     def get_results(
         self,
@@ -353,26 +799,35 @@ class Database:
         limit: int | None = None,
     ) -> list[dict]:
         """Get scan results with optional filters."""
-        query = "SELECT * FROM scan_results WHERE 1=1"
-        params = []
-
-        if scan_run_id is not None:
-            query += " AND scan_run_id = ?"
-            params.append(scan_run_id)
-
-        if min_gain is not None:
-            query += " AND gain_pct >= ?"
-            params.append(min_gain)
+        return list(self.iter_results(scan_run_id=scan_run_id, min_gain=min_gain, limit=limit))
 
-        query += " ORDER BY gain_pct DESC"
+    def iter_results(
+        self,
+        scan_run_id: int | None = None,
+        min_gain: float | None = None,
+        limit: int | None = None,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Stream scan results with optional filters.
 
-        if limit is not None:
-            query += " LIMIT ?"
-            params.append(limit)
+        Rows are fetched in batches of batch_size, so large scans never hold
+        the whole result set in memory. The connection lock is only held
+        while a batch is being fetched.
+        """
+        query, params = _pick_query(RESULTS_QUERIES, (scan_run_id, min_gain, limit))
 
-        with self._get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
 
     def get_latest_scan_run(self) -> dict | None:
         """Get the most recent scan run."""
@@ -380,7 +835,7 @@ class Database:
             row = conn.execute(
                 "SELECT * FROM scan_runs ORDER BY started_at DESC LIMIT 1"
             ).fetchone()
-            return dict(row) if row else None
+            return row and _decode_scan_run(row)
 
     def get_all_scan_runs(self) -> list[dict]:
         """Get all scan runs."""
@@ -388,23 +843,28 @@ class Database:
             rows = conn.execute(
                 "SELECT * FROM scan_runs ORDER BY started_at DESC"
             ).fetchall()
-            return [dict(row) for row in rows]
+            return [_decode_scan_run(row) for row in rows]
 
     def get_top_gainers(self, limit: int = 50) -> list[dict]:
         """Get top gainers across all scans."""
         with self._get_connection() as conn:
-            rows = conn.execute(
+            # Best row per ticker, so the prices/dates belong to the max gain
+            return conn.execute(
                 """
-                SELECT DISTINCT ticker, MAX(gain_pct) as gain_pct,
-                       low_price, low_date, high_price, high_date, current_price, days_to_peak
-                FROM scan_results
-                GROUP BY ticker
+                SELECT ticker, gain_pct, low_price, low_date, high_price, high_date,
+                       current_price, days_to_peak
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY ticker ORDER BY gain_pct DESC
+                    ) AS rn
+                    FROM scan_results
+                )
+                WHERE rn = 1
                 ORDER BY gain_pct DESC
                 LIMIT ?
                 """,
                 (limit,),
             ).fetchall()
-            return [dict(row) for row in rows]
 
     # =========================================================================
     # Neumann Scores Methods
@@ -420,35 +880,58 @@ class Database:
         Returns:
             The ID of the inserted record
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO neumann_scores (
-                    scan_result_id, ticker, score, criteria_json,
-                    drawdown, days_since_high, range_position,
-                    pct_from_sma50, pct_from_sma200, vol_ratio,
-                    market_cap_estimate, sma_crossover, gain_pct, days_to_peak
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    score.scan_result_id,
-                    score.ticker,
-                    score.score,
-                    json.dumps(score.criteria_results),
-                    score.drawdown,
-                    score.days_since_high,
-                    score.range_position,
-                    score.pct_from_sma50,
-                    score.pct_from_sma200,
-                    score.vol_ratio,
-                    score.market_cap_estimate,
-                    score.sma_crossover,
-                    score.gain_pct,
-                    score.days_to_peak,
-                ),
-            )
-            return cursor.lastrowid
+        return self.add_neumann_scores([score])[-1]
+
+    def add_neumann_scores(self, scores: list[NeumannScore]) -> list[int]:
+        """
+        Add multiple Neumann scores in one transaction.
+
+        Batches of at least BULK_LOAD_MIN_ROWS that outnumber the existing
+        rows (e.g. the first load into an empty table) are loaded as in
+        bulk_load_neumann_scores; smaller batches keep the indexes in place,
+        since rebuilding them costs time proportional to the whole table.
+
+        Args:
+            scores: NeumannScore objects to save
+
+        Returns:
+            IDs of the inserted records, in input order
+        """
+        if not scores:
+            return []
+
+        rows = [_neumann_score_row(score) for score in scores]
+
+        def insert(conn: sqlite3.Connection) -> list[int]:
+            if len(rows) >= BULK_LOAD_MIN_ROWS:
+                existing = conn.execute("SELECT count(*) AS n FROM neumann_scores").fetchone()["n"]
+                if len(rows) > existing:
+                    return _load_neumann_score_rows(conn, rows)
+            cursor = conn.executemany(INSERT_NEUMANN_SCORE_SQL, rows)
+            return _inserted_ids(conn, cursor, len(rows))
+
+        return self._write(insert)
+
+    def bulk_load_neumann_scores(self, scores: list[NeumannScore]) -> list[int]:
+        """
+        Load a large batch of Neumann scores with index maintenance deferred.
+
+        The neumann_scores indexes are dropped, the rows inserted, and the
+        indexes rebuilt and re-analyzed once at the end, all in one
+        transaction, regardless of the table's size. add_neumann_scores picks
+        this path by itself when the batch is large relative to the table.
+
+        Args:
+            scores: NeumannScore objects to save
+
+        Returns:
+            IDs of the inserted records, in input order
+        """
+        if not scores:
+            return []
+
+        rows = [_neumann_score_row(score) for score in scores]
+        return self._write(lambda conn: _load_neumann_score_rows(conn, rows))
 
     def get_neumann_scores(
         self,
@@ -465,60 +948,44 @@ class Database:
         Returns:
             List of score records as dictionaries
         """
-        query = "SELECT * FROM neumann_scores WHERE 1=1"
-        params = []
-
-        if min_score is not None:
-            query += " AND score >= ?"
-            params.append(min_score)
-
-        query += " ORDER BY score DESC, gain_pct DESC"
-
-        if limit is not None:
-            query += " LIMIT ?"
-            params.append(limit)
+        query, params = _pick_query(NEUMANN_SCORES_QUERIES, (min_score, limit))
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            results = []
             for row in rows:
-                d = dict(row)
-                # Parse JSON back to dict
-                if d.get("criteria_json"):
-                    d["criteria_results"] = json.loads(d["criteria_json"])
-                results.append(d)
-            return results
+                # Parse JSON back to dict, dropping the raw text
+                criteria_json = row.pop("criteria_json", None)
+                if criteria_json:
+                    row["criteria_results"] = json_loads(criteria_json)
+            return rows
 
     def get_neumann_score_stats(self) -> dict:
         """Get aggregate statistics for Neumann scores."""
         with self._get_connection() as conn:
-            # Score distribution
+            # Score distribution, with table-wide totals computed by window
+            # functions over the grouped rows in the same scan
             dist = conn.execute(
                 """
                 SELECT score, COUNT(*) as count, AVG(gain_pct) as avg_gain,
-                       AVG(days_to_peak) as avg_days
+                       AVG(days_to_peak) as avg_days,
+                       SUM(COUNT(*)) OVER () as total,
+                       SUM(SUM(score)) OVER () * 1.0 / SUM(COUNT(*)) OVER () as avg_score,
+                       COALESCE(SUM(SUM(gain_pct)) OVER () / SUM(COUNT(gain_pct)) OVER (), 0.0)
+                           as total_avg_gain
                 FROM neumann_scores
                 GROUP BY score
                 ORDER BY score DESC
                 """
             ).fetchall()
 
-            # Total counts
-            totals = conn.execute(
-                """
-                SELECT COUNT(*) as total,
-                       AVG(score) as avg_score,
-                       AVG(gain_pct) as avg_gain
-                FROM neumann_scores
-                """
-            ).fetchone()
-
-            return {
-                "distribution": [dict(row) for row in dist],
-                "total": totals["total"] if totals else 0,
-                "avg_score": totals["avg_score"] if totals else 0,
-                "avg_gain": totals["avg_gain"] if totals else 0,
+        totals = {"total": 0, "avg_score": 0.0, "avg_gain": 0.0}
+        for row in dist:
+            totals = {
+                "total": row.pop("total"),
+                "avg_score": row.pop("avg_score"),
+                "avg_gain": row.pop("total_avg_gain"),
             }
+        return {"distribution": dist, **totals}
 
     def clear_neumann_scores(self) -> int:
         """Clear all Neumann scores. Returns number of rows deleted."""
@@ -540,38 +1007,29 @@ class Database:
         Returns:
             The ID of the inserted record
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO trendline_analysis (
-                    scan_result_id, ticker, timeframe,
-                    trendline_formed, days_to_form, swing_low_count,
-                    r_squared, slope_pct_per_day,
-                    touch_count, avg_bounce_pct, max_deviation_pct,
-                    break_date, break_price,
-                    gain_pct, days_to_peak
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    analysis.scan_result_id,
-                    analysis.ticker,
-                    analysis.timeframe,
-                    analysis.trendline_formed,
-                    analysis.days_to_form,
-                    analysis.swing_low_count,
-                    analysis.r_squared,
-                    analysis.slope_pct_per_day,
-                    analysis.touch_count,
-                    analysis.avg_bounce_pct,
-                    analysis.max_deviation_pct,
-                    analysis.break_date,
-                    analysis.break_price,
-                    analysis.gain_pct,
-                    analysis.days_to_peak,
-                ),
-            )
-            return cursor.lastrowid
+        params = (
+            analysis.scan_result_id,
+            analysis.ticker,
+            TIMEFRAME_CODES.get(analysis.timeframe, analysis.timeframe),
+            int(analysis.trendline_formed),
+            analysis.days_to_form,
+            analysis.swing_low_count,
+            analysis.r_squared,
+            analysis.slope_pct_per_day,
+            analysis.touch_count,
+            analysis.avg_bounce_pct,
+            analysis.max_deviation_pct,
+            analysis.break_date,
+            analysis.break_price,
+            analysis.gain_pct,
+            analysis.days_to_peak,
+        )
+
+        def insert(conn: sqlite3.Connection) -> int:
+            cursor = conn.execute(INSERT_TRENDLINE_SQL, params)
+            return _inserted_ids(conn, cursor, 1)[0]
+
+        return self._write(insert)
 
     def get_trendline_analyses(
         self,
@@ -593,7 +1051,7 @@ class Database:
             List of analysis records as dictionaries
         """
         query = "SELECT * FROM trendline_analysis WHERE 1=1"
-        params = []
+        params: list[Any] = []
 
         if min_r_squared is not None:
             query += " AND r_squared >= ?"
@@ -601,7 +1059,7 @@ class Database:
 
         if timeframe is not None:
             query += " AND timeframe = ?"
-            params.append(timeframe)
+            params.append(TIMEFRAME_CODES.get(timeframe, timeframe))
 
         if formed_only:
             query += " AND trendline_formed = 1"
@@ -614,7 +1072,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return [_decode_trendline(row) for row in rows]
 
     def get_trendline_stats(self, timeframe: str | None = None) -> dict:
         """Get aggregate statistics for trendline analyses."""
@@ -622,7 +1080,7 @@ class Database:
         params = []
         if timeframe:
             where_clause = " WHERE timeframe = ?"
-            params = [timeframe]
+            params = [TIMEFRAME_CODES.get(timeframe, timeframe)]
 
         with self._get_connection() as conn:
             # Formation stats
@@ -630,9 +1088,12 @@ class Database:
                 f"""
                 SELECT
                     COUNT(*) as total,
-                    SUM(CASE WHEN trendline_formed = 1 THEN 1 ELSE 0 END) as formed,
-                    AVG(CASE WHEN trendline_formed = 1 THEN days_to_form END) as avg_days_to_form,
-                    AVG(CASE WHEN trendline_formed = 1 THEN swing_low_count END) as avg_swing_lows
+                    COALESCE(SUM(CASE WHEN trendline_formed = 1 THEN 1 ELSE 0 END), 0) as formed,
+                    CASE WHEN COUNT(*) = 0 THEN 0.0
+                         ELSE SUM(CASE WHEN trendline_formed = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*)
+                    END as formed_pct,
+                    COALESCE(AVG(CASE WHEN trendline_formed = 1 THEN days_to_form END), 0.0) as avg_days_to_form,
+                    COALESCE(AVG(CASE WHEN trendline_formed = 1 THEN swing_low_count END), 0.0) as avg_swing_lows
                 FROM trendline_analysis{where_clause}
                 """,
                 params,
@@ -666,8 +1127,8 @@ class Database:
             touch_stats = conn.execute(
                 f"""
                 SELECT
-                    AVG(touch_count) as avg_touches,
-                    AVG(avg_bounce_pct) as avg_bounce_pct
+                    COALESCE(AVG(touch_count), 0.0) as avg_touches,
+                    COALESCE(AVG(avg_bounce_pct), 0.0) as avg_bounce_pct
                 FROM trendline_analysis
                 WHERE trendline_formed = 1{' AND timeframe = ?' if timeframe else ''}
                 """,
@@ -675,16 +1136,9 @@ class Database:
             ).fetchone()
 
             return {
-                "total": formation["total"] if formation else 0,
-                "formed": formation["formed"] if formation else 0,
-                "formed_pct": (formation["formed"] / formation["total"] * 100)
-                if formation and formation["total"] > 0
-                else 0,
-                "avg_days_to_form": formation["avg_days_to_form"] if formation else 0,
-                "avg_swing_lows": formation["avg_swing_lows"] if formation else 0,
-                "quality_distribution": [dict(row) for row in quality_dist],
-                "avg_touches": touch_stats["avg_touches"] if touch_stats else 0,
-                "avg_bounce_pct": touch_stats["avg_bounce_pct"] if touch_stats else 0,
+                **formation,
+                "quality_distribution": quality_dist,
+                **touch_stats,
             }
 
     def clear_trendline_analyses(self, timeframe: str | None = None) -> int:
@@ -693,7 +1147,7 @@ class Database:
             if timeframe:
                 cursor = conn.execute(
                     "DELETE FROM trendline_analysis WHERE timeframe = ?",
-                    (timeframe,),
+                    (TIMEFRAME_CODES.get(timeframe, timeframe),),
                 )
             else:
                 cursor = conn.execute("DELETE FROM trendline_analysis")
@@ -781,7 +1235,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def get_theme_for_ticker(self, ticker: str) -> list[dict]:
         """Get all themes associated with a ticker."""
@@ -790,7 +1244,7 @@ class Database:
                 "SELECT * FROM themes WHERE ticker = ? ORDER BY theme, wave",
                 (ticker.upper(),),
             ).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def get_theme_summary(self) -> list[dict]:
         """Get summary of themes with stock counts."""
@@ -804,7 +1258,7 @@ class Database:
                 ORDER BY theme, wave
                 """
             ).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def delete_theme(self, ticker: str, theme: str, wave: int = 1) -> int:
         """Delete a specific theme mapping."""
@@ -873,12 +1327,9 @@ class Database:
             row = conn.execute(
                 "SELECT * FROM research_runs WHERE id = ?", (run_id,)
             ).fetchone()
-            if row:
-                d = dict(row)
-                if d.get("parameters"):
-                    d["parameters"] = json.loads(d["parameters"])
-                return d
-            return None
+            if row and row.get("parameters"):
+                row["parameters"] = json.loads(row["parameters"])
+            return row
 
     def get_research_runs(
         self,
@@ -901,13 +1352,10 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            results = []
             for row in rows:
-                d = dict(row)
-                if d.get("parameters"):
-                    d["parameters"] = json.loads(d["parameters"])
-                results.append(d)
-            return results
+                if row.get("parameters"):
+                    row["parameters"] = json.loads(row["parameters"])
+            return rows
 
     # =========================================================================
     # Research Findings Methods
@@ -974,31 +1422,39 @@ class Database:
         Returns:
             Number of rows inserted
         """
-        with self._get_connection() as conn:
-            prepared = []
-            for f in findings:
-                prepared.append({
-                    "run_id": f["run_id"],
-                    "finding_type": f["finding_type"],
-                    "finding_key": f["finding_key"],
-                    "metric_name": f["metric_name"],
-                    "metric_value": f.get("metric_value"),
-                    "sample_size": f.get("sample_size"),
-                    "time_window_start": f.get("time_window_start"),
-                    "time_window_end": f.get("time_window_end"),
-                    "parameters": json.dumps(f["parameters"]) if f.get("parameters") else None,
-                })
-            cursor = conn.executemany(
-                """
-                INSERT INTO research_findings
-                (run_id, finding_type, finding_key, metric_name, metric_value,
-                 sample_size, time_window_start, time_window_end, parameters)
-                VALUES (:run_id, :finding_type, :finding_key, :metric_name, :metric_value,
-                        :sample_size, :time_window_start, :time_window_end, :parameters)
-                """,
-                prepared,
+        return self.add_findings_bulk_iter(
+            (
+                f["run_id"],
+                f["finding_type"],
+                f["finding_key"],
+                f["metric_name"],
+                f.get("metric_value"),
+                f.get("sample_size"),
+                f.get("time_window_start"),
+                f.get("time_window_end"),
+                json.dumps(f["parameters"]) if f.get("parameters") else None,
             )
-            return cursor.rowcount
+            for f in findings
+        )
+
+    def add_findings_bulk_iter(self, rows: Iterable[tuple]) -> int:
+        """
+        Add findings from an iterable of row tuples without building dicts.
+
+        The rows are consumed by one executemany inside a single
+        BEGIN IMMEDIATE transaction.
+
+        Args:
+            rows: Tuples in INSERT_FINDING_SQL column order
+
+        Returns:
+            Number of rows inserted
+        """
+
+        def insert(conn: sqlite3.Connection) -> int:
+            return conn.executemany(INSERT_FINDING_SQL, rows).rowcount
+
+        return max(self._write(insert), 0)
 
     def get_findings(
         self,
@@ -1026,13 +1482,10 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            results = []
             for row in rows:
-                d = dict(row)
-                if d.get("parameters"):
-                    d["parameters"] = json.loads(d["parameters"])
-                results.append(d)
-            return results
+                if row.get("parameters"):
+                    row["parameters"] = json.loads(row["parameters"])
+            return rows
 
     def compare_findings(
         self,
@@ -1075,7 +1528,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def clear_findings(self, run_id: str | None = None) -> int:
         """Clear findings, optionally for a specific run."""
@@ -1167,7 +1620,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def update_watchlist_status(
         self,
@@ -1239,9 +1692,9 @@ class Database:
             ).fetchall()
 
             return {
-                "status_distribution": [dict(row) for row in status_dist],
-                "theme_distribution": [dict(row) for row in theme_dist],
-                "score_distribution": [dict(row) for row in score_dist],
+                "status_distribution": status_dist,
+                "theme_distribution": theme_dist,
+                "score_distribution": score_dist,
             }
 
     def clear_watchlist(self, status: str | None = None) -> int:
@@ -1317,12 +1770,9 @@ class Database:
             row = conn.execute(
                 "SELECT * FROM analysis_runs WHERE id = ?", (run_id,)
             ).fetchone()
-            if row:
-                d = dict(row)
-                if d.get("parameters"):
-                    d["parameters"] = json.loads(d["parameters"])
-                return d
-            return None
+            if row and row.get("parameters"):
+                row["parameters"] = json.loads(row["parameters"])
+            return row
 
     def get_analysis_runs(
         self,
@@ -1338,13 +1788,10 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            results = []
             for row in rows:
-                d = dict(row)
-                if d.get("parameters"):
-                    d["parameters"] = json.loads(d["parameters"])
-                results.append(d)
-            return results
+                if row.get("parameters"):
+                    row["parameters"] = json.loads(row["parameters"])
+            return rows
 
     def update_analysis_run_counts(
         self,
@@ -1476,7 +1923,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def get_analysis_comparison(
         self,
@@ -1523,7 +1970,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def get_analysis_lift(self, run_id: str) -> list[dict]:
         """
@@ -1557,7 +2004,7 @@ class Database:
         """
         with self._get_connection() as conn:
             rows = conn.execute(query, (run_id, run_id)).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def delete_analysis_run(self, run_id: str) -> int:
         """Delete an analysis run and all its results."""
@@ -1633,14 +2080,14 @@ class Database:
             if not row:
                 return None
 
-            result = dict(row)
+            result = row
 
             # Get thresholds
             thresholds = conn.execute(
                 "SELECT * FROM criteria_thresholds WHERE criteria_set_id = ?",
                 (criteria_set_id,),
             ).fetchall()
-            result["thresholds"] = [dict(t) for t in thresholds]
+            result["thresholds"] = thresholds
 
             return result
 
@@ -1664,7 +2111,7 @@ class Database:
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def get_active_criteria_set(self) -> dict | None:
         """Get the currently active criteria set."""
@@ -1761,7 +2208,7 @@ class Database:
                 """,
                 (criteria_set_id,),
             ).fetchall()
-            return [dict(row) for row in rows]
+            return rows
 
     def delete_criteria_set(self, criteria_set_id: str) -> int:
         """Delete a criteria set and its thresholds."""
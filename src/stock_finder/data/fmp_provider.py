@@ -4,18 +4,35 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from stock_finder.config import FMPConfig
 from stock_finder.data.base import DataProvider
 from stock_finder.models.results import StockData
+from stock_finder.utils.parallel import ParallelExecutor
+from stock_finder.utils.serialization import json_loads
 
 logger = structlog.get_logger()
 
+# Keep-alive connections held by the HTTP session
+POOL_SIZE = 32
 
-@dataclass
+# FMP historical field -> standard OHLCV column name
+OHLCV_FIELDS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Quote:
     """Quote data from FMP."""
 
@@ -49,6 +66,25 @@ class FMPProvider(DataProvider):
         if not self.config.api_key:
             raise ValueError("FMP API key not found. Set FMP_API_KEY environment variable.")
 
+        # Persistent session so requests reuse pooled keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def suggested_concurrency(self) -> int:
+        """One worker per pooled connection; 429s are retried with backoff."""
+        return POOL_SIZE
+
     def _request(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Make a request to FMP API."""
         url = f"{self.config.base_url}/{endpoint}"
@@ -56,9 +92,9 @@ class FMPProvider(DataProvider):
         params["apikey"] = self.config.api_key
 
         try:
-            response = requests.get(url, params=params, timeout=self.config.timeout)
+            response = self._session.get(url, params=params, timeout=self.config.timeout)
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error("FMP API request failed", endpoint=endpoint, error=str(e))
             raise
@@ -92,25 +128,45 @@ class FMPProvider(DataProvider):
         Returns:
             Dictionary mapping ticker to Quote
         """
-        results: dict[str, Quote] = {}
-
-        # Process in batches
-        for i in range(0, len(tickers), self.config.batch_size):
-            batch = tickers[i : i + self.config.batch_size]
-            symbols = ",".join(batch)
-
-            try:
-                data = self._request(f"quote/{symbols}")
-                for item in data:
-                    quote = self._parse_quote(item)
-                    if quote:
-                        results[quote.symbol] = quote
-            except Exception as e:
-                logger.error("Batch quote failed", batch_start=i, error=str(e))
+        results: dict[str, Quote] = {
+            quote.symbol: quote
+            for item in self._request_raw_quotes(tickers)
+            if (quote := self._parse_quote(item))
+        }
 
         logger.info("Fetched batch quotes", requested=len(tickers), received=len(results))
         return results
 
+    def _request_raw_quotes(self, tickers: list[str]) -> list[dict]:
+        """
+        Fetch raw quote JSON for many tickers, batch_size symbols per request.
+
+        Batches are fetched concurrently; failed batches are logged and skipped.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            Raw quote dicts from all successful batches
+        """
+        batch_size = self.config.batch_size
+        batches = [tickers[i : i + batch_size] for i in range(0, len(tickers), batch_size)]
+
+        # Fetch batches concurrently; each request is I/O-bound
+        executor = ParallelExecutor(max_workers=self.config.max_workers)
+        task_results = executor.execute(
+            lambda batch: self._request(f"quote/{','.join(batch)}"),
+            batches,
+        )
+
+        items: list[dict] = []
+        for i, task_result in enumerate(task_results):
+            if not task_result.success:
+                logger.error("Batch quote failed", batch_start=i * batch_size, error=task_result.error)
+                continue
+            items.extend(task_result.result or [])
+        return items
+
     def _parse_quote(self, data: dict) -> Quote | None:
         """Parse raw quote data into Quote object."""
         try:
@@ -165,28 +221,18 @@ class FMPProvider(DataProvider):
             if not historical:
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(historical)
-
-            # Parse dates and set as index
-            df["date"] = pd.to_datetime(df["date"])
-            df = df.set_index("date")
-            df = df.sort_index()
-
-            # Rename columns to standard format
-            df = df.rename(
-                columns={
-                    "open": "Open",
-                    "high": "High",
-                    "low": "Low",
-                    "close": "Close",
-                    "volume": "Volume",
-                }
-            )
+            # Build OHLCV columns directly instead of framing every FMP field
+            columns = {
+                name: np.array([h.get(key) for h in historical], dtype=float)
+                for key, name in OHLCV_FIELDS.items()
+            }
+            volume = columns["Volume"]
+            if not np.isnan(volume).any():
+                columns["Volume"] = volume.astype(np.int64)
 
-            # Keep only OHLCV columns
-            columns_to_keep = ["Open", "High", "Low", "Close", "Volume"]
-            df = df[[c for c in columns_to_keep if c in df.columns]]
+            index = pd.DatetimeIndex(pd.to_datetime([h["date"] for h in historical]), name="date")
+            # FMP returns newest first
+            df = pd.DataFrame(columns, index=index).sort_index()
 
             logger.debug(
                 "Fetched historical data",
@@ -280,5 +326,9 @@ class FMPProvider(DataProvider):
         Returns:
             Dictionary mapping ticker to market cap
         """
-        quotes = self.get_quotes_batch(tickers)
-        return {symbol: q.market_cap for symbol, q in quotes.items() if q.market_cap}
+        # Only two fields are needed, so skip building full Quote objects
+        return {
+            item["symbol"]: item["marketCap"]
+            for item in self._request_raw_quotes(tickers)
+            if item.get("marketCap") and item.get("symbol")
+        }
@@ -1,9 +1,12 @@
 """Fetch ticker lists from NASDAQ FTP."""
 
-import re
+import functools
+import shutil
+import time
 import urllib.request
-from io import StringIO
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -11,6 +14,58 @@ logger = structlog.get_logger()
 
 NASDAQ_FTP_URL = "ftp://ftp.nasdaqtrader.com/symboldirectory/nasdaqtraded.txt"
 
+# Local copy of the symbol file; NASDAQ regenerates it once a day
+NASDAQ_CACHE_PATH = Path("data/cache/nasdaqtraded.txt")
+NASDAQ_CACHE_TTL_HOURS = 24
+
+# Explicit dtypes for the columns we use, so the C parser skips inference;
+# the Y/N flag columns become categoricals and compare on their int8 codes
+NASDAQ_DTYPES = {
+    "Symbol": "string",
+    "Security Name": "string",
+    "Listing Exchange": "category",
+    "ETF": "category",
+    "Test Issue": "category",
+    "Nasdaq Traded": "category",
+}
+
+
+def _standard_symbol_mask(symbols: pd.Series) -> np.ndarray:
+    """Mask of plain 1-5 letter uppercase ASCII symbols, without the regex engine."""
+    values = symbols.to_numpy()
+    return np.fromiter(
+        (
+            isinstance(s, str) and 1 <= len(s) <= 5 and s.isascii() and s.isalpha() and s.isupper()
+            for s in values
+        ),
+        dtype=bool,
+        count=len(values),
+    )
+
+
+def _nasdaq_file() -> Path:
+    """Return the local symbol file, downloading it when missing or stale."""
+    if NASDAQ_CACHE_PATH.exists():
+        age_hours = (time.time() - NASDAQ_CACHE_PATH.stat().st_mtime) / 3600
+        if age_hours < NASDAQ_CACHE_TTL_HOURS:
+            logger.debug("Using cached NASDAQ symbol file", path=str(NASDAQ_CACHE_PATH))
+            return NASDAQ_CACHE_PATH
+
+    logger.info("Fetching tickers from NASDAQ FTP", url=NASDAQ_FTP_URL)
+
+    # Stream the response to disk, then swap it in so readers never see a partial file
+    NASDAQ_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    partial = NASDAQ_CACHE_PATH.with_suffix(".partial")
+    try:
+        with urllib.request.urlopen(NASDAQ_FTP_URL, timeout=30) as response, partial.open("wb") as f:
+            shutil.copyfileobj(response, f)
+    except Exception as e:
+        logger.error("Failed to fetch NASDAQ FTP", error=str(e))
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(NASDAQ_CACHE_PATH)
+    return NASDAQ_CACHE_PATH
+
 
 def fetch_nasdaq_tickers(
     include_etfs: bool = False,
@@ -32,41 +87,34 @@ def fetch_nasdaq_tickers(
     Returns:
         DataFrame with columns: symbol, name, exchange, etf
     """
-    logger.info("Fetching tickers from NASDAQ FTP", url=NASDAQ_FTP_URL)
-
-    try:
-        with urllib.request.urlopen(NASDAQ_FTP_URL, timeout=30) as response:
-            content = response.read().decode("utf-8")
-    except Exception as e:
-        logger.error("Failed to fetch NASDAQ FTP", error=str(e))
-        raise
-
     # Parse the pipe-delimited file
-    df = pd.read_csv(StringIO(content), sep="|")
+    df = pd.read_csv(
+        _nasdaq_file(), sep="|", encoding="utf-8", dtype=NASDAQ_DTYPES, engine="c"
+    )
 
     # Clean column names
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-
-    # Filter out the footer row (contains "File Creation Time")
-    df = df[~df["symbol"].astype(str).str.contains("File Creation", na=False)]
-
-    # Only include actively traded
-    df = df[df["nasdaq_traded"] == "Y"]
-
-    # Filter out test issues
-    df = df[df["test_issue"] == "N"]
+    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+
+    # Build every row filter into one mask so the frame is sliced only once
+    mask = (
+        # Footer row (contains "File Creation Time")
+        ~df["symbol"].astype(str).str.contains("File Creation", regex=False, na=False).to_numpy()
+        # Only actively traded, non-test issues
+        & (df["nasdaq_traded"] == "Y").to_numpy()
+        & (df["test_issue"] == "N").to_numpy()
+        # Standard ticker symbols only (no warrants, units, etc.)
+        & _standard_symbol_mask(df["symbol"])
+    )
 
     # Filter out ETFs unless requested
     if not include_etfs:
-        df = df[df["etf"] == "N"]
+        mask &= (df["etf"] == "N").to_numpy()
 
     # Filter by exchange if specified
     if exchanges:
-        df = df[df["listing_exchange"].isin(exchanges)]
+        mask &= df["listing_exchange"].isin(exchanges).to_numpy()
 
-    # Clean up symbols - remove ones with special characters (warrants, units, etc.)
-    # Keep only standard ticker symbols (letters, up to 5 chars typically)
-    df = df[df["symbol"].str.match(r"^[A-Z]{1,5}$", na=False)]
+    df = df.loc[mask, ["symbol", "security_name", "listing_exchange", "etf"]]
 
     # Select and rename columns
     result = pd.DataFrame({
@@ -93,8 +141,15 @@ def get_common_stock_tickers(
     Returns:
         List of ticker symbols
     """
-    df = fetch_nasdaq_tickers(include_etfs=False, exchanges=exchanges)
-    return df["symbol"].tolist()
+    key = frozenset(exchanges) if exchanges else None
+    return list(_cached_common_stock_tickers(key))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_common_stock_tickers(exchanges: frozenset[str] | None) -> tuple[str, ...]:
+    """Memoized common-stock symbols per exchange set for the life of the process."""
+    df = fetch_nasdaq_tickers(include_etfs=False, exchanges=list(exchanges) if exchanges else None)
+    return tuple(df["symbol"].tolist())
 
 
 def get_nasdaq_tickers() -> list[str]:
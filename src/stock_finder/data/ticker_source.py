@@ -26,21 +26,34 @@ def load_tickers_from_csv(file_path: Path | str) -> list[str]:
         logger.error("Ticker file not found", path=str(file_path))
         return []
 
-    df = pd.read_csv(file_path)
+    # Read only the header to find the ticker column
+    columns = pd.read_csv(file_path, nrows=0).columns
 
     # Try to find the ticker column
     ticker_col = None
     for col in ["ticker", "Ticker", "symbol", "Symbol", "TICKER", "SYMBOL"]:
-        if col in df.columns:
+        if col in columns:
             ticker_col = col
             break
 
     if ticker_col is None:
         # Use first column
-        ticker_col = df.columns[0]
+        ticker_col = columns[0]
         logger.info("Using first column as ticker column", column=ticker_col)
 
-    tickers = df[ticker_col].dropna().astype(str).str.upper().str.strip().tolist()
+    # Then load just that column with the multithreaded pyarrow reader, kept as an
+    # Arrow string array so no per-row Python str objects are allocated
+    df = pd.read_csv(
+        file_path,
+        engine="pyarrow",
+        usecols=[ticker_col],
+        dtype={ticker_col: "string[pyarrow]"},
+        dtype_backend="pyarrow",
+    )
+
+    # strip/upper run as Arrow compute kernels; blanks and nulls are dropped
+    symbols = df[ticker_col].dropna().str.strip().str.upper()
+    tickers = symbols[symbols != ""].tolist()
 
     logger.info("Loaded tickers from file", path=str(file_path), count=len(tickers))
 
@@ -1,5 +1,6 @@
 """Yahoo Finance data provider implementation."""
 
+import threading
 import time
 from datetime import date
 
@@ -10,9 +11,15 @@ import yfinance as yf
 from stock_finder.config import DataConfig
 from stock_finder.data.base import DataProvider
 from stock_finder.models.results import StockData
+from stock_finder.utils.parallel import ParallelExecutor
 
 logger = structlog.get_logger()
 
+# Tickers requested per yf.download call in get_historical_batch
+DOWNLOAD_CHUNK_SIZE = 100
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
 
 class YFinanceProvider(DataProvider):
     """Data provider using Yahoo Finance (yfinance library)."""
@@ -26,14 +33,21 @@ class YFinanceProvider(DataProvider):
         """
         self.config = config or DataConfig()
         self._last_request_time: float = 0
+        self._rate_lock = threading.Lock()
+
+    @property
+    def suggested_concurrency(self) -> int:
+        """Yahoo throttles aggressive clients; _rate_limit spaces requests on top of this."""
+        return 8
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self.config.rate_limit_delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.config.rate_limit_delay:
-                time.sleep(self.config.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        """Apply rate limiting between requests, spacing out concurrent callers too."""
+        with self._rate_lock:
+            if self.config.rate_limit_delay > 0:
+                elapsed = time.time() - self._last_request_time
+                if elapsed < self.config.rate_limit_delay:
+                    time.sleep(self.config.rate_limit_delay - elapsed)
+            self._last_request_time = time.time()
 
     def get_historical(
         self,
@@ -60,26 +74,15 @@ class YFinanceProvider(DataProvider):
                 start=start.isoformat(),
                 end=end.isoformat(),
                 auto_adjust=True,  # Adjust for splits/dividends
+                actions=False,  # Skip the Dividends/Stock Splits columns
             )
 
             if df.empty:
                 logger.warning("No data returned", ticker=ticker)
                 return None
 
-            # Standardize column names
-            df = df.rename(
-                columns={
-                    "Open": "Open",
-                    "High": "High",
-                    "Low": "Low",
-                    "Close": "Close",
-                    "Volume": "Volume",
-                }
-            )
-
             # Keep only OHLCV columns
-            columns_to_keep = ["Open", "High", "Low", "Close", "Volume"]
-            df = df[[c for c in columns_to_keep if c in df.columns]]
+            df = df[[c for c in OHLCV_COLUMNS if c in df.columns]]
 
             logger.debug(
                 "Fetched historical data",
@@ -95,6 +98,85 @@ class YFinanceProvider(DataProvider):
             logger.error("Failed to fetch data", ticker=ticker, error=str(e))
             return None
 
+    def get_historical_batch(
+        self,
+        tickers: list[str],
+        start: date,
+        end: date,
+    ) -> dict[str, StockData]:
+        """
+        Fetch historical OHLCV data for many tickers with batched downloads.
+
+        Tickers are requested DOWNLOAD_CHUNK_SIZE at a time through
+        yf.download, which fans out within each chunk on its own threads.
+        Chunks are downloaded concurrently (config.max_workers); rate
+        limiting spaces out chunk starts rather than individual tickers.
+
+        Args:
+            tickers: Stock ticker symbols
+            start: Start date
+            end: End date
+
+        Returns:
+            Dictionary mapping ticker to StockData; tickers without data are omitted
+        """
+        chunks = [
+            tickers[i : i + DOWNLOAD_CHUNK_SIZE] for i in range(0, len(tickers), DOWNLOAD_CHUNK_SIZE)
+        ]
+
+        executor = ParallelExecutor(max_workers=self.config.max_workers)
+        task_results = executor.execute(
+            lambda chunk: self._download_chunk(chunk, start, end),
+            chunks,
+        )
+
+        results: dict[str, StockData] = {}
+        for task_result in task_results:
+            if not task_result.success:
+                logger.error(
+                    "Failed to download batch", tickers=len(task_result.item), error=task_result.error
+                )
+                continue
+            if task_result.result is not None:
+                results.update(task_result.result)
+
+        logger.info("Fetched batch historical data", requested=len(tickers), received=len(results))
+        return results
+
+    def _download_chunk(self, chunk: list[str], start: date, end: date) -> dict[str, StockData]:
+        """Download one chunk of tickers and split it into per-ticker StockData."""
+        self._rate_limit()
+
+        df = yf.download(
+            tickers=" ".join(chunk),
+            start=start.isoformat(),
+            end=end.isoformat(),
+            group_by="ticker",
+            threads=True,
+            auto_adjust=True,
+            progress=False,
+        )
+        if df is None or df.empty:
+            return {}
+
+        results: dict[str, StockData] = {}
+        for ticker in chunk:
+            sub_df = self._split_download(df, ticker)
+            if sub_df is not None:
+                results[ticker] = StockData(ticker=ticker, data=sub_df)
+        return results
+
+    @staticmethod
+    def _split_download(df: pd.DataFrame, ticker: str) -> pd.DataFrame | None:
+        """Extract one ticker's OHLCV rows from a yf.download result."""
+        if isinstance(df.columns, pd.MultiIndex):
+            if ticker not in df.columns.get_level_values(0):
+                return None
+            df = df.xs(ticker, axis=1, level=0)
+
+        df = df[[c for c in OHLCV_COLUMNS if c in df.columns]].dropna(how="all")
+        return None if df.empty else df
+
     def get_current_price(self, ticker: str) -> float | None:
         """
         Get the current/latest price for a ticker.
@@ -108,18 +190,9 @@ class YFinanceProvider(DataProvider):
         self._rate_limit()
 
         try:
-            yf_ticker = yf.Ticker(ticker)
-            info = yf_ticker.info
-
-            # Try different price fields
-            price = info.get("regularMarketPrice") or info.get("currentPrice")
-
-            if price is None:
-                # Fallback to last close from history
-                hist = yf_ticker.history(period="1d")
-                if not hist.empty:
-                    price = hist["Close"].iloc[-1]
-
+            # fast_info reads the lightweight chart endpoint instead of the full
+            # quoteSummary payload behind .info
+            price = yf.Ticker(ticker).fast_info.get("last_price")
             return float(price) if price else None
 
         except Exception as e:
@@ -1,13 +1,16 @@
 """Data models for scan results."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
 import pandas as pd
 
+# (name, passed, value, threshold, details) for one evaluated criterion
+CriterionTuple = tuple[str, bool, float | None, float | None, str]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class StockData:
     """Historical price data for a stock."""
 
@@ -17,12 +20,15 @@ class StockData:
     @property
     def start_date(self) -> date:
         """First date in the data."""
-        return self.data.index.min().date()
+        index = self.data.index
+        # Provider data is sorted, so the ends are O(1); pandas caches the check
+        return (index[0] if index.is_monotonic_increasing else index.min()).date()
 
     @property
     def end_date(self) -> date:
         """Last date in the data."""
-        return self.data.index.max().date()
+        index = self.data.index
+        return (index[-1] if index.is_monotonic_increasing else index.max()).date()
 
     @property
     def trading_days(self) -> int:
@@ -30,7 +36,7 @@ class StockData:
         return len(self.data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScanResult:
     """Result of scanning a single stock for gain criteria."""
 
@@ -71,7 +77,7 @@ class ScanResult:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NeumannScore:
     """
     Result of scoring a stock against Neumann's criteria at its ignition point.
@@ -82,7 +88,7 @@ class NeumannScore:
         score: Total score (weighted or unweighted based on scoring_mode)
         max_score: Maximum possible score for the scoring mode used
         scoring_mode: Scoring mode used (full, core, or weighted)
-        criteria_results: Dict mapping criterion name to pass/fail and value
+        criteria_results: One (name, passed, value, threshold, details) tuple per criterion
         drawdown: Drawdown from 2-year high at ignition
         days_since_high: Trading days from 2-year high to ignition
         range_position: Position in 2-year range (0=low, 1=high)
@@ -96,7 +102,7 @@ class NeumannScore:
     ticker: str
     scan_result_id: int
     score: int
-    criteria_results: dict[str, dict[str, Any]] = field(default_factory=dict)
+    criteria_results: tuple[CriterionTuple, ...] = ()
     max_score: int = 8  # Default for backward compatibility
     scoring_mode: str = "full"  # Default for backward compatibility
     drawdown: float | None = None
@@ -111,6 +117,19 @@ class NeumannScore:
     gain_pct: float | None = None
     days_to_peak: int | None = None
 
+    def criteria_dict(self) -> dict[str, dict[str, Any]]:
+        """Criteria results keyed by name, in the shape stored in the database."""
+        return {
+            name: {
+                "name": name,
+                "passed": passed,
+                "value": value,
+                "threshold": threshold,
+                "details": details,
+            }
+            for name, passed, value, threshold, details in self.criteria_results
+        }
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
@@ -119,7 +138,7 @@ class NeumannScore:
             "score": self.score,
             "max_score": self.max_score,
             "scoring_mode": self.scoring_mode,
-            "criteria_results": self.criteria_results,
+            "criteria_results": self.criteria_dict(),
             "drawdown": self.drawdown,
             "days_since_high": self.days_since_high,
             "range_position": self.range_position,
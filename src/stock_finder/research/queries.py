@@ -2,19 +2,180 @@
 
 from __future__ import annotations
 
+import functools
+import math
+import os
+import queue
 import sqlite3
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
 
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
 DEFAULT_DB_PATH = Path("data/stock_finder.db")
 
+# Read-side tuning for the analytical scans: a large page cache and mmap keep
+# neumann_scores hot across consecutive analyses on the shared connection
+READ_PRAGMAS = """
+    PRAGMA cache_size = -64000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+"""
+
+# Read-only connections map the whole file so scans read pages straight from
+# the OS page cache; SQLite clamps this to its compile-time maximum
+READ_ONLY_MMAP_SIZE = 1 << 34
+
+# Read-only connections opened by connection_pool() for concurrent analyses
+READ_POOL_SIZE = 4
+
+SCORES_TABLE = "neumann_scores"
+
+# Per-connection TEMP copy of the rows and columns the analyses read, built by
+# connection_pool(max_gain=...) so each query scans a narrow pre-filtered table.
+# neumann_scores is filtered once into a shared in-memory staging database that
+# each pooled connection copies from and then detaches: queries never touch
+# shared-cache tables, whose single btree mutex would serialize the pool
+FILTERED_TABLE = "ns_filt"
+FILTERED_SCHEMA = "filt"
+
+MATERIALIZE_FILTERED_SQL = f"""
+    CREATE TABLE {FILTERED_SCHEMA}.{FILTERED_TABLE} AS
+    SELECT ticker, score, gain_pct, days_to_peak, drawdown, days_since_high,
+           vol_ratio, range_position, pct_from_sma50, pct_from_sma200, scan_result_id
+    FROM {SCORES_TABLE}
+    WHERE gain_pct < ?
+"""
+
+COPY_FILTERED_SQL = (
+    f"CREATE TEMP TABLE {FILTERED_TABLE} AS SELECT * FROM {FILTERED_SCHEMA}.{FILTERED_TABLE}"
+)
+
+# (finding_key, SQL condition) for each criterion scored by criteria_lift
+LIFT_CRITERIA = (
+    ("drawdown_50", "drawdown <= -0.50"),
+    ("drawdown_85", "drawdown <= -0.85"),
+    ("extended_decline_90d", "days_since_high >= 90"),
+    ("extended_decline_180d", "days_since_high >= 180"),
+    ("extended_decline_365d", "days_since_high >= 365"),
+    ("near_lows", "range_position <= 0.10"),
+    ("below_sma50", "pct_from_sma50 < 0"),
+    ("below_sma200", "pct_from_sma200 < 0"),
+    ("vol_exhaustion_1x", "vol_ratio < 1.0"),
+    ("vol_exhaustion_075x", "vol_ratio < 0.75"),
+    ("vol_exhaustion_05x", "vol_ratio < 0.5"),
+)
+
+# One pass over the table: four conditional aggregates per criterion. NULL
+# columns make both CASE branches NULL, so they drop out of the pass and fail
+# sides alike. Built once per source table so every call reuses the same SQL
+# text and hits the connection's prepared-statement cache.
+_LIFT_COLUMNS = ",".join(
+    f"""
+        AVG(CASE WHEN {condition} THEN gain_pct END) as avg_pass_{key},
+        AVG(CASE WHEN NOT ({condition}) THEN gain_pct END) as avg_fail_{key},
+        SUM(CASE WHEN {condition} THEN 1 ELSE 0 END) as count_pass_{key},
+        SUM(CASE WHEN NOT ({condition}) THEN 1 ELSE 0 END) as count_fail_{key}"""
+    for key, condition in LIFT_CRITERIA
+)
+CRITERIA_LIFT_SQL = {
+    table: f"SELECT {_LIFT_COLUMNS}\nFROM {table}\nWHERE gain_pct < ?"
+    for table in (SCORES_TABLE, FILTERED_TABLE)
+}
+
+# Upper edges of the volume_profile buckets (vol_ratio < edge)
+VOLUME_BUCKET_EDGES = [0.5, 0.75, 1.0, 1.5]
+VOLUME_BUCKET_NAMES = ["very_low", "low", "below_avg", "normal", "high"]
+
+
+def _bucket_means(
+    buckets: np.ndarray, gain: np.ndarray, days: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count rows and average gain/days per non-negative integer bucket.
+
+    NaN days are left out of the days average, like SQL AVG skips NULLs.
+
+    Returns:
+        Tuple of (count, avg_gain, avg_days) arrays indexed by bucket
+    """
+    n = int(buckets.max()) + 1 if buckets.size else 0
+    count = np.bincount(buckets, minlength=n)
+    has_days = ~np.isnan(days)
+    days_count = np.bincount(buckets[has_days], minlength=n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_gain = np.bincount(buckets, weights=gain, minlength=n) / count
+        avg_days = np.bincount(buckets[has_days], weights=days[has_days], minlength=n) / days_count
+    return count, avg_gain, avg_days
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """
+    Round like SQLite's ROUND, mapping NaN/None to None.
+
+    SQLite rounds the shortest decimal form of the double half away from
+    zero (2.675 -> 2.68), so the value goes through repr() rather than its
+    exact binary expansion. Aggregates are rounded here, once per emitted
+    metric, rather than by ROUND() in the SQL.
+    """
+    if value is None or math.isnan(value):
+        return None
+    return float(
+        Decimal(repr(float(value))).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP)
+    )
+
+
+def _memoized(
+    method: Callable[..., Iterator[QueryResult]],
+) -> Callable[..., Iterator[QueryResult]]:
+    """
+    Cache a query method's results per (method, max_gain) on the instance.
+
+    Only calls on the shared connection are cached; an explicit conn may hold
+    an older snapshot or TEMP tables, so those calls always run the query.
+    The cache is dropped whenever the database files change (see
+    ResearchQueries._db_stamp), so repeated analyses of an unchanged
+    database are served from memory. Cached QueryResults are shared between
+    callers and must not be mutated.
+    """
+
+    @functools.wraps(method)
+    def wrapper(
+        self: ResearchQueries,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
+        if conn is not None:
+            return method(self, max_gain, conn, table)
+
+        stamp = self._db_stamp()
+        if stamp != self._cache_stamp:
+            self._cache.clear()
+            self._cache_stamp = stamp
+
+        key = (method.__name__, max_gain, table)
+        results = self._cache.get(key)
+        if results is None:
+            results = self._cache[key] = tuple(method(self, max_gain, conn, table))
+        return iter(results)
+
+    return wrapper
+
 
 @dataclass
 class QueryResult:
     """Result from a research query."""
     finding_type: str
     finding_key: str
-    metrics: dict[str, float | int | None]
+    metrics: dict[str, float | int | str | None]
     sample_size: int
 
 
@@ -22,22 +183,204 @@ class ResearchQueries:
     """
     Collection of reusable research queries.
 
-    Each method returns QueryResult objects that can be stored in the database.
+    Each method yields QueryResult objects that can be stored in the database.
     """
 
-    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH, read_only: bool = False):
+        """
+        Initialize research queries.
+
+        Args:
+            db_path: Path to the SQLite database
+            read_only: Open the shared connection read-only (mode=ro, query_only)
+                with the whole file memory-mapped
+        """
         self.db_path = Path(db_path)
+        self.read_only = read_only
+        self._conn: sqlite3.Connection | None = None
+        self._cache: dict[tuple, tuple[QueryResult, ...]] = {}
+        self._cache_stamp: tuple | None = None
+
+    def _db_stamp(self) -> tuple:
+        """
+        Fingerprint the database and its WAL file by mtime and size.
+
+        Committed writes land in the -wal file until a checkpoint, so both
+        files are checked.
+        """
+        stamp: list[tuple[int, int] | None] = []
+        for path in (self.db_path, self.db_path.with_name(f"{self.db_path.name}-wal")):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                stamp.append(None)
+            else:
+                stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized query results."""
+        self._cache.clear()
+        self._cache_stamp = None
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return the cached read connection, opening it on first use.
+
+        Queries called without an explicit ``conn`` share this handle, so the
+        schema is parsed and the page cache warmed once rather than per query.
+        """
+        if self._conn is None:
+            if self.read_only:
+                conn = self._connect_read_only()
+                conn.execute("PRAGMA query_only = 1")
+            else:
+                conn = sqlite3.connect(self.db_path)
+                conn.row_factory = sqlite3.Row
+                conn.executescript(READ_PRAGMAS)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the cached connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def explain(
+        self,
+        query: str,
+        params: tuple = (),
+        conn: sqlite3.Connection | None = None,
+    ) -> list[str]:
+        """
+        Return (and debug-log) SQLite's EXPLAIN QUERY PLAN for a query.
+
+        Useful when changing a query or index to check that joins are driven
+        from neumann_scores' covering index and probe scan_results/themes by key.
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        Args:
+            query: SQL to explain
+            params: Parameters for the query
+            conn: Connection to use (defaults to the cached connection)
+
+        Returns:
+            Plan step descriptions in execution order
+        """
+        conn = conn or self.connection()
+        plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+        logger.debug("Query plan", plan=plan)
+        return plan
+
+    def _connect_read_only(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a mode=ro, memory-mapped connection to the database."""
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=check_same_thread,
+        )
         conn.row_factory = sqlite3.Row
+        conn.executescript(READ_PRAGMAS)
+        conn.execute(f"PRAGMA mmap_size = {READ_ONLY_MMAP_SIZE}")
+        return conn
+
+    def _materialize_filtered(self, max_gain: float) -> tuple[sqlite3.Connection, str]:
+        """
+        Stage FILTERED_TABLE in a new shared in-memory database.
+
+        The in-memory database lives only while a connection holds it open,
+        so the returned connection must stay open until every pooled
+        connection has copied the table.
+
+        Returns:
+            The connection that built the table, and the URI readers ATTACH
+        """
+        uri = f"file:{FILTERED_TABLE}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        conn = self._connect_read_only(check_same_thread=False)
+        conn.execute(f"ATTACH DATABASE ? AS {FILTERED_SCHEMA}", (uri,))
+        conn.execute(MATERIALIZE_FILTERED_SQL, (max_gain,))
+        conn.commit()
+        return conn, uri
+
+    def _open_read_only(self, filtered_uri: str | None = None) -> sqlite3.Connection:
+        """
+        Open a read-only connection that may be handed between threads.
+
+        When filtered_uri is given, the table staged by _materialize_filtered()
+        is copied into the connection's TEMP schema and indexed, then the
+        staging database is detached, before the connection is locked to
+        query_only.
+        """
+        conn = self._connect_read_only(check_same_thread=False)
+        if filtered_uri is not None:
+            conn.execute(f"ATTACH DATABASE ? AS {FILTERED_SCHEMA}", (filtered_uri,))
+            conn.execute(COPY_FILTERED_SQL)
+            conn.execute(
+                f"CREATE INDEX temp.{FILTERED_TABLE}_scan_result "
+                f"ON {FILTERED_TABLE}(scan_result_id)"
+            )
+            conn.commit()
+            conn.execute(f"DETACH DATABASE {FILTERED_SCHEMA}")
+        conn.execute("PRAGMA query_only = 1")
+        # Hold one read transaction for the connection's lifetime so every
+        # query shares a snapshot instead of taking a read lock per statement
+        conn.execute("BEGIN DEFERRED")
         return conn
 
+    @contextmanager
+    def connection_pool(
+        self,
+        size: int = READ_POOL_SIZE,
+        max_gain: float | None = None,
+    ) -> Iterator[queue.Queue[sqlite3.Connection]]:
+        """
+        Open a pool of read-only connections for running queries concurrently.
+
+        Callers take a connection with ``pool.get()`` and must ``put`` it back
+        when done. Each connection reads inside one long-lived transaction;
+        the database is in WAL mode, so those readers do not block each other
+        or a writer. All connections are closed on exit, which also drops
+        their TEMP tables.
+
+        Args:
+            size: Number of connections in the pool
+            max_gain: If given, filter neumann_scores once and give every
+                connection its own TEMP copy as FILTERED_TABLE, so queries can
+                pass ``table=FILTERED_TABLE``
+
+        Yields:
+            Queue holding the open connections
+        """
+        if max_gain is None:
+            conns = [self._open_read_only() for _ in range(size)]
+        else:
+            builder, filtered_uri = self._materialize_filtered(max_gain)
+            try:
+                conns = [self._open_read_only(filtered_uri) for _ in range(size)]
+            finally:
+                # Closing the last connection to the staging database frees it
+                builder.close()
+        pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for conn in conns:
+            pool.put(conn)
+        try:
+            yield pool
+        finally:
+            for conn in conns:
+                conn.rollback()
+                conn.close()
+
     # =========================================================================
     # Criteria Lift Analysis
     # =========================================================================
 
-    def criteria_lift(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def criteria_lift(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
         Calculate lift for each scoring criteria.
 
@@ -45,62 +388,47 @@ class ResearchQueries:
 
         Args:
             max_gain: Exclude outliers above this gain %
+            conn: Connection to query (defaults to the cached connection)
+            table: Table to read scores from (SCORES_TABLE or FILTERED_TABLE)
 
-        Returns:
-            List of QueryResult for each criteria
-        """
-        criteria = [
-            ("drawdown_50", "drawdown <= -0.50"),
-            ("drawdown_85", "drawdown <= -0.85"),
-            ("extended_decline_90d", "days_since_high >= 90"),
-            ("extended_decline_180d", "days_since_high >= 180"),
-            ("extended_decline_365d", "days_since_high >= 365"),
-            ("near_lows", "range_position <= 0.10"),
-            ("below_sma50", "pct_from_sma50 < 0"),
-            ("below_sma200", "pct_from_sma200 < 0"),
-            ("vol_exhaustion_1x", "vol_ratio < 1.0"),
-            ("vol_exhaustion_075x", "vol_ratio < 0.75"),
-            ("vol_exhaustion_05x", "vol_ratio < 0.5"),
-        ]
-
-        results = []
-        conn = self._connect()
-
-        for key, condition in criteria:
-            row = conn.execute(f"""
-                SELECT
-                    AVG(CASE WHEN {condition} THEN gain_pct END) as avg_when_pass,
-                    AVG(CASE WHEN NOT ({condition}) THEN gain_pct END) as avg_when_fail,
-                    SUM(CASE WHEN {condition} THEN 1 ELSE 0 END) as count_pass,
-                    SUM(CASE WHEN NOT ({condition}) THEN 1 ELSE 0 END) as count_fail,
-                    COUNT(*) as total
-                FROM neumann_scores
-                WHERE gain_pct < ? AND {condition.split()[0]} IS NOT NULL
-            """, (max_gain,)).fetchone()
-
-            if row and row["avg_when_pass"] and row["avg_when_fail"]:
-                lift = row["avg_when_pass"] / row["avg_when_fail"]
-                results.append(QueryResult(
-                    finding_type="criteria_lift",
-                    finding_key=key,
-                    metrics={
-                        "avg_when_pass": round(row["avg_when_pass"], 1),
-                        "avg_when_fail": round(row["avg_when_fail"], 1),
-                        "lift": round(lift, 2),
-                        "count_pass": row["count_pass"],
-                        "count_fail": row["count_fail"],
-                    },
-                    sample_size=row["total"],
-                ))
-
-        conn.close()
-        return results
+        Yields:
+            QueryResult for each criteria
+        """
+        conn = conn or self.connection()
+        row = conn.execute(CRITERIA_LIFT_SQL[table], (max_gain,)).fetchone()
+
+        for key, _ in LIFT_CRITERIA:
+            avg_when_pass = row[f"avg_pass_{key}"]
+            avg_when_fail = row[f"avg_fail_{key}"]
+            if not (avg_when_pass and avg_when_fail):
+                continue
+
+            count_pass = row[f"count_pass_{key}"]
+            count_fail = row[f"count_fail_{key}"]
+            yield QueryResult(
+                finding_type="criteria_lift",
+                finding_key=key,
+                metrics={
+                    "avg_when_pass": round(avg_when_pass, 1),
+                    "avg_when_fail": round(avg_when_fail, 1),
+                    "lift": round(avg_when_pass / avg_when_fail, 2),
+                    "count_pass": count_pass,
+                    "count_fail": count_fail,
+                },
+                sample_size=count_pass + count_fail,
+            )
 
     # =========================================================================
     # Setup Quality Analysis
     # =========================================================================
 
-    def setup_quality_tiers(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def setup_quality_tiers(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
         Analyze performance by setup quality tier.
 
@@ -111,10 +439,10 @@ class ResearchQueries:
         - Moderate: deep drawdown only
         - Weak: no deep drawdown
 
-        Returns:
-            List of QueryResult for each tier
+        Yields:
+            QueryResult for each tier
         """
-        query = """
+        query = f"""
             SELECT
                 CASE
                     WHEN drawdown <= -0.85 AND days_since_high >= 365 AND vol_ratio < 0.75
@@ -128,233 +456,354 @@ class ResearchQueries:
                     ELSE 'weak'
                 END as tier,
                 COUNT(*) as count,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(days_to_peak), 0) as avg_days,
-                ROUND(MIN(gain_pct), 0) as min_gain,
-                ROUND(MAX(gain_pct), 0) as max_gain
-            FROM neumann_scores
+                AVG(gain_pct) as avg_gain,
+                AVG(days_to_peak) as avg_days,
+                MIN(gain_pct) as min_gain,
+                MAX(gain_pct) as max_gain
+            FROM {table}
             WHERE gain_pct < ? AND drawdown IS NOT NULL
             GROUP BY tier
             ORDER BY avg_gain DESC
         """
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
+        conn = conn or self.connection()
+        rows = conn.execute(query, (max_gain,))
 
-        results = []
         for row in rows:
-            results.append(QueryResult(
+            yield QueryResult(
                 finding_type="setup_quality",
                 finding_key=row["tier"],
                 metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
-                    "min_gain": row["min_gain"],
-                    "max_gain": row["max_gain"],
+                    "avg_gain": _round(row["avg_gain"], 0),
+                    "avg_days": _round(row["avg_days"], 0),
+                    "min_gain": _round(row["min_gain"], 0),
+                    "max_gain": _round(row["max_gain"], 0),
                 },
                 sample_size=row["count"],
-            ))
-
-        return results
+            )
 
     # =========================================================================
     # Theme Performance Analysis
     # =========================================================================
 
-    def theme_performance(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def theme_analyses(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
-        Analyze performance by theme.
+        Analyze performance by theme and compare themed vs unthemed stocks.
 
-        Returns:
-            List of QueryResult for each theme/wave
+        Both groupings share one scores-to-themes join, computed once in a
+        materialized CTE and grouped twice. A theme's top performer is its
+        highest-gain ticker, picked with ROW_NUMBER().
+
+        Yields:
+            QueryResult for each theme/wave, followed by themed/unthemed
         """
-        query = """
+        query = f"""
+            WITH j AS MATERIALIZED (
+                SELECT ns.ticker, ns.gain_pct, ns.days_to_peak, t.theme, t.wave
+                FROM {table} ns
+                LEFT JOIN themes t ON ns.ticker = t.ticker
+                WHERE ns.gain_pct < ?
+            )
             SELECT
-                t.theme,
-                t.wave,
+                'theme' as grouping,
+                theme as key,
+                wave,
                 COUNT(*) as count,
-                ROUND(AVG(ns.gain_pct), 0) as avg_gain,
-                ROUND(AVG(ns.days_to_peak), 0) as avg_days,
-                MAX(ns.ticker || ': ' || CAST(ROUND(ns.gain_pct, 0) AS TEXT) || '%') as top_performer
-            FROM themes t
-            JOIN neumann_scores ns ON t.ticker = ns.ticker
-            WHERE ns.gain_pct < ?
-            GROUP BY t.theme, t.wave
-            ORDER BY avg_gain DESC
-        """
-
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
-
-        results = []
-        for row in rows:
-            key = f"{row['theme'].lower()}_wave{row['wave']}"
-            results.append(QueryResult(
-                finding_type="theme_performance",
-                finding_key=key,
-                metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
-                    "top_performer": row["top_performer"],
-                },
-                sample_size=row["count"],
-            ))
-
-        return results
-
-    def themed_vs_unthemed(self, max_gain: float = 50000) -> list[QueryResult]:
-        """Compare themed stocks vs unthemed."""
-        query = """
+                AVG(gain_pct) as avg_gain,
+                AVG(days_to_peak) as avg_days,
+                MAX(CASE WHEN rn = 1 THEN ticker END) as top_ticker,
+                MAX(gain_pct) as top_gain
+            FROM (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (PARTITION BY theme, wave ORDER BY gain_pct DESC) as rn
+                FROM j
+                WHERE theme IS NOT NULL
+            )
+            GROUP BY theme, wave
+            UNION ALL
             SELECT
-                CASE WHEN t.ticker IS NOT NULL THEN 'themed' ELSE 'unthemed' END as category,
-                COUNT(*) as count,
-                ROUND(AVG(ns.gain_pct), 0) as avg_gain,
-                ROUND(AVG(ns.days_to_peak), 0) as avg_days
-            FROM neumann_scores ns
-            LEFT JOIN themes t ON ns.ticker = t.ticker
-            WHERE ns.gain_pct < ?
-            GROUP BY category
+                'category',
+                CASE WHEN theme IS NOT NULL THEN 'themed' ELSE 'unthemed' END,
+                NULL,
+                COUNT(*),
+                AVG(gain_pct),
+                AVG(days_to_peak),
+                NULL,
+                NULL
+            FROM j
+            GROUP BY 2
+            ORDER BY grouping DESC, avg_gain DESC
         """
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
+        conn = conn or self.connection()
+        rows = conn.execute(query, (max_gain,))
 
-        results = []
         for row in rows:
-            results.append(QueryResult(
-                finding_type="theme_comparison",
-                finding_key=row["category"],
-                metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
-                },
-                sample_size=row["count"],
-            ))
+            if row["grouping"] == "theme":
+                yield QueryResult(
+                    finding_type="theme_performance",
+                    finding_key=f"{row['key'].lower()}_wave{row['wave']}",
+                    metrics={
+                        "avg_gain": _round(row["avg_gain"], 0),
+                        "avg_days": _round(row["avg_days"], 0),
+                        "top_performer": f"{row['top_ticker']}: {_round(row['top_gain'], 0)}%",
+                    },
+                    sample_size=row["count"],
+                )
+            else:
+                yield QueryResult(
+                    finding_type="theme_comparison",
+                    finding_key=row["key"],
+                    metrics={
+                        "avg_gain": _round(row["avg_gain"], 0),
+                        "avg_days": _round(row["avg_days"], 0),
+                    },
+                    sample_size=row["count"],
+                )
+
+    def theme_performance(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
+        """
+        Analyze performance by theme.
 
-        return results
+        Yields:
+            QueryResult for each theme/wave
+        """
+        return (
+            r for r in self.theme_analyses(max_gain, conn, table)
+            if r.finding_type == "theme_performance"
+        )
+
+    def themed_vs_unthemed(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
+        """Compare themed stocks vs unthemed."""
+        return (
+            r for r in self.theme_analyses(max_gain, conn, table)
+            if r.finding_type == "theme_comparison"
+        )
 
     # =========================================================================
     # Timing Analysis
     # =========================================================================
 
-    def timing_by_month(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def timing_analyses(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
-        Analyze ignition timing by month.
+        Analyze ignition timing by month of year and by year.
 
-        Returns performance metrics for each month of the year.
+        Both groupings share one scores-to-scan-results join, computed once
+        in a materialized CTE and grouped twice.
+
+        Yields:
+            QueryResult for each month, followed by each year
         """
-        query = """
+        query = f"""
+            WITH j AS MATERIALIZED (
+                SELECT ns.gain_pct, ns.days_to_peak, sr.low_date
+                FROM {table} ns
+                JOIN scan_results sr ON ns.scan_result_id = sr.id
+                WHERE ns.gain_pct < ? AND sr.low_date IS NOT NULL
+            )
             SELECT
-                CAST(strftime('%m', sr.low_date) AS INTEGER) as month,
+                'month' as grouping,
+                CAST(strftime('%m', low_date) AS INTEGER) as key,
                 COUNT(*) as count,
-                ROUND(AVG(ns.gain_pct), 0) as avg_gain,
-                ROUND(AVG(ns.days_to_peak), 0) as avg_days
-            FROM neumann_scores ns
-            JOIN scan_results sr ON ns.scan_result_id = sr.id
-            WHERE ns.gain_pct < ? AND sr.low_date IS NOT NULL
-            GROUP BY month
-            ORDER BY month
+                AVG(gain_pct) as avg_gain,
+                AVG(days_to_peak) as avg_days
+            FROM j
+            GROUP BY 2
+            UNION ALL
+            SELECT
+                'year',
+                strftime('%Y', low_date),
+                COUNT(*),
+                AVG(gain_pct),
+                AVG(days_to_peak)
+            FROM j
+            GROUP BY 2
+            ORDER BY grouping, key
         """
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
+        conn = conn or self.connection()
+        rows = conn.execute(query, (max_gain,))
 
         month_names = [
             "", "jan", "feb", "mar", "apr", "may", "jun",
             "jul", "aug", "sep", "oct", "nov", "dec"
         ]
 
-        results = []
         for row in rows:
-            month_num = row["month"]
-            if 1 <= month_num <= 12:
-                results.append(QueryResult(
-                    finding_type="timing_month",
-                    finding_key=month_names[month_num],
-                    metrics={
-                        "avg_gain": row["avg_gain"],
-                        "avg_days": row["avg_days"],
-                    },
-                    sample_size=row["count"],
-                ))
-
-        return results
-
-    def timing_by_year(self, max_gain: float = 50000) -> list[QueryResult]:
-        """Analyze ignition timing by year."""
-        query = """
-            SELECT
-                strftime('%Y', sr.low_date) as year,
-                COUNT(*) as count,
-                ROUND(AVG(ns.gain_pct), 0) as avg_gain,
-                ROUND(AVG(ns.days_to_peak), 0) as avg_days
-            FROM neumann_scores ns
-            JOIN scan_results sr ON ns.scan_result_id = sr.id
-            WHERE ns.gain_pct < ? AND sr.low_date IS NOT NULL
-            GROUP BY year
-            ORDER BY year
+            if row["grouping"] == "month":
+                month_num = row["key"]
+                if month_num is None or not 1 <= month_num <= 12:
+                    continue
+                finding_type, finding_key = "timing_month", month_names[month_num]
+            else:
+                if not row["key"]:
+                    continue
+                finding_type, finding_key = "timing_year", row["key"]
+
+            yield QueryResult(
+                finding_type=finding_type,
+                finding_key=finding_key,
+                metrics={
+                    "avg_gain": _round(row["avg_gain"], 0),
+                    "avg_days": _round(row["avg_days"], 0),
+                },
+                sample_size=row["count"],
+            )
+
+    def timing_by_month(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
+        Analyze ignition timing by month.
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
-
-        results = []
-        for row in rows:
-            if row["year"]:
-                results.append(QueryResult(
-                    finding_type="timing_year",
-                    finding_key=row["year"],
-                    metrics={
-                        "avg_gain": row["avg_gain"],
-                        "avg_days": row["avg_days"],
-                    },
-                    sample_size=row["count"],
-                ))
-
-        return results
+        Returns performance metrics for each month of the year.
+        """
+        return (
+            r for r in self.timing_analyses(max_gain, conn, table)
+            if r.finding_type == "timing_month"
+        )
+
+    def timing_by_year(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
+        """Analyze ignition timing by year."""
+        return (
+            r for r in self.timing_analyses(max_gain, conn, table)
+            if r.finding_type == "timing_year"
+        )
 
     # =========================================================================
-    # Score Distribution Analysis
+    # Score Distribution and Volume Dynamics
     # =========================================================================
 
-    def score_distribution(self, max_gain: float = 50000) -> list[QueryResult]:
-        """Analyze performance by current Neumann score."""
-        query = """
-            SELECT
-                score,
-                COUNT(*) as count,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(days_to_peak), 0) as avg_days
-            FROM neumann_scores
-            WHERE gain_pct < ?
-            GROUP BY score
-            ORDER BY score DESC
+    @_memoized
+    def score_profiles(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
+        Analyze performance by score, simulated weighted score and volume ratio.
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
+        The three bucketings are computed from one fetch of the raw columns
+        with NumPy, instead of three GROUP BY scans over derived expressions
+        SQLite cannot index.
 
-        results = []
-        for row in rows:
-            results.append(QueryResult(
+        Yields:
+            QueryResult for each score, then each simulated score, then each
+            volume bucket
+        """
+        query = f"""
+            SELECT gain_pct, days_to_peak, drawdown, days_since_high, vol_ratio, score
+            FROM {table}
+            WHERE gain_pct < ?
+        """
+
+        conn = conn or self.connection()
+        data = np.array(
+            [tuple(row) for row in conn.execute(query, (max_gain,))], dtype=np.float64
+        ).reshape(-1, 6)
+        gain, days, drawdown, days_since_high, vol_ratio, score = data.T
+
+        # Current Neumann score, highest first
+        scores = score.astype(np.intp)
+        count, avg_gain, avg_days = _bucket_means(scores, gain, days)
+        for bucket in np.flatnonzero(count)[::-1]:
+            yield QueryResult(
                 finding_type="score_distribution",
-                finding_key=f"score_{row['score']}",
+                finding_key=f"score_{bucket}",
                 metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
+                    "avg_gain": _round(avg_gain[bucket], 0),
+                    "avg_days": _round(avg_days[bucket], 0),
                 },
-                sample_size=row["count"],
-            ))
-
-        return results
-
-    def simulated_score_distribution(self, max_gain: float = 50000) -> list[QueryResult]:
+                sample_size=int(count[bucket]),
+            )
+
+        # Weighted score (see simulated_score_distribution); NaN comparisons
+        # are False, matching the SQL CASE falling through to 0
+        known = ~(np.isnan(drawdown) | np.isnan(vol_ratio))
+        sim_score = (
+            np.where(drawdown <= -0.85, 3, np.where(drawdown <= -0.50, 2, 0))
+            + np.where(days_since_high >= 365, 2, np.where(days_since_high >= 180, 1, 0))
+            + np.where(vol_ratio < 0.75, 2, 0)
+        )[known]
+        count, avg_gain, avg_days = _bucket_means(sim_score, gain[known], days[known])
+        for bucket in np.flatnonzero(count)[::-1]:
+            yield QueryResult(
+                finding_type="simulated_score",
+                finding_key=f"score_{bucket}",
+                metrics={
+                    "avg_gain": _round(avg_gain[bucket], 0),
+                    "avg_days": _round(avg_days[bucket], 0),
+                },
+                sample_size=int(count[bucket]),
+            )
+
+        # Volume ratio buckets, lowest first
+        known = ~np.isnan(vol_ratio)
+        vol_bucket = np.digitize(vol_ratio[known], VOLUME_BUCKET_EDGES)
+        count, avg_gain, avg_days = _bucket_means(vol_bucket, gain[known], days[known])
+        for bucket in np.flatnonzero(count):
+            velocity = avg_gain[bucket] / avg_days[bucket] if avg_days[bucket] else None
+            yield QueryResult(
+                finding_type="volume_profile",
+                finding_key=VOLUME_BUCKET_NAMES[bucket],
+                metrics={
+                    "avg_gain": _round(avg_gain[bucket], 0),
+                    "avg_days": _round(avg_days[bucket], 0),
+                    "velocity": _round(velocity, 2),
+                },
+                sample_size=int(count[bucket]),
+            )
+
+    def score_distribution(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
+        """Analyze performance by current Neumann score."""
+        return (
+            r for r in self.score_profiles(max_gain, conn, table)
+            if r.finding_type == "score_distribution"
+        )
+
+    def simulated_score_distribution(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """
         Analyze performance by proposed weighted score.
 
@@ -363,93 +812,36 @@ class ResearchQueries:
         - Decline: 0-2 points (2 for 12mo+, 1 for 6-12mo, 0 otherwise)
         - Volume: 0-2 points (2 for <0.75x, 0 otherwise)
         """
-        query = """
-            SELECT
-                (CASE WHEN drawdown <= -0.85 THEN 3
-                      WHEN drawdown <= -0.50 THEN 2
-                      ELSE 0 END) +
-                (CASE WHEN days_since_high >= 365 THEN 2
-                      WHEN days_since_high >= 180 THEN 1
-                      ELSE 0 END) +
-                (CASE WHEN vol_ratio < 0.75 THEN 2 ELSE 0 END) as sim_score,
-                COUNT(*) as count,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(days_to_peak), 0) as avg_days
-            FROM neumann_scores
-            WHERE gain_pct < ? AND drawdown IS NOT NULL AND vol_ratio IS NOT NULL
-            GROUP BY sim_score
-            ORDER BY sim_score DESC
-        """
-
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
-
-        results = []
-        for row in rows:
-            results.append(QueryResult(
-                finding_type="simulated_score",
-                finding_key=f"score_{row['sim_score']}",
-                metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
-                },
-                sample_size=row["count"],
-            ))
-
-        return results
-
-    # =========================================================================
-    # Volume Dynamics
-    # =========================================================================
-
-    def volume_profile(self, max_gain: float = 50000) -> list[QueryResult]:
+        return (
+            r for r in self.score_profiles(max_gain, conn, table)
+            if r.finding_type == "simulated_score"
+        )
+
+    def volume_profile(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """Analyze performance by volume ratio buckets."""
-        query = """
-            SELECT
-                CASE
-                    WHEN vol_ratio < 0.5 THEN 'very_low'
-                    WHEN vol_ratio < 0.75 THEN 'low'
-                    WHEN vol_ratio < 1.0 THEN 'below_avg'
-                    WHEN vol_ratio < 1.5 THEN 'normal'
-                    ELSE 'high'
-                END as vol_bucket,
-                COUNT(*) as count,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(days_to_peak), 0) as avg_days,
-                ROUND(AVG(gain_pct) / NULLIF(AVG(days_to_peak), 0), 2) as velocity
-            FROM neumann_scores
-            WHERE gain_pct < ? AND vol_ratio IS NOT NULL
-            GROUP BY vol_bucket
-            ORDER BY MIN(vol_ratio)
-        """
-
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
-
-        results = []
-        for row in rows:
-            results.append(QueryResult(
-                finding_type="volume_profile",
-                finding_key=row["vol_bucket"],
-                metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_days": row["avg_days"],
-                    "velocity": row["velocity"],
-                },
-                sample_size=row["count"],
-            ))
-
-        return results
+        return (
+            r for r in self.score_profiles(max_gain, conn, table)
+            if r.finding_type == "volume_profile"
+        )
 
     # =========================================================================
     # Move Speed Analysis
     # =========================================================================
 
-    def move_speed_profile(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def move_speed_profile(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """Analyze characteristics by move speed."""
-        query = """
+        query = f"""
             SELECT
                 CASE
                     WHEN days_to_peak < 30 THEN 'fast'
@@ -459,67 +851,68 @@ class ResearchQueries:
                     ELSE 'very_slow'
                 END as speed,
                 COUNT(*) as count,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(drawdown), 2) as avg_drawdown,
-                ROUND(AVG(vol_ratio), 2) as avg_vol_ratio
-            FROM neumann_scores
+                AVG(gain_pct) as avg_gain,
+                AVG(drawdown) as avg_drawdown,
+                AVG(vol_ratio) as avg_vol_ratio
+            FROM {table}
             WHERE gain_pct < ? AND days_to_peak IS NOT NULL
             GROUP BY speed
             ORDER BY MIN(days_to_peak)
         """
 
-        conn = self._connect()
-        rows = conn.execute(query, (max_gain,)).fetchall()
-        conn.close()
+        conn = conn or self.connection()
+        rows = conn.execute(query, (max_gain,))
 
-        results = []
         for row in rows:
-            results.append(QueryResult(
+            yield QueryResult(
                 finding_type="move_speed",
                 finding_key=row["speed"],
                 metrics={
-                    "avg_gain": row["avg_gain"],
-                    "avg_drawdown": row["avg_drawdown"],
-                    "avg_vol_ratio": row["avg_vol_ratio"],
+                    "avg_gain": _round(row["avg_gain"], 0),
+                    "avg_drawdown": _round(row["avg_drawdown"], 2),
+                    "avg_vol_ratio": _round(row["avg_vol_ratio"], 2),
                 },
                 sample_size=row["count"],
-            ))
-
-        return results
+            )
 
     # =========================================================================
     # Summary Statistics
     # =========================================================================
 
-    def summary_stats(self, max_gain: float = 50000) -> list[QueryResult]:
+    @_memoized
+    def summary_stats(
+        self,
+        max_gain: float = 50000,
+        conn: sqlite3.Connection | None = None,
+        table: str = SCORES_TABLE,
+    ) -> Iterator[QueryResult]:
         """Get overall summary statistics."""
-        query = """
+        query = f"""
             SELECT
                 COUNT(*) as total_records,
                 COUNT(DISTINCT ticker) as unique_tickers,
-                ROUND(AVG(gain_pct), 0) as avg_gain,
-                ROUND(AVG(days_to_peak), 0) as avg_days,
-                ROUND(AVG(score), 1) as avg_score,
+                AVG(gain_pct) as avg_gain,
+                AVG(days_to_peak) as avg_days,
+                AVG(score) as avg_score,
                 MIN(gain_pct) as min_gain,
                 MAX(gain_pct) as max_gain
-            FROM neumann_scores
+            FROM {table}
             WHERE gain_pct < ?
         """
 
-        conn = self._connect()
+        conn = conn or self.connection()
         row = conn.execute(query, (max_gain,)).fetchone()
-        conn.close()
 
-        return [QueryResult(
+        yield QueryResult(
             finding_type="summary",
             finding_key="overall",
             metrics={
                 "unique_tickers": row["unique_tickers"],
-                "avg_gain": row["avg_gain"],
-                "avg_days": row["avg_days"],
-                "avg_score": row["avg_score"],
+                "avg_gain": _round(row["avg_gain"], 0),
+                "avg_days": _round(row["avg_days"], 0),
+                "avg_score": _round(row["avg_score"], 1),
                 "min_gain": row["min_gain"],
                 "max_gain": row["max_gain"],
             },
             sample_size=row["total_records"],
-        )]
+        )
@@ -2,17 +2,56 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import io
+import itertools
+import queue
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable
 
 import structlog
 
 from stock_finder.data.database import Database
-from stock_finder.research.queries import QueryResult, ResearchQueries
+from stock_finder.research.queries import (
+    FILTERED_TABLE,
+    READ_POOL_SIZE,
+    QueryResult,
+    ResearchQueries,
+)
 
 logger = structlog.get_logger()
 
+# Bound str.format methods for the per-row lines of the text reports
+_METRIC_LINE = "  - {}: {}\n".format
+_FLOAT_METRIC_LINE = "  - {}: {:,.1f}\n".format
+_COMPARISON_LINE = "\n| {} | {} | {:.1f} | {:.1f} | {} |".format
+
+
+def _finding_rows(
+    results: Iterable[QueryResult],
+    run_id: str,
+    time_window_start: str | None = None,
+    time_window_end: str | None = None,
+) -> Iterator[tuple]:
+    """Yield one research_findings row per numeric metric, skipping the rest."""
+    for result in results:
+        for metric_name, metric_value in result.metrics.items():
+            if not isinstance(metric_value, (int, float)):
+                continue
+            yield (
+                run_id,
+                result.finding_type,
+                result.finding_key,
+                metric_name,
+                metric_value,
+                result.sample_size,
+                time_window_start,
+                time_window_end,
+                None,
+            )
+
 
 class ResearchRunner:
     """
@@ -27,9 +66,15 @@ class ResearchRunner:
         print(f"Stored {results['findings_count']} findings")
     """
 
-    def __init__(self, db_path: Path | str = "data/stock_finder.db"):
+    def __init__(
+        self,
+        db_path: Path | str = "data/stock_finder.db",
+        max_workers: int = READ_POOL_SIZE,
+    ):
         self.db = Database(db_path)
-        self.queries = ResearchQueries(db_path)
+        # Analyses only read; findings are written through self.db
+        self.queries = ResearchQueries(db_path, read_only=True)
+        self.max_workers = max_workers
 
     def run_full_analysis(
         self,
@@ -53,7 +98,8 @@ class ResearchRunner:
             Dict with run metadata and counts
         """
         if run_id is None:
-            run_id = f"full_analysis_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}"
+            # Nanosecond timestamp in hex: unique even for back-to-back scripted runs
+            run_id = f"full_analysis_{time.time_ns():x}"
 
         # Start the run
         self.db.start_research_run(
@@ -66,49 +112,43 @@ class ResearchRunner:
         )
 
         # Run all analyses
-        all_results: list[QueryResult] = []
-
         analyses = [
             ("summary_stats", self.queries.summary_stats),
             ("criteria_lift", self.queries.criteria_lift),
             ("setup_quality", self.queries.setup_quality_tiers),
-            ("theme_performance", self.queries.theme_performance),
-            ("themed_vs_unthemed", self.queries.themed_vs_unthemed),
-            ("timing_by_month", self.queries.timing_by_month),
-            ("timing_by_year", self.queries.timing_by_year),
-            ("score_distribution", self.queries.score_distribution),
-            ("simulated_score", self.queries.simulated_score_distribution),
-            ("volume_profile", self.queries.volume_profile),
+            ("theme_analyses", self.queries.theme_analyses),
+            ("timing_analyses", self.queries.timing_analyses),
+            ("score_profiles", self.queries.score_profiles),
             ("move_speed", self.queries.move_speed_profile),
         ]
 
-        for name, query_fn in analyses:
-            try:
-                results = query_fn(max_gain=max_gain)
-                all_results.extend(results)
-                logger.info(f"Completed {name}", count=len(results))
-            except Exception as e:
-                logger.error(f"Failed {name}", error=str(e))
-
-        # Store all findings
-        findings = []
-        for result in all_results:
-            for metric_name, metric_value in result.metrics.items():
-                # Skip non-numeric values
-                if not isinstance(metric_value, (int, float)) or metric_value is None:
-                    continue
-                findings.append({
-                    "run_id": run_id,
-                    "finding_type": result.finding_type,
-                    "finding_key": result.finding_key,
-                    "metric_name": metric_name,
-                    "metric_value": metric_value,
-                    "sample_size": result.sample_size,
-                    "time_window_start": time_window_start,
-                    "time_window_end": time_window_end,
-                })
-
-        count = self.db.add_findings_bulk(findings)
+        # Analyses are read-only and independent, so they run concurrently on a
+        # pool of read-only connections, each holding the gain-filtered rows in
+        # FILTERED_TABLE; findings are written below on this thread to keep
+        # SQLite's single writer.
+        results_by_name: dict[str, list[QueryResult]] = {}
+        with self.queries.connection_pool(self.max_workers, max_gain=max_gain) as pool:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._run_pooled, query_fn, pool, max_gain): name
+                    for name, query_fn in analyses
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results = future.result()
+                        results_by_name[name] = results
+                        logger.info(f"Completed {name}", count=len(results))
+                    except Exception as e:
+                        logger.error(f"Failed {name}", error=str(e))
+
+        # Keep findings in analysis order regardless of completion order
+        all_results = itertools.chain.from_iterable(
+            results_by_name.get(name, []) for name, _ in analyses
+        )
+        count = self.db.add_findings_bulk_iter(
+            _finding_rows(all_results, run_id, time_window_start, time_window_end)
+        )
 
         logger.info(
             "Research run complete",
@@ -122,6 +162,20 @@ class ResearchRunner:
             "analyses_run": len(analyses),
         }
 
+    @staticmethod
+    def _run_pooled(
+        query_fn: Callable[..., Iterator[QueryResult]],
+        pool: queue.Queue[sqlite3.Connection],
+        max_gain: float,
+    ) -> list[QueryResult]:
+        """Run one analysis against FILTERED_TABLE on a connection borrowed from the pool."""
+        conn = pool.get()
+        try:
+            # Drain the generator before the connection goes back to the pool
+            return list(query_fn(max_gain=max_gain, conn=conn, table=FILTERED_TABLE))
+        finally:
+            pool.put(conn)
+
     def run_single_analysis(
         self,
         analysis_name: str,
@@ -157,23 +211,10 @@ class ResearchRunner:
             available = ", ".join(analysis_map.keys())
             raise ValueError(f"Unknown analysis: {analysis_name}. Available: {available}")
 
-        results = analysis_map[analysis_name](max_gain=max_gain)
+        results = list(analysis_map[analysis_name](max_gain=max_gain))
 
         if run_id:
-            findings = []
-            for result in results:
-                for metric_name, metric_value in result.metrics.items():
-                    if not isinstance(metric_value, (int, float)) or metric_value is None:
-                        continue
-                    findings.append({
-                        "run_id": run_id,
-                        "finding_type": result.finding_type,
-                        "finding_key": result.finding_key,
-                        "metric_name": metric_name,
-                        "metric_value": metric_value,
-                        "sample_size": result.sample_size,
-                    })
-            self.db.add_findings_bulk(findings)
+            self.db.add_findings_bulk_iter(_finding_rows(results, run_id))
 
         return results
 
@@ -222,41 +263,44 @@ class ResearchRunner:
 
     def format_results(self, results: list[QueryResult]) -> str:
         """Format QueryResult list as readable text."""
-        lines = []
+        buf = io.StringIO()
         current_type = None
 
         for result in results:
             if result.finding_type != current_type:
                 current_type = result.finding_type
-                lines.append(f"\n## {current_type.replace('_', ' ').title()}\n")
+                buf.write(f"\n## {current_type.replace('_', ' ').title()}\n\n")
 
-            lines.append(f"**{result.finding_key}** (n={result.sample_size})")
-            for key, value in result.metrics.items():
-                if isinstance(value, float):
-                    lines.append(f"  - {key}: {value:,.1f}")
-                else:
-                    lines.append(f"  - {key}: {value}")
-            lines.append("")
+            buf.write(f"**{result.finding_key}** (n={result.sample_size})\n")
+            buf.writelines(
+                (_FLOAT_METRIC_LINE if isinstance(value, float) else _METRIC_LINE)(key, value)
+                for key, value in result.metrics.items()
+            )
+            buf.write("\n")
 
-        return "\n".join(lines)
+        # Every line was written with a trailing newline; drop the last one
+        return buf.getvalue()[:-1]
 
     def format_comparison(self, comparisons: list[dict]) -> str:
         """Format comparison results as readable text."""
-        lines = ["## Run Comparison\n"]
+        buf = io.StringIO()
+        buf.write("## Run Comparison\n")
         current_type = None
 
         for row in comparisons:
             if row["finding_type"] != current_type:
                 current_type = row["finding_type"]
-                lines.append(f"\n### {current_type.replace('_', ' ').title()}\n")
-                lines.append("| Key | Metric | Run 1 | Run 2 | Change |")
-                lines.append("|-----|--------|-------|-------|--------|")
+                buf.write(f"\n\n### {current_type.replace('_', ' ').title()}\n")
+                buf.write("\n| Key | Metric | Run 1 | Run 2 | Change |")
+                buf.write("\n|-----|--------|-------|-------|--------|")
 
             change = row["pct_change"]
-            change_str = f"{change:+.1f}%" if change else "N/A"
-            lines.append(
-                f"| {row['finding_key']} | {row['metric_name']} | "
-                f"{row['value_1']:.1f} | {row['value_2']:.1f} | {change_str} |"
-            )
-
-        return "\n".join(lines)
+            buf.write(_COMPARISON_LINE(
+                row["finding_key"],
+                row["metric_name"],
+                row["value_1"],
+                row["value_2"],
+                f"{change:+.1f}%" if change else "N/A",
+            ))
+
+        return buf.getvalue()
@@ -1,23 +1,31 @@
 """Scanner for finding stocks with significant gains."""
 
+import heapq
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, timedelta
-from typing import Callable
+from operator import attrgetter
 
+import pandas as pd
 import structlog
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from stock_finder.config import ParallelConfig, ScanConfig
 from stock_finder.data.base import DataProvider
 from stock_finder.models.results import ScanResult
 from stock_finder.scanners.base import Scanner
 from stock_finder.utils.calculations import calculate_max_gain
-from stock_finder.utils.parallel import ParallelExecutor
+from stock_finder.utils.parallel import ParallelExecutor, TaskResult
 
 logger = structlog.get_logger()
 
 # Type alias for result callback
 ResultCallback = Callable[[ScanResult], None]
 
+# Progress bar updates per scan, however many tickers it covers
+PROGRESS_UPDATES = 200
+
 
 class GainerScanner(Scanner):
     """Scanner that finds stocks with significant percentage gains."""
@@ -34,11 +42,12 @@ class GainerScanner(Scanner):
         Args:
             data_provider: Data provider for fetching stock data
             config: Scan configuration. If None, uses defaults.
-            parallel_config: Parallel processing configuration. If None, uses defaults.
+            parallel_config: Parallel processing configuration. If None, uses defaults;
+                an unset max_workers follows the provider's suggested_concurrency.
         """
         self.data_provider = data_provider
         self.config = config or ScanConfig()
-        self.parallel_config = parallel_config or ParallelConfig()
+        self.parallel_config = (parallel_config or ParallelConfig()).resolve(data_provider)
 
     def _get_date_range(self) -> tuple[date, date]:
         """Get the start and end dates for scanning."""
@@ -46,22 +55,33 @@ class GainerScanner(Scanner):
         start = end - timedelta(days=self.config.lookback_years * 365)
         return start, end
 
-    def scan_single(self, ticker: str) -> ScanResult | None:
+    def scan_single(
+        self,
+        ticker: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> ScanResult | None:
         """
         Scan a single ticker for gains.
 
         Args:
             ticker: Ticker symbol to scan
+            start: Start of the lookback window. If None, computed from config.
+            end: End of the lookback window. If None, today.
 
         Returns:
             ScanResult if ticker meets gain threshold, None otherwise
         """
-        start, end = self._get_date_range()
+        if start is None or end is None:
+            start, end = self._get_date_range()
 
         logger.debug("Scanning ticker", ticker=ticker, start=start, end=end)
 
         df = self.data_provider.get_historical_df(ticker, start, end)
+        return self._evaluate(ticker, df)
 
+    def _evaluate(self, ticker: str, df: pd.DataFrame | None) -> ScanResult | None:
+        """Compute a fetched ticker's max gain, returning it if it meets the threshold."""
         if df is None or df.empty:
             logger.debug("No data for ticker", ticker=ticker)
             return None
@@ -81,11 +101,21 @@ class GainerScanner(Scanner):
 
         return result
 
+    @staticmethod
+    def _rank(results: list[ScanResult], top_k: int | None) -> list[ScanResult]:
+        """Order results by gain (descending), keeping only the best top_k if given."""
+        if top_k is not None:
+            # A bounded heap is O(N log K) versus sorting all N results
+            return heapq.nlargest(top_k, results, key=attrgetter("gain_pct"))
+        results.sort(key=attrgetter("gain_pct"), reverse=True)
+        return results
+
     def scan(
         self,
         tickers: list[str],
         show_progress: bool = True,
         on_result: ResultCallback | None = None,
+        top_k: int | None = None,
     ) -> list[ScanResult]:
         """
         Scan multiple tickers for gains.
@@ -94,6 +124,8 @@ class GainerScanner(Scanner):
             tickers: List of ticker symbols to scan
             show_progress: Whether to show progress bar
             on_result: Optional callback called for each result found (for incremental saves)
+            top_k: If set, return only the top_k biggest gainers (on_result still
+                sees every result)
 
         Returns:
             List of ScanResult for tickers meeting gain threshold,
@@ -106,13 +138,13 @@ class GainerScanner(Scanner):
             workers=self.parallel_config.max_workers if self.parallel_config.enabled else 1,
         )
 
+        # One lookback window shared by every ticker
+        start, end = self._get_date_range()
+
         if self.parallel_config.enabled:
-            results, errors = self._scan_parallel(tickers, show_progress, on_result)
+            results, errors = self._scan_parallel(tickers, start, end, show_progress, on_result)
         else:
-            results, errors = self._scan_sequential(tickers, show_progress, on_result)
-
-        # Sort by gain percentage descending
-        results.sort(key=lambda r: r.gain_pct, reverse=True)
+            results, errors = self._scan_sequential(tickers, start, end, show_progress, on_result)
 
         logger.info(
             "Scan complete",
@@ -120,45 +152,80 @@ class GainerScanner(Scanner):
             gainers_found=len(results),
             errors=len(errors),
         )
+        return self._rank(results, top_k)
+
+    @staticmethod
+    def _make_progress() -> Progress:
+        """Create the scan progress bar."""
+        # Fresh columns each time: SpinnerColumn keeps per-instance animation state
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TextColumn("[cyan]{task.completed}/{task.total}"),
+        )
 
-        return results
+    @classmethod
+    @contextmanager
+    def _progress(
+        cls,
+        show_progress: bool,
+        description: str,
+        total: int,
+    ) -> Iterator[Callable[[int], None]]:
+        """
+        Yield a callback that reports how many tickers have completed.
+
+        The bar is only updated every 1/PROGRESS_UPDATES of the total (and on
+        the last ticker): each update takes the bar's lock, and it redraws at
+        a fixed rate anyway.
+        """
+        if not show_progress:
+            yield lambda completed: None
+            return
+
+        step = max(1, total // PROGRESS_UPDATES)
+        with cls._make_progress() as progress:
+            task = progress.add_task(description, total=total)
+
+            def update(completed: int) -> None:
+                if completed % step == 0 or completed == total:
+                    progress.update(task, completed=completed)
+
+            yield update
 
     def _scan_sequential(
         self,
         tickers: list[str],
+        start: date,
+        end: date,
         show_progress: bool,
         on_result: ResultCallback | None,
     ) -> tuple[list[ScanResult], list[str]]:
-        """Scan tickers sequentially."""
+        """
+        Scan tickers one at a time, fetching the next ticker while this one is evaluated.
+
+        A single background thread keeps one fetch in flight, so network
+        waits overlap the max-gain computation without concurrent requests.
+        """
         results: list[ScanResult] = []
         errors: list[str] = []
 
-        if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TextColumn("[cyan]{task.completed}/{task.total}"),
-            ) as progress:
-                task = progress.add_task("Scanning...", total=len(tickers))
-
-                for ticker in tickers:
-                    try:
-                        result = self.scan_single(ticker)
-                        if result:
-                            results.append(result)
-                            if on_result:
-                                on_result(result)
-                    except Exception as e:
-                        logger.error("Error scanning ticker", ticker=ticker, error=str(e))
-                        errors.append(ticker)
-
-                    progress.update(task, advance=1)
-        else:
-            for ticker in tickers:
+        with (
+            ThreadPoolExecutor(max_workers=1) as fetcher,
+            self._progress(show_progress, "Scanning...", len(tickers)) as update_progress,
+        ):
+            def fetch(ticker: str) -> Future:
+                logger.debug("Scanning ticker", ticker=ticker, start=start, end=end)
+                return fetcher.submit(self.data_provider.get_historical_df, ticker, start, end)
+
+            pending: Future | None = None
+            for completed, ticker in enumerate(tickers, 1):
+                current = pending or fetch(ticker)
+                pending = fetch(tickers[completed]) if completed < len(tickers) else None
                 try:
-                    result = self.scan_single(ticker)
+                    result = self._evaluate(ticker, current.result())
                     if result:
                         results.append(result)
                         if on_result:
@@ -167,11 +234,15 @@ class GainerScanner(Scanner):
                     logger.error("Error scanning ticker", ticker=ticker, error=str(e))
                     errors.append(ticker)
 
+                update_progress(completed)
+
         return results, errors
 
     def _scan_parallel(
         self,
         tickers: list[str],
+        start: date,
+        end: date,
         show_progress: bool,
         on_result: ResultCallback | None,
     ) -> tuple[list[ScanResult], list[str]]:
@@ -179,50 +250,30 @@ class GainerScanner(Scanner):
         results: list[ScanResult] = []
         errors: list[str] = []
 
-        executor = ParallelExecutor(max_workers=self.parallel_config.max_workers)
-
-        if show_progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TextColumn("[cyan]{task.completed}/{task.total}"),
-            ) as progress:
-                task = progress.add_task(
-                    f"Scanning ({self.parallel_config.max_workers} workers)...",
-                    total=len(tickers),
-                )
-
-                def on_progress(completed, total, ticker, task_result):
-                    progress.update(task, completed=completed)
+        max_workers = self.parallel_config.max_workers
+        executor = ParallelExecutor(max_workers=max_workers)
 
-                def on_task_result(task_result):
-                    if task_result.success and task_result.result is not None:
-                        results.append(task_result.result)
-                        if on_result:
-                            on_result(task_result.result)
-                    elif not task_result.success:
-                        errors.append(task_result.item)
-
-                executor.execute(
-                    self.scan_single,
-                    tickers,
-                    on_progress=on_progress,
-                    on_result=on_task_result,
-                )
-        else:
-            def on_task_result(task_result):
+        with self._progress(
+            show_progress, f"Scanning ({max_workers} workers)...", len(tickers)
+        ) as update_progress:
+            def on_task_result(task_result: TaskResult) -> None:
                 if task_result.success and task_result.result is not None:
                     results.append(task_result.result)
                     if on_result:
                         on_result(task_result.result)
                 elif not task_result.success:
+                    logger.error(
+                        "Error scanning ticker", ticker=task_result.item, error=task_result.error
+                    )
                     errors.append(task_result.item)
 
+            def on_progress(completed: int, total: int, ticker: str, task_result: TaskResult):
+                update_progress(completed)
+
             executor.execute(
-                self.scan_single,
+                lambda ticker: self.scan_single(ticker, start, end),
                 tickers,
+                on_progress=on_progress,
                 on_result=on_task_result,
             )
 
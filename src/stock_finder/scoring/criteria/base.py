@@ -4,10 +4,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
+from stock_finder.models.results import CriterionTuple
 
-@dataclass
+
+@dataclass(slots=True)
 class ScoringContext:
     """
     Context containing all data needed to evaluate criteria at ignition point.
@@ -22,6 +25,10 @@ class ScoringContext:
         high_price: Price at the peak
         shares_outstanding: Number of shares (for market cap calculation)
         sma_data: Dict of SMA values at ignition (e.g., {"sma50": 15.0, "sma200": 18.0})
+
+    With sufficient data, the High/Low/Volume columns and the index (as int64
+    nanoseconds) are also captured once as float64 arrays (high, low, volume,
+    index_epoch) so criteria can read them without pandas column lookups.
     """
 
     ticker: str
@@ -33,6 +40,54 @@ class ScoringContext:
     high_price: float
     shares_outstanding: float | None = None
     sma_data: dict[str, float] = field(default_factory=dict)
+    high: np.ndarray = field(init=False, repr=False, compare=False)
+    low: np.ndarray = field(init=False, repr=False, compare=False)
+    volume: np.ndarray = field(init=False, repr=False, compare=False)
+    index_epoch: np.ndarray = field(init=False, repr=False, compare=False)
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.has_sufficient_data:
+            df = self.historical_data
+            self.high = df["High"].to_numpy(dtype=np.float64)
+            self.low = df["Low"].to_numpy(dtype=np.float64)
+            self.volume = df["Volume"].to_numpy(dtype=np.float64)
+            self.index_epoch = df.index.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        else:
+            self.high = self.low = self.volume = np.empty(0, dtype=np.float64)
+            self.index_epoch = np.empty(0, dtype=np.int64)
+        self._cache = self._precompute()
+
+    def _epoch(self, day: date) -> int:
+        """Convert a date to the int64 nanoseconds used by index_epoch."""
+        return int(np.datetime64(day, "ns").view(np.int64))
+
+    def _precompute(self) -> dict:
+        """Reduce the High/Low arrays once so the 2-year properties are lookups."""
+        if not self.has_sufficient_data:
+            return {}
+
+        # fmax/fmin skip NaN bars, like the pandas reductions
+        running_high = np.fmax.accumulate(self.high)
+        cache = {
+            "running_high": running_high,
+            "two_year_high": running_high[-1],
+            "two_year_low": np.fmin.reduce(self.low),
+            "two_year_high_date": None,
+            "days_since_high": None,
+        }
+        if np.isnan(running_high[-1]):
+            return cache
+
+        # First bar at the high, matching idxmax
+        high_loc = int(np.argmax(self.high == running_high[-1]))
+        high_date = pd.Timestamp(self.historical_data.index[high_loc]).date()
+        # Count trading days between high and ignition (index is sorted)
+        first = np.searchsorted(self.index_epoch, self._epoch(high_date), side="left")
+        last = np.searchsorted(self.index_epoch, self._epoch(self.ignition_date), side="right")
+        cache["two_year_high_date"] = high_date
+        cache["days_since_high"] = max(int(last - first), 0)
+        return cache
 
     @property
     def has_sufficient_data(self) -> bool:
@@ -41,40 +96,30 @@ class ScoringContext:
             return False
         return len(self.historical_data) >= 50  # At least 50 days
 
+    @property
+    def running_high(self) -> np.ndarray | None:
+        """Get the highest High up to and including each bar (the rolling peak)."""
+        return self._cache.get("running_high")
+
     @property
     def two_year_high(self) -> float | None:
         """Get the 2-year high price before ignition."""
-        if not self.has_sufficient_data:
-            return None
-        return self.historical_data["High"].max()
+        return self._cache.get("two_year_high")
 
     @property
     def two_year_low(self) -> float | None:
         """Get the 2-year low price before ignition."""
-        if not self.has_sufficient_data:
-            return None
-        return self.historical_data["Low"].min()
+        return self._cache.get("two_year_low")
 
     @property
     def two_year_high_date(self) -> date | None:
         """Get the date of the 2-year high."""
-        if not self.has_sufficient_data:
-            return None
-        return self.historical_data["High"].idxmax().date()
+        return self._cache.get("two_year_high_date")
 
     @property
     def days_since_high(self) -> int | None:
         """Calculate trading days from 2-year high to ignition."""
-        if not self.has_sufficient_data:
-            return None
-        high_date = self.two_year_high_date
-        if high_date is None:
-            return None
-        # Count trading days between high and ignition
-        mask = (self.historical_data.index >= pd.Timestamp(high_date)) & (
-            self.historical_data.index <= pd.Timestamp(self.ignition_date)
-        )
-        return mask.sum()
+        return self._cache.get("days_since_high")
 
     @property
     def range_position(self) -> float | None:
@@ -98,34 +143,43 @@ class ScoringContext:
         return self.shares_outstanding * self.ignition_price
 
     def get_volume_at_ignition(self) -> float | None:
-        """Get the volume on ignition date."""
+        """Get the volume on ignition date, or on the closest bar to it."""
         if not self.has_sufficient_data:
             return None
-        try:
-            return self.historical_data.loc[
-                pd.Timestamp(self.ignition_date), "Volume"
-            ]
-        except KeyError:
-            # Try to find closest date
-            idx = self.historical_data.index.get_indexer(
-                [pd.Timestamp(self.ignition_date)], method="nearest"
-            )[0]
-            if idx >= 0:
-                return self.historical_data.iloc[idx]["Volume"]
-            return None
+        if "volume_at_ignition" not in self._cache:
+            self._cache["volume_at_ignition"] = self._volume_at_ignition()
+        return self._cache["volume_at_ignition"]
+
+    def _volume_at_ignition(self) -> float:
+        epochs = self.index_epoch
+        target = self._epoch(self.ignition_date)
+        pos = int(np.searchsorted(epochs, target))
+        if pos < len(epochs) and epochs[pos] == target:
+            return self.volume[pos]
+        # Nearest bar; ties go to the later one
+        if pos == len(epochs) or (pos > 0 and target - epochs[pos - 1] < epochs[pos] - target):
+            pos -= 1
+        return self.volume[pos]
 
     def get_avg_volume(self, days: int = 50) -> float | None:
         """Get average volume over the last N days before ignition."""
         if not self.has_sufficient_data:
             return None
+        key = ("avg_volume", days)
+        if key not in self._cache:
+            self._cache[key] = self._avg_volume(days)
+        return self._cache[key]
+
+    def _avg_volume(self, days: int) -> float | None:
         # Get last N days of volume
-        volumes = self.historical_data["Volume"].tail(days)
+        volumes = self.volume[max(len(self.volume) - days, 0) :]
         if len(volumes) == 0:
             return None
-        return volumes.mean()
+        volumes = volumes[~np.isnan(volumes)]
+        return volumes.mean() if len(volumes) else np.nan
 
 
-@dataclass
+@dataclass(slots=True)
 class CriterionResult:
     """
     Result from evaluating a single criterion.
@@ -144,6 +198,10 @@ class CriterionResult:
     threshold: float | None
     details: str
 
+    def as_tuple(self) -> CriterionTuple:
+        """Convert to the flat tuple stored in NeumannScore.criteria_results."""
+        return (self.name, self.passed, self.value, self.threshold, self.details)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 
+import pandas as pd
 from rich.console import Console
 from rich.table import Table
 
@@ -53,41 +54,30 @@ def _calculate_criteria_stats(scores: list[dict]) -> dict[str, dict]:
     - avg_gain_when_passed: Average gain for stocks that passed
     - avg_gain_when_failed: Average gain for stocks that failed
     """
-    if not scores:
+    # One row per (score, criterion) so the tallies are a single groupby
+    records = [
+        (name, bool(result.get("passed")), score.get("gain_pct", 0) or 0)
+        for score in scores
+        for name, result in score.get("criteria_results", {}).items()
+    ]
+    if not records:
         return {}
 
-    criteria_names = set()
-    for score in scores:
-        if "criteria_results" in score:
-            criteria_names.update(score["criteria_results"].keys())
+    df = pd.DataFrame(records, columns=["criterion", "passed", "gain"])
+    grouped = df.groupby(["criterion", "passed"])["gain"].agg(["mean", "count"]).unstack("passed")
+    counts = grouped["count"].reindex(columns=[True, False]).fillna(0).astype(int)
+    means = grouped["mean"].reindex(columns=[True, False]).fillna(0)
 
     stats = {}
-    for name in criteria_names:
-        passed_gains = []
-        failed_gains = []
-
-        for score in scores:
-            results = score.get("criteria_results", {})
-            if name not in results:
-                continue
-
-            gain = score.get("gain_pct", 0) or 0
-            if results[name].get("passed"):
-                passed_gains.append(gain)
-            else:
-                failed_gains.append(gain)
-
-        total = len(passed_gains) + len(failed_gains)
+    for name in counts.index:
+        passed_count = int(counts.at[name, True])
+        failed_count = int(counts.at[name, False])
         stats[name] = {
-            "pass_rate": len(passed_gains) / total if total > 0 else 0,
-            "passed_count": len(passed_gains),
-            "failed_count": len(failed_gains),
-            "avg_gain_when_passed": (
-                sum(passed_gains) / len(passed_gains) if passed_gains else 0
-            ),
-            "avg_gain_when_failed": (
-                sum(failed_gains) / len(failed_gains) if failed_gains else 0
-            ),
+            "pass_rate": passed_count / (passed_count + failed_count),
+            "passed_count": passed_count,
+            "failed_count": failed_count,
+            "avg_gain_when_passed": float(means.at[name, True]),
+            "avg_gain_when_failed": float(means.at[name, False]),
         }
 
     return stats
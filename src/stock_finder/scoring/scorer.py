@@ -1,14 +1,18 @@
 """NeumannScorer - orchestrates scoring stocks against Neumann criteria."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from typing import Any, Callable
 
+import numpy as np
+import pandas as pd
 import structlog
 
 from stock_finder.config import ParallelConfig
 from stock_finder.data.base import DataProvider
 from stock_finder.data.database import Database
-from stock_finder.models.results import NeumannScore
+from stock_finder.data.fmp_provider import Quote
+from stock_finder.models.results import NeumannScore, StockData
 from stock_finder.scoring.criteria.base import Criterion, CriterionResult, ScoringContext
 from stock_finder.scoring.criteria.below_sma50 import BelowSMA50Criterion
 from stock_finder.scoring.criteria.below_sma200 import BelowSMA200Criterion
@@ -23,6 +27,9 @@ from stock_finder.utils.parallel import ParallelExecutor
 
 logger = structlog.get_logger()
 
+# Price history evaluated before each ignition date (~2 years)
+HISTORY_DAYS = 730
+
 
 class NeumannScorer:
     """
@@ -55,8 +62,10 @@ class NeumannScorer:
         self.provider = provider
         self.criteria = criteria if criteria is not None else self._default_criteria()
         self.db = db
-        self.parallel_config = parallel_config or ParallelConfig()
+        self.parallel_config = (parallel_config or ParallelConfig()).resolve(provider)
         self.scoring_mode = scoring_mode
+        # Quotes by ticker (None when unavailable); a ticker can recur across scan results
+        self._quote_cache: dict[str, Quote | None] = {}
 
     def _default_criteria(self) -> list[Criterion]:
         """Return the standard 8 Neumann criteria with default thresholds."""
@@ -71,13 +80,19 @@ class NeumannScorer:
             TrendlineBreakCriterion(),
         ]
 
-    def score_stock(self, scan_result: dict[str, Any]) -> NeumannScore:
+    def score_stock(
+        self,
+        scan_result: dict[str, Any],
+        historical_data: pd.DataFrame | None = None,
+    ) -> NeumannScore:
         """
         Score a single stock at its ignition point.
 
         Args:
             scan_result: Dict with keys: id, ticker, low_date, low_price,
                         high_date, high_price, gain_pct, days_to_peak
+            historical_data: Pre-fetched OHLCV data covering the window before
+                        ignition. If None, fetched from the provider.
 
         Returns:
             NeumannScore with results for all criteria
@@ -101,15 +116,16 @@ class NeumannScorer:
             high_date=high_date,
             high_price=high_price,
             gain_pct=gain_pct,
+            prefetched=historical_data,
         )
 
         # Evaluate all criteria
-        results: dict[str, dict[str, Any]] = {}
+        results: dict[str, CriterionResult] = {}
         total_score = 0
 
         for criterion in self.criteria:
             result = criterion.evaluate(context)
-            results[criterion.name] = result.to_dict()
+            results[criterion.name] = result
             if result.passed:
                 weight = get_weight(criterion.name, self.scoring_mode)
                 total_score += weight
@@ -121,7 +137,7 @@ class NeumannScorer:
             score=total_score,
             max_score=get_max_score(self.scoring_mode),
             scoring_mode=self.scoring_mode.value,
-            criteria_results=results,
+            criteria_results=tuple(result.as_tuple() for result in results.values()),
             drawdown=self._get_value(results, "drawdown"),
             days_since_high=self._get_value_int(results, "extended_decline"),
             range_position=self._get_value(results, "near_lows"),
@@ -167,10 +183,12 @@ class NeumannScorer:
             workers=self.parallel_config.max_workers if self.parallel_config.enabled else 1,
         )
 
+        histories = self._prefetch_histories(scan_results)
+
         if self.parallel_config.enabled:
-            scores = self._score_parallel(scan_results, save, on_progress)
+            scores = self._score_parallel(scan_results, save, on_progress, histories)
         else:
-            scores = self._score_sequential(scan_results, save, on_progress)
+            scores = self._score_sequential(scan_results, save, on_progress, histories)
 
         max_score = get_max_score(self.scoring_mode)
         avg = sum(s.score for s in scores) / len(scores) if scores else 0
@@ -183,11 +201,59 @@ class NeumannScorer:
 
         return scores
 
+    def _prefetch_histories(
+        self, scan_results: list[dict]
+    ) -> dict[tuple[str, date], pd.DataFrame] | None:
+        """
+        Fetch histories in batch requests, when the provider really batches them.
+
+        Each result needs the HISTORY_DAYS before its own ignition date, so
+        results are grouped by ignition date and each group is one
+        get_historical_batch call (many gainers bottom on the same day).
+        Groups are fetched concurrently when parallel processing is enabled.
+        Tickers without data map to an empty DataFrame so they are not
+        fetched again one by one.
+
+        Returns:
+            Dict of (ticker, ignition date) -> DataFrame, or None to fetch per
+            stock instead
+        """
+        get_batch = getattr(self.provider, "get_historical_batch", None)
+        supports_batch = getattr(self.provider, "supports_batch", get_batch is not None)
+        if not scan_results or get_batch is None or not supports_batch:
+            return None
+
+        windows: dict[date, list[str]] = {}
+        for result in scan_results:
+            tickers = windows.setdefault(self._parse_date(result["low_date"]), [])
+            if result["ticker"] not in tickers:
+                tickers.append(result["ticker"])
+
+        def fetch(low_date: date) -> dict[str, StockData]:
+            start = low_date - timedelta(days=HISTORY_DAYS)
+            return get_batch(windows[low_date], start, low_date)
+
+        workers = self.parallel_config.max_workers if self.parallel_config.enabled else 1
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                batches = dict(zip(windows, pool.map(fetch, windows), strict=True))
+        except Exception as e:
+            logger.warning("Batch history fetch failed, fetching per stock", error=str(e))
+            return None
+
+        logger.debug("Prefetched histories", windows=len(windows), requested=len(scan_results))
+        return {
+            (ticker, low_date): batch[ticker].data if ticker in batch else pd.DataFrame()
+            for low_date, batch in batches.items()
+            for ticker in windows[low_date]
+        }
+
     def _score_sequential(
         self,
         scan_results: list[dict],
         save: bool,
         on_progress: Callable[[int, int, str], None] | None,
+        histories: dict[tuple[str, date], pd.DataFrame] | None = None,
     ) -> list[NeumannScore]:
         """Score stocks sequentially."""
         scores = []
@@ -196,12 +262,9 @@ class NeumannScorer:
                 on_progress(i + 1, len(scan_results), result["ticker"])
 
             try:
-                score = self.score_stock(result)
+                score = self.score_stock(result, self._history_for(histories, result))
                 scores.append(score)
 
-                if save and self.db:
-                    self.db.add_neumann_score(score)
-
             except Exception as e:
                 logger.error(
                     "Failed to score stock",
@@ -209,6 +272,9 @@ class NeumannScorer:
                     error=str(e),
                 )
 
+        if save and self.db:
+            self.db.add_neumann_scores(scores)
+
         return scores
 
     def _score_parallel(
@@ -216,6 +282,7 @@ class NeumannScorer:
         scan_results: list[dict],
         save: bool,
         on_progress: Callable[[int, int, str], None] | None,
+        histories: dict[tuple[str, date], pd.DataFrame] | None = None,
     ) -> list[NeumannScore]:
         """Score stocks in parallel."""
         scores: list[NeumannScore] = []
@@ -231,10 +298,6 @@ class NeumannScorer:
                 score = task_result.result
                 scores.append(score)
 
-                # Save to database (thread-safe with SQLite in WAL mode)
-                if save and self.db:
-                    self.db.add_neumann_score(score)
-
                 if on_progress:
                     on_progress(completed, len(scan_results), task_result.item["ticker"])
             else:
@@ -242,13 +305,27 @@ class NeumannScorer:
                     on_progress(completed, len(scan_results), task_result.item.get("ticker", "unknown"))
 
         executor.execute(
-            self.score_stock,
+            lambda result: self.score_stock(result, self._history_for(histories, result)),
             scan_results,
             on_result=on_task_result,
         )
 
+        if save and self.db:
+            self.db.add_neumann_scores(scores)
+
         return scores
 
+    def _history_for(
+        self,
+        histories: dict[tuple[str, date], pd.DataFrame] | None,
+        scan_result: dict,
+    ) -> pd.DataFrame | None:
+        """Look up a scan result's prefetched history (None when nothing was prefetched)."""
+        if histories is None:
+            return None
+        key = (scan_result["ticker"], self._parse_date(scan_result["low_date"]))
+        return histories.get(key, pd.DataFrame())
+
     def _build_context(
         self,
         ticker: str,
@@ -257,41 +334,39 @@ class NeumannScorer:
         high_date: date,
         high_price: float,
         gain_pct: float,
+        prefetched: pd.DataFrame | None = None,
     ) -> ScoringContext:
         """Build a ScoringContext with historical data and SMA values."""
-        import pandas as pd
-
         # Default empty context if no provider
         historical_data = pd.DataFrame()
         shares_outstanding = None
         sma_data = {}
 
-        if self.provider is not None:
+        if self.provider is not None or prefetched is not None:
             # Fetch 2 years of historical data before ignition
-            start_date = ignition_date - timedelta(days=730)  # ~2 years
+            start_date = ignition_date - timedelta(days=HISTORY_DAYS)  # ~2 years
             end_date = ignition_date
 
-            stock_data = self.provider.get_historical(ticker, start_date, end_date)
+            stock_data = None
+            if prefetched is not None:
+                stock_data = self._slice_history(ticker, prefetched, start_date, end_date)
+            elif self.provider is not None:
+                stock_data = self.provider.get_historical(ticker, start_date, end_date)
             if stock_data is not None:
                 historical_data = stock_data.data
 
                 # Calculate SMAs from historical data (more accurate than current quote)
-                if len(historical_data) >= 50:
-                    sma50 = historical_data["Close"].tail(50).mean()
-                    sma_data["sma50"] = sma50
-                if len(historical_data) >= 200:
-                    sma200 = historical_data["Close"].tail(200).mean()
-                    sma_data["sma200"] = sma200
+                close = historical_data["Close"].to_numpy(dtype=np.float64)
+                if len(close) >= 50:
+                    sma_data["sma50"] = self._tail_mean(close, 50)
+                if len(close) >= 200:
+                    sma_data["sma200"] = self._tail_mean(close, 200)
 
             # Try to get shares outstanding from provider for market cap
-            try:
-                if hasattr(self.provider, "get_quote"):
-                    quote = self.provider.get_quote(ticker)
-                    if quote and quote.market_cap and quote.price:
-                        # Estimate shares from current market cap / current price
-                        shares_outstanding = quote.market_cap / quote.price
-            except Exception as e:
-                logger.debug("Could not get quote data", ticker=ticker, error=str(e))
+            quote = self._get_quote_cached(ticker)
+            if quote and quote.market_cap and quote.price:
+                # Estimate shares from current market cap / current price
+                shares_outstanding = quote.market_cap / quote.price
 
         # Build context
         return ScoringContext(
@@ -306,30 +381,68 @@ class NeumannScorer:
             sma_data={k: v for k, v in sma_data.items() if v is not None},
         )
 
+    def _get_quote_cached(self, ticker: str) -> Quote | None:
+        """Get a ticker's quote, asking the provider at most once per scorer."""
+        if ticker in self._quote_cache:
+            return self._quote_cache[ticker]
+
+        quote = None
+        try:
+            if self.provider is not None and hasattr(self.provider, "get_quote"):
+                quote = self.provider.get_quote(ticker)
+        except Exception as e:
+            logger.debug("Could not get quote data", ticker=ticker, error=str(e))
+
+        self._quote_cache[ticker] = quote
+        return quote
+
+    @staticmethod
+    def _slice_history(
+        ticker: str,
+        df: pd.DataFrame,
+        start: date,
+        end: date,
+    ) -> StockData | None:
+        """Cut a prefetched history down to [start, end], as get_historical would return it."""
+        if df.empty:
+            return None
+        window = df[(df.index >= pd.Timestamp(start)) & (df.index <= pd.Timestamp(end))]
+        if window.empty:
+            return None
+        return StockData(ticker=ticker, data=window)
+
+    @staticmethod
+    def _tail_mean(values: np.ndarray, days: int) -> float:
+        """Mean of the last N values, skipping NaNs like Series.mean (NaN if none)."""
+        window = values[-days:]
+        window = window[~np.isnan(window)]
+        return float(window.mean()) if len(window) else np.nan
+
     def _parse_date(self, d: str | date) -> date:
         """Parse a date from string or return as-is if already a date."""
         if isinstance(d, date):
             return d
         return date.fromisoformat(str(d))
 
-    def _get_value(self, results: dict, key: str) -> float | None:
+    def _get_value(self, results: dict[str, CriterionResult], key: str) -> float | None:
         """Get a float value from criterion results."""
         if key not in results:
             return None
-        value = results[key].get("value")
+        value = results[key].value
         if value is None:
             return None
         return float(value)
 
-    def _get_value_int(self, results: dict, key: str) -> int | None:
+    def _get_value_int(self, results: dict[str, CriterionResult], key: str) -> int | None:
         """Get an int value from criterion results."""
         value = self._get_value(results, key)
         if value is None:
             return None
         return int(value)
 
-    def _get_passed(self, results: dict, key: str) -> bool | None:
+    def _get_passed(self, results: dict[str, CriterionResult], key: str) -> bool | None:
         """Get a passed status from criterion results."""
         if key not in results:
             return None
-        return results[key].get("passed")
+        return results[key].passed
+
@@ -2,9 +2,11 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
 from stock_finder.models.results import ScanResult
+from stock_finder.utils.kernels import max_drawup
 
 
 def calculate_max_gain(
@@ -38,60 +40,21 @@ def calculate_max_gain(
         return None
 
     # Find the maximum drawup (lowest point to highest point after it)
-    # For each point, track the minimum seen so far
-    # Then find max gain from that minimum to current price
-
-    best_gain_pct = 0.0
-    best_low_idx = None
-    best_high_idx = None
-    best_low_price = None
-    best_high_price = None
-
-    min_price = close.iloc[0]
-    min_idx = close.index[0]
-
-    for i in range(1, len(close)):
-        current_price = close.iloc[i]
-        current_idx = close.index[i]
-
-        # Update minimum if we found a new low
-        if current_price < min_price:
-            min_price = current_price
-            min_idx = current_idx
-        else:
-            # Calculate gain from minimum to current
-            if min_price > 0:
-                gain_pct = ((current_price - min_price) / min_price) * 100
-
-                if gain_pct > best_gain_pct:
-                    best_gain_pct = gain_pct
-                    best_low_idx = min_idx
-                    best_high_idx = current_idx
-                    best_low_price = min_price
-                    best_high_price = current_price
+    prices = close.to_numpy(dtype=np.float64)
+    low_loc, high_loc, best_gain_pct = max_drawup(prices)
 
     # Check if gain meets threshold
-    if best_gain_pct < min_gain_pct:
+    if low_loc < 0 or best_gain_pct < min_gain_pct:
         return None
 
-    if best_low_idx is None or best_high_idx is None:
-        return None
-
-    # Calculate trading days between low and high
-    low_loc = close.index.get_loc(best_low_idx)
-    high_loc = close.index.get_loc(best_high_idx)
-    days_to_peak = high_loc - low_loc
-
-    # Get current price (last close)
-    current_price = close.iloc[-1]
-
     return ScanResult(
         ticker=ticker,
         gain_pct=best_gain_pct,
-        low_date=pd.Timestamp(best_low_idx).date(),
-        high_date=pd.Timestamp(best_high_idx).date(),
-        low_price=best_low_price,
-        high_price=best_high_price,
-        current_price=current_price,
-        days_to_peak=days_to_peak,
+        low_date=pd.Timestamp(close.index[low_loc]).date(),
+        high_date=pd.Timestamp(close.index[high_loc]).date(),
+        low_price=float(prices[low_loc]),
+        high_price=float(prices[high_loc]),
+        current_price=float(prices[-1]),
+        days_to_peak=high_loc - low_loc,  # Trading days between low and high
     )
+
@@ -0,0 +1,68 @@
+"""Numeric kernels for per-ticker price scans, JIT-compiled when numba is installed."""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # fall back to the vectorized NumPy kernels
+
+
+def _max_drawup_loop(close: np.ndarray) -> tuple[int, int, float]:
+    """Single pass tracking the running low and the best gain after it."""
+    best_gain = 0.0
+    best_low = -1
+    best_high = -1
+    min_price = close[0]
+    min_i = 0
+
+    for i in range(1, close.shape[0]):
+        price = close[i]
+        if price < min_price:
+            min_price = price
+            min_i = i
+        elif min_price > 0:
+            gain = (price - min_price) / min_price * 100
+            if gain > best_gain:
+                best_gain = gain
+                best_low = min_i
+                best_high = i
+
+    return best_low, best_high, best_gain
+
+
+def _max_drawup_numpy(close: np.ndarray) -> tuple[int, int, float]:
+    """Vectorized equivalent of _max_drawup_loop."""
+    running_min = np.minimum.accumulate(close)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gains = np.where(running_min > 0, (close - running_min) / running_min * 100, 0.0)
+
+    high = int(np.argmax(gains))
+    best_gain = float(gains[high])
+    if best_gain <= 0:
+        return -1, -1, 0.0
+
+    # The loop keeps the first bar that set the running low
+    low = int(np.argmax(close[: high + 1] == running_min[high]))
+    return low, high, best_gain
+
+
+_max_drawup_jit = njit(cache=True, fastmath=True, boundscheck=False)(_max_drawup_loop) if njit else None
+
+
+def max_drawup(close: np.ndarray) -> tuple[int, int, float]:
+    """
+    Find the largest gain from a low to a later high in a price series.
+
+    Args:
+        close: 1-D float64 array of prices without NaNs (at least 2 values)
+
+    Returns:
+        Tuple of (low_index, high_index, gain_pct); indices are -1 when
+        prices never rise above an earlier low
+    """
+    if _max_drawup_jit is not None:
+        low, high, gain = _max_drawup_jit(close)
+        return int(low), int(high), float(gain)
+    return _max_drawup_numpy(close)
+
@@ -0,0 +1,68 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import dataclasses
+import json
+import math
+from datetime import date
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the stdlib encoder lacks but orjson handles natively."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj: Any) -> Any:
+    """Copy obj with NaN and infinite floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return _finite(_json_default(obj))
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize to a compact JSON string.
+
+    Dataclasses (e.g. ScanResult, NeumannScore), dates and numpy values are
+    encoded directly, so result lists need no per-object to_dict() pass.
+    NaN and infinite floats are written as null, so the output is the same
+    with or without orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    try:
+        return json.dumps(obj, default=_json_default, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        return json.dumps(_finite(obj), separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON string or bytes.
+
+    Text written by the stdlib encoder with NaN or Infinity tokens (which
+    orjson rejects) is still accepted.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -4,12 +4,15 @@ import os
 import tempfile
 from datetime import date, datetime, timedelta
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
 
 from stock_finder.config import CacheConfig
 from stock_finder.data.cache import CacheManager
+from stock_finder.data.cached_provider import CachedDataProvider
+from stock_finder.models.results import StockData
 
 
 @pytest.fixture
@@ -120,6 +123,16 @@ class TestCacheManager:
         # Verify index values match
         assert list(cached_df.index) == list(sample_df.index)
 
+    def test_set_writes_zstd_parquet(self, cache_manager, sample_df):
+        """Test that cache files are written with zstd compression."""
+        import pyarrow.parquet as pq
+
+        cache_manager.set("AAPL", date(2023, 1, 1), date(2023, 4, 10), sample_df)
+
+        key = cache_manager._generate_cache_key("AAPL", date(2023, 1, 1), date(2023, 4, 10))
+        metadata = pq.ParquetFile(cache_manager._get_cache_path(key)).metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
     def test_get_missing_returns_none(self, cache_manager):
         """Test that getting missing data returns None."""
         result = cache_manager.get(
@@ -319,3 +332,95 @@ class TestCachePartialHit:
         assert result is not None
         assert result.index[0].date() >= date(2023, 3, 1)
         assert result.index[-1].date() <= date(2023, 6, 30)
+
+
+class TestCachedDataProviderBatch:
+    """Tests for CachedDataProvider.get_historical_batch."""
+
+    def test_fetches_only_misses(self, cache_manager, sample_df):
+        """Test that cached tickers are served locally and misses batched once."""
+        start, end = date(2023, 1, 1), date(2023, 4, 10)
+        cache_manager.set("AAPL", start, end, sample_df)
+
+        provider = MagicMock()
+        provider.get_historical_batch.return_value = {
+            "NVDA": StockData(ticker="NVDA", data=sample_df)
+        }
+        cached = CachedDataProvider(provider, cache_manager)
+
+        result = cached.get_historical_batch(["AAPL", "NVDA"], start, end)
+
+        assert sorted(result) == ["AAPL", "NVDA"]
+        provider.get_historical_batch.assert_called_once_with(["NVDA"], start, end)
+        assert cache_manager.exists("NVDA", start, end)
+
+
+class TestCachedDataProviderTail:
+    """Tests for extending a cached range with only the new tail."""
+
+    @staticmethod
+    def _prices(start: str, periods: int, offset: float = 0.0) -> pd.DataFrame:
+        dates = pd.date_range(start, periods=periods, freq="D")
+        close = [101.0 + offset + i for i in range(periods)]
+        return pd.DataFrame({"Close": close, "Volume": [1000] * periods}, index=dates)
+
+    def test_fetches_only_tail(self, cache_manager):
+        """A range cached up to an earlier day should only fetch the days after it."""
+        cached = self._prices("2023-01-01", 100)  # through 2023-04-10
+        cache_manager.set("AAPL", date(2023, 1, 1), date(2023, 4, 10), cached)
+        tail = self._prices("2023-04-10", 31, offset=99)
+
+        provider = MagicMock()
+        provider.get_historical.return_value = StockData(ticker="AAPL", data=tail)
+        result = CachedDataProvider(provider, cache_manager).get_historical(
+            "AAPL", date(2023, 1, 1), date(2023, 5, 10)
+        )
+
+        provider.get_historical.assert_called_once_with(
+            "AAPL", date(2023, 4, 10), date(2023, 5, 10)
+        )
+        assert len(result.data) == 130
+        assert result.data.index.is_unique
+        assert cache_manager.get("AAPL", date(2023, 1, 1), date(2023, 5, 10)) is not None
+        assert len(list(cache_manager.cache_dir.glob("AAPL_*.parquet"))) == 1
+
+    def test_refetches_when_history_changed(self, cache_manager):
+        """If the overlapping close no longer matches, the whole range is fetched."""
+        cached = self._prices("2023-01-01", 100)
+        cache_manager.set("AAPL", date(2023, 1, 1), date(2023, 4, 10), cached)
+        readjusted = StockData(ticker="AAPL", data=self._prices("2023-04-10", 31, offset=50))
+        full = StockData(ticker="AAPL", data=self._prices("2023-01-01", 130))
+
+        provider = MagicMock()
+        provider.get_historical.side_effect = [readjusted, full]
+        result = CachedDataProvider(provider, cache_manager).get_historical(
+            "AAPL", date(2023, 1, 1), date(2023, 5, 10)
+        )
+
+        assert provider.get_historical.call_args.args == (
+            "AAPL", date(2023, 1, 1), date(2023, 5, 10)
+        )
+        assert result is full
+
+    def test_batch_groups_tail_fetches(self, cache_manager):
+        """Tickers cached to the same day should share one batched tail fetch."""
+        start, end = date(2023, 1, 1), date(2023, 5, 10)
+        for ticker in ("AAPL", "MSFT"):
+            cache_manager.set(ticker, start, date(2023, 4, 10), self._prices("2023-01-01", 100))
+
+        tail = self._prices("2023-04-10", 31, offset=99)
+        provider = MagicMock()
+        provider.get_historical_batch.side_effect = [
+            {t: StockData(ticker=t, data=tail) for t in ("AAPL", "MSFT")},
+            {"NVDA": StockData(ticker="NVDA", data=self._prices("2023-01-01", 130))},
+        ]
+        result = CachedDataProvider(provider, cache_manager).get_historical_batch(
+            ["AAPL", "MSFT", "NVDA"], start, end
+        )
+
+        assert sorted(result) == ["AAPL", "MSFT", "NVDA"]
+        assert provider.get_historical_batch.call_args_list[0].args == (
+            ["AAPL", "MSFT"], date(2023, 4, 10), end
+        )
+        assert provider.get_historical_batch.call_args_list[1].args == (["NVDA"], start, end)
+        assert all(len(result[t].data) == 130 for t in result)
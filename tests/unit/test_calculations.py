@@ -2,10 +2,12 @@
 
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from stock_finder.utils.calculations import calculate_max_gain
+from stock_finder.utils.kernels import _max_drawup_loop, _max_drawup_numpy, max_drawup
 
 
 class TestCalculateMaxGain:
@@ -135,3 +137,25 @@ class TestCalculateMaxGain:
 
         assert result is not None
         assert result.gain_pct == 550.0  # 10 to 65
+
+
+class TestMaxDrawupKernels:
+    """Tests that the loop (numba) and vectorized kernels agree."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_numpy_kernel_matches_loop(self, seed):
+        """Random walks with ties and non-positive prices give identical answers."""
+        rng = np.random.default_rng(seed)
+        close = np.round(np.cumsum(rng.normal(0, 2, size=300)) + 20, 0)
+
+        low, high, gain = _max_drawup_loop(close)
+        np_low, np_high, np_gain = _max_drawup_numpy(close)
+
+        assert (np_low, np_high) == (low, high)
+        assert np_gain == pytest.approx(gain)
+
+    def test_no_gain_returns_negative_indices(self):
+        """A strictly falling series has no drawup."""
+        close = np.array([5.0, 4.0, 3.0, 2.0])
+        assert _max_drawup_numpy(close) == (-1, -1, 0.0)
+        assert max_drawup(close) == (-1, -1, 0.0)
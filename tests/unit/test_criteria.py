@@ -148,6 +148,45 @@ class TestScoringContext:
         assert position is not None
         assert position > 0.8  # Near the top of range
 
+    def test_precomputed_values_match_pandas(self, scoring_context, sample_historical_data):
+        """Precomputed 2-year values should match the direct pandas reductions."""
+        df = sample_historical_data
+        high_date = df["High"].idxmax().date()
+
+        assert scoring_context.two_year_high == df["High"].max()
+        assert scoring_context.two_year_low == df["Low"].min()
+        assert scoring_context.two_year_high_date == high_date
+        assert scoring_context.days_since_high == len(df.loc[str(high_date):])
+        assert scoring_context.running_high[-1] == df["High"].max()
+        assert (scoring_context.running_high == df["High"].cummax().to_numpy()).all()
+
+    def test_column_arrays_captured(self, scoring_context, sample_historical_data):
+        """OHLCV columns should be captured once as float64 arrays."""
+        assert scoring_context.high.dtype == "float64"
+        assert (scoring_context.volume == sample_historical_data["Volume"].to_numpy()).all()
+        assert len(scoring_context.index_epoch) == len(sample_historical_data)
+
+    def test_volume_at_ignition_uses_nearest_bar(self, scoring_context, sample_historical_data):
+        """An ignition date past the data should use the closest bar's volume."""
+        expected = sample_historical_data["Volume"].iloc[-1]
+        assert scoring_context.get_volume_at_ignition() == expected
+
+    def test_volume_stats_computed_once(self, scoring_context, sample_historical_data):
+        """Volume lookups should be memoized per context, keyed by window length."""
+        avg50 = scoring_context.get_avg_volume(50)
+        scoring_context.volume[:] = 0  # later reads must come from the cache
+
+        assert avg50 == sample_historical_data["Volume"].tail(50).mean()
+        assert scoring_context.get_avg_volume(50) == avg50
+        assert scoring_context.get_avg_volume(20) == 0
+
+    def test_precomputed_values_missing_data(self, context_missing_data):
+        """Without enough data the 2-year values should be None."""
+        assert context_missing_data.two_year_high is None
+        assert context_missing_data.two_year_high_date is None
+        assert context_missing_data.days_since_high is None
+        assert context_missing_data.running_high is None
+
     def test_estimated_market_cap(self, scoring_context):
         """Market cap should be shares * price."""
         cap = scoring_context.estimated_market_cap
@@ -779,6 +818,15 @@ class TestCriteriaContract:
             assert "value" in d
             assert "threshold" in d
             assert "details" in d
+            assert isinstance(d["details"], str) and d["details"]
+
+    def test_results_and_contexts_have_no_instance_dict(self, all_criteria, scoring_context):
+        """Results and contexts are slotted, so instances carry no __dict__."""
+        result = all_criteria[0].evaluate(scoring_context)
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(scoring_context, "__dict__")
+        assert isinstance(result.details, str) and result.details
 
 
 # =============================================================================
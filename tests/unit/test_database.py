@@ -0,0 +1,467 @@
+"""Unit tests for the SQLite Database layer."""
+
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stock_finder.analysis.models import TrendlineAnalysis
+from stock_finder.data import database
+from stock_finder.data.database import SCHEMA_VERSION, Database
+from stock_finder.models.results import NeumannScore
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        db = Database(db_path)
+        yield db
+
+
+def _trendline(ticker: str, timeframe: str, formed: bool, r_squared: float) -> TrendlineAnalysis:
+    return TrendlineAnalysis(
+        ticker=ticker,
+        scan_result_id=1,
+        timeframe=timeframe,
+        trendline_formed=formed,
+        r_squared=r_squared,
+        gain_pct=500.0,
+        break_date=date(2024, 1, 15),
+    )
+
+
+class TestEnumColumns:
+    """Tests for status/timeframe columns stored as INTEGER codes."""
+
+    def test_scan_run_status_round_trip(self, temp_db):
+        """Test that scan run status is stored as a code and read back as a name."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        assert temp_db.get_scan_run(run_id)["status"] == "running"
+
+        temp_db.complete_scan_run(run_id)
+        assert temp_db.get_scan_run(run_id)["status"] == "completed"
+        assert temp_db.get_all_scan_runs()[0]["status"] == "completed"
+
+        with sqlite3.connect(temp_db.db_path) as conn:
+            raw = conn.execute("SELECT typeof(status) FROM scan_runs").fetchone()[0]
+        assert raw == "integer"
+
+    def test_scan_run_timestamps_set_by_sqlite(self, temp_db):
+        """Test that start and completion times are filled in by the database."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        assert temp_db.get_scan_run(run_id)["started_at"]
+        assert temp_db.get_scan_run(run_id)["completed_at"] is None
+
+        temp_db.complete_scan_run(run_id)
+        run = temp_db.get_scan_run(run_id)
+        assert run["completed_at"] >= run["started_at"]
+
+    def test_trendline_timeframe_round_trip(self, temp_db):
+        """Test that timeframe filters work and names are restored on read."""
+        temp_db.add_trendline_analysis(_trendline("AAA", "daily", True, 0.95))
+        temp_db.add_trendline_analysis(_trendline("BBB", "weekly", False, 0.50))
+
+        daily = temp_db.get_trendline_analyses(timeframe="daily")
+        assert [r["ticker"] for r in daily] == ["AAA"]
+        assert daily[0]["timeframe"] == "daily"
+        assert daily[0]["trendline_formed"] == 1
+
+        weekly = temp_db.get_trendline_analyses(timeframe="weekly")
+        assert [r["ticker"] for r in weekly] == ["BBB"]
+        assert weekly[0]["timeframe"] == "weekly"
+
+        assert temp_db.get_trendline_stats(timeframe="daily")["total"] == 1
+        assert temp_db.clear_trendline_analyses(timeframe="weekly") == 1
+
+    def test_legacy_text_rows_are_migrated(self, temp_db):
+        """Test that rows written with TEXT enums are converted on open."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            conn.execute(
+                "INSERT INTO scan_runs (started_at, min_gain_pct, lookback_years, status) "
+                "VALUES ('2024-01-01', 500, 3, 'completed')"
+            )
+            conn.execute("PRAGMA user_version = 0")  # database predating schema versioning
+
+        db = Database(temp_db.db_path)
+        assert db.get_all_scan_runs()[0]["status"] == "completed"
+
+
+class TestSchemaVersion:
+    """Tests for skipping schema setup on up-to-date databases."""
+
+    def test_new_database_records_schema_version(self, temp_db):
+        """Test that initialization stamps PRAGMA user_version."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_current_version_skips_schema_script(self, temp_db):
+        """Test that reopening a current database does not rerun the schema script."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            conn.execute("DROP INDEX idx_results_ticker")
+
+        Database(temp_db.db_path)
+
+        with sqlite3.connect(temp_db.db_path) as conn:
+            index = conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'idx_results_ticker'"
+            ).fetchone()
+        assert index is None
+
+
+class TestResearchIndex:
+    """Tests for the covering index behind the research queries."""
+
+    def test_research_scan_is_index_only(self, temp_db):
+        """Test a gain-filtered aggregate reads only the covering index."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            plan = conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT AVG(CASE WHEN pct_from_sma200 < 0 THEN gain_pct END), COUNT(DISTINCT ticker)
+                FROM neumann_scores WHERE gain_pct < ?
+                """,
+                (50000,),
+            ).fetchall()
+
+        assert any("COVERING INDEX idx_neumann_research" in row[-1] for row in plan)
+
+
+class TestRowFactory:
+    """Tests for rows returned as plain dicts."""
+
+    def test_get_scan_run_returns_dict(self, temp_db):
+        """Test that single-row getters return dicts and None when missing."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+
+        run = temp_db.get_scan_run(run_id)
+        assert type(run) is dict
+        assert run["id"] == run_id
+        assert temp_db.get_latest_scan_run()["id"] == run_id
+        assert temp_db.get_scan_run(run_id + 1) is None
+
+
+class TestSharedConnection:
+    """Tests for the shared, lock-guarded connection."""
+
+    def test_concurrent_reads(self, temp_db):
+        """Test that many threads can read through the shared connection."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            runs = list(executor.map(lambda _: temp_db.get_scan_run(run_id), range(100)))
+
+        assert all(run["id"] == run_id for run in runs)
+
+    def test_failed_block_rolls_back(self, temp_db):
+        """Test that an exception inside a block rolls back its writes."""
+        with pytest.raises(RuntimeError):
+            with temp_db._get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO scan_runs (started_at, min_gain_pct, lookback_years) "
+                    "VALUES ('2024-01-01', 500, 3)"
+                )
+                raise RuntimeError("boom")
+
+        assert temp_db.get_all_scan_runs() == []
+
+
+class TestMaintenance:
+    """Tests for Database.maintain()."""
+
+    def test_new_database_uses_incremental_auto_vacuum(self, temp_db):
+        """Test that fresh databases are created with incremental auto-vacuum."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        assert mode == 2  # INCREMENTAL
+
+    def test_wal_journal_mode(self, temp_db):
+        """Test that the database is opened in WAL mode."""
+        with sqlite3.connect(temp_db.db_path) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    @pytest.mark.parametrize("vacuum", [False, True])
+    def test_maintain_preserves_data(self, temp_db, vacuum):
+        """Test that maintenance runs without touching stored rows."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.maintain(analyze=True, vacuum=vacuum)
+        assert temp_db.get_scan_run(run_id) is not None
+
+    def test_vacuum_with_open_results_iterator(self, temp_db, sample_scan_result):
+        """Test that VACUUM is not blocked by an unfinished iter_results() generator."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_results(run_id, [replace(sample_scan_result, ticker=f"T{i}") for i in range(5)])
+
+        it = temp_db.iter_results(batch_size=2)
+        next(it)
+        temp_db.maintain(vacuum=True)
+
+        assert len(list(it)) == 4
+
+
+class TestAggregateStats:
+    """Tests for aggregate stats on empty and populated tables."""
+
+    def test_empty_neumann_stats_are_zero(self, temp_db):
+        """Test that stats on an empty table return zeros rather than None."""
+        stats = temp_db.get_neumann_score_stats()
+        assert stats == {"distribution": [], "total": 0, "avg_score": 0.0, "avg_gain": 0.0}
+
+    def test_empty_trendline_stats_are_zero(self, temp_db):
+        """Test that trendline stats on an empty table return zeros."""
+        stats = temp_db.get_trendline_stats()
+        assert stats["total"] == 0
+        assert stats["formed"] == 0
+        assert stats["formed_pct"] == 0
+        assert stats["avg_touches"] == 0
+        assert stats["quality_distribution"] == []
+
+    def test_trendline_formed_pct(self, temp_db):
+        """Test that formed_pct is computed in SQL."""
+        temp_db.add_trendline_analysis(_trendline("AAA", "daily", True, 0.95))
+        temp_db.add_trendline_analysis(_trendline("BBB", "daily", False, 0.50))
+        temp_db.add_trendline_analysis(_trendline("CCC", "daily", True, 0.80))
+        temp_db.add_trendline_analysis(_trendline("DDD", "daily", False, 0.30))
+
+        stats = temp_db.get_trendline_stats()
+        assert stats["total"] == 4
+        assert stats["formed"] == 2
+        assert stats["formed_pct"] == 50.0
+
+
+class TestWriteQueue:
+    """Tests for the background group-commit writer."""
+
+    def test_concurrent_add_result(self, temp_db, sample_scan_result):
+        """Test that results added from many threads all land with unique IDs."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        results = [replace(sample_scan_result, ticker=f"T{i}") for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda r: temp_db.add_result(run_id, r), results))
+
+        assert len(set(ids)) == 200
+        assert len(temp_db.get_results(scan_run_id=run_id)) == 200
+        assert temp_db.get_scan_run(run_id)["results_count"] == 200
+
+    def test_failed_write_does_not_affect_others(self, temp_db, sample_scan_result):
+        """Test that a failing job raises to its caller without losing the batch."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.add_result(run_id, replace(sample_scan_result, gain_pct=None))
+        temp_db.add_result(run_id, sample_scan_result)
+
+        assert [r["ticker"] for r in temp_db.get_results()] == ["TEST"]
+
+    def test_queued_results_from_many_threads(self, temp_db, sample_scan_result):
+        """Test that queued results are committed with unique IDs in input order."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        results = [replace(sample_scan_result, ticker=f"T{i}") for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = list(executor.map(lambda r: temp_db.queue_results(run_id, [r]), results))
+        ids = [future.result()[0] for future in futures]
+
+        assert len(set(ids)) == 200
+        assert temp_db.get_scan_run(run_id)["results_count"] == 200
+
+    def test_write_inside_held_transaction(self, temp_db, sample_scan_result):
+        """Test that add_* joins a transaction the caller holds instead of deadlocking."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+
+        with temp_db._get_connection() as conn:
+            conn.execute("UPDATE scan_runs SET status = 'running' WHERE id = ?", (run_id,))
+            [result_id] = temp_db.add_results(run_id, [sample_scan_result])
+            temp_db.add_neumann_score(
+                NeumannScore(ticker="TEST", scan_result_id=result_id, score=3)
+            )
+
+        assert temp_db.get_results()[0]["id"] == result_id
+        assert len(temp_db.get_neumann_scores()) == 1
+
+    def test_close_stops_writer(self, temp_db, sample_scan_result):
+        """Test that close() stops the writer after flushing its writes."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.queue_results(run_id, [sample_scan_result])
+        temp_db.close()
+        assert temp_db._writer is None
+
+        assert len(Database(temp_db.db_path).get_results()) == 1
+
+
+class TestBulkInserts:
+    """Tests for add_results / add_neumann_scores."""
+
+    def test_add_results_returns_ids_in_order(self, temp_db, sample_scan_result):
+        """Test that bulk insert returns one ID per result and updates the count."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_result(run_id, sample_scan_result)
+
+        results = [replace(sample_scan_result, ticker=f"T{i}") for i in range(5)]
+        ids = temp_db.add_results(run_id, results)
+
+        assert len(ids) == 5
+        by_id = {r["id"]: r["ticker"] for r in temp_db.get_results(scan_run_id=run_id)}
+        assert [by_id[i] for i in ids] == ["T0", "T1", "T2", "T3", "T4"]
+        assert temp_db.get_scan_run(run_id)["results_count"] == 6
+
+    def test_add_results_empty(self, temp_db):
+        """Test that an empty batch is a no-op."""
+        assert temp_db.add_results(1, []) == []
+
+    def test_add_neumann_scores(self, temp_db):
+        """Test bulk insert of Neumann scores."""
+        scores = [
+            NeumannScore(ticker=f"S{i}", scan_result_id=i, score=i, criteria_results=())
+            for i in range(3)
+        ]
+        ids = temp_db.add_neumann_scores(scores)
+
+        assert len(ids) == 3
+        assert [s["ticker"] for s in temp_db.get_neumann_scores()] == ["S2", "S1", "S0"]
+
+    def test_bulk_load_neumann_scores_rebuilds_indexes(self, temp_db):
+        """Test that bulk loading inserts all rows and restores the indexes."""
+        scores = [
+            NeumannScore(ticker=f"S{i}", scan_result_id=i, score=i % 4, criteria_results=())
+            for i in range(50)
+        ]
+        ids = temp_db.bulk_load_neumann_scores(scores)
+
+        assert len(ids) == 50
+        assert len(temp_db.get_neumann_scores()) == 50
+        with sqlite3.connect(temp_db.db_path) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'neumann_scores'"
+                )
+            }
+        assert {"idx_neumann_score", "idx_neumann_ticker", "idx_neumann_scan_result"} <= indexes
+
+    def test_add_neumann_scores_rebuilds_only_for_large_batches(self, temp_db, monkeypatch):
+        """Index rebuilds should happen only when the batch outnumbers the table."""
+        monkeypatch.setattr(database, "BULK_LOAD_MIN_ROWS", 5)
+
+        def pop_analyzed() -> bool:
+            """Whether ANALYZE ran since the last call (its statistics are then cleared)."""
+            with sqlite3.connect(temp_db.db_path) as conn:
+                tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+                if "sqlite_stat1" not in tables:
+                    return False
+                count = conn.execute("SELECT count(*) FROM sqlite_stat1").fetchone()[0]
+                conn.execute("DELETE FROM sqlite_stat1")
+                return count > 0
+
+        def batch(n: int) -> list[NeumannScore]:
+            return [
+                NeumannScore(ticker=f"S{i}", scan_result_id=i, score=1, criteria_results=())
+                for i in range(n)
+            ]
+
+        temp_db.add_neumann_scores(batch(6))
+        assert pop_analyzed()  # first load into an empty table
+
+        temp_db.add_neumann_scores(batch(4))
+        temp_db.add_neumann_scores(batch(8))
+        assert not pop_analyzed()  # too small, then not larger than the 10 existing rows
+
+        assert len(temp_db.get_neumann_scores()) == 18
+
+
+class TestIterResults:
+    """Tests for streaming scan results."""
+
+    def test_iter_results_streams_in_batches(self, temp_db, sample_scan_result):
+        """Test that iter_results yields every row across several batches."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_results(
+            run_id,
+            [replace(sample_scan_result, ticker=f"T{i}", gain_pct=500.0 + i) for i in range(25)],
+        )
+
+        rows = list(temp_db.iter_results(scan_run_id=run_id, batch_size=10))
+
+        assert len(rows) == 25
+        assert rows[0]["ticker"] == "T24"  # sorted by gain desc
+        assert rows == temp_db.get_results(scan_run_id=run_id)
+
+    def test_filter_combinations(self, temp_db, sample_scan_result):
+        """Test every filter combination of get_results against the same data."""
+        run_1 = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        run_2 = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_results(run_1, [replace(sample_scan_result, gain_pct=g) for g in (500.0, 700.0, 900.0)])
+        temp_db.add_results(run_2, [replace(sample_scan_result, gain_pct=800.0)])
+
+        assert len(temp_db.get_results()) == 4
+        assert len(temp_db.get_results(scan_run_id=run_1)) == 3
+        assert len(temp_db.get_results(min_gain=750)) == 2
+        assert len(temp_db.get_results(scan_run_id=run_1, min_gain=750)) == 1
+        assert [r["gain_pct"] for r in temp_db.get_results(limit=2)] == [900.0, 800.0]
+        assert [r["gain_pct"] for r in temp_db.get_results(scan_run_id=run_1, min_gain=600, limit=1)] == [900.0]
+
+    def test_abandoned_iterator_releases_lock(self, temp_db, sample_scan_result):
+        """Test that a partially consumed iterator does not block other calls."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_results(run_id, [replace(sample_scan_result, ticker=f"T{i}") for i in range(5)])
+
+        it = temp_db.iter_results(batch_size=2)
+        next(it)
+
+        result = ThreadPoolExecutor(max_workers=1).submit(temp_db.get_scan_run, run_id)
+        assert result.result(timeout=5)["id"] == run_id
+
+
+class TestNeumannCriteriaJson:
+    """Tests for criteria_results JSON round-tripping."""
+
+    def test_criteria_results_round_trip(self, temp_db):
+        """Test that numpy values serialize and the raw JSON column is dropped."""
+        criteria = (("drawdown", np.bool_(True), np.float64(72.5), np.float64(-0.5), "deep"),)
+        temp_db.add_neumann_score(
+            NeumannScore(ticker="AAA", scan_result_id=1, score=1, criteria_results=criteria)
+        )
+
+        row = temp_db.get_neumann_scores()[0]
+        assert "criteria_json" not in row
+        assert row["criteria_results"] == {
+            "drawdown": {
+                "name": "drawdown",
+                "passed": True,
+                "value": 72.5,
+                "threshold": -0.5,
+                "details": "deep",
+            }
+        }
+
+
+class TestTopGainers:
+    """Tests for get_top_gainers."""
+
+    def test_returns_best_row_per_ticker(self, temp_db, sample_scan_result):
+        """Test that each ticker's columns come from its highest-gain row."""
+        run_id = temp_db.start_scan_run(min_gain_pct=500, lookback_years=3)
+        temp_db.add_results(
+            run_id,
+            [
+                replace(sample_scan_result, ticker="AAA", gain_pct=600.0, low_price=10.0),
+                replace(sample_scan_result, ticker="AAA", gain_pct=900.0, low_price=5.0),
+                replace(sample_scan_result, ticker="BBB", gain_pct=700.0, low_price=8.0),
+            ],
+        )
+
+        gainers = temp_db.get_top_gainers()
+
+        assert [(g["ticker"], g["gain_pct"], g["low_price"]) for g in gainers] == [
+            ("AAA", 900.0, 5.0),
+            ("BBB", 700.0, 8.0),
+        ]
+
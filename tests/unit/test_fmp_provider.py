@@ -1,5 +1,6 @@
 """Tests for FMP provider."""
 
+import json
 import os
 import pytest
 from unittest.mock import patch, MagicMock
@@ -9,6 +10,13 @@ from stock_finder.data.fmp_provider import FMPProvider, Quote
 from stock_finder.config import FMPConfig
 
 
+def _mock_response(payload) -> MagicMock:
+    """Create a mock HTTP response carrying a JSON payload."""
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
 class TestFMPProvider:
     """Tests for FMPProvider class."""
 
@@ -61,11 +69,10 @@ class TestFMPProvider:
         assert quote.market_cap == 2500000000000
         assert quote.price_avg_50 == 145.0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_quote(self, mock_get, provider):
         """Test getting a single quote."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
+        mock_get.return_value = _mock_response([
             {
                 "symbol": "AAPL",
                 "price": 150.0,
@@ -82,8 +89,7 @@ class TestFMPProvider:
                 "exchange": "NASDAQ",
                 "name": "Apple Inc.",
             }
-        ]
-        mock_get.return_value = mock_response
+        ])
 
         quote = provider.get_quote("AAPL")
 
@@ -92,18 +98,16 @@ class TestFMPProvider:
         assert quote.price == 150.0
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_historical(self, mock_get, provider):
         """Test getting historical data."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_get.return_value = _mock_response({
             "symbol": "AAPL",
             "historical": [
                 {"date": "2024-01-03", "open": 148.0, "high": 150.0, "low": 147.0, "close": 149.0, "volume": 1000000},
                 {"date": "2024-01-02", "open": 147.0, "high": 149.0, "low": 146.0, "close": 148.0, "volume": 900000},
             ],
-        }
-        mock_get.return_value = mock_response
+        })
 
         result = provider.get_historical("AAPL", date(2024, 1, 1), date(2024, 1, 5))
 
@@ -112,20 +116,21 @@ class TestFMPProvider:
         assert len(result.data) == 2
         assert "Close" in result.data.columns
         assert "Volume" in result.data.columns
+        assert list(result.data.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert result.data.index.is_monotonic_increasing
+        assert result.data["Close"].iloc[-1] == 149.0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_quotes_batch(self, mock_get, provider):
         """Test batch quote fetching."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
+        mock_get.return_value = _mock_response([
             {"symbol": "AAPL", "price": 150.0, "changesPercentage": 1.5, "dayLow": 148.0, "dayHigh": 152.0,
              "yearLow": 120.0, "yearHigh": 180.0, "marketCap": 2500000000000, "avgVolume": 50000000,
              "volume": 45000000, "priceAvg50": 145.0, "priceAvg200": 140.0, "exchange": "NASDAQ", "name": "Apple"},
             {"symbol": "NVDA", "price": 500.0, "changesPercentage": 2.0, "dayLow": 495.0, "dayHigh": 510.0,
              "yearLow": 300.0, "yearHigh": 550.0, "marketCap": 1200000000000, "avgVolume": 40000000,
              "volume": 35000000, "priceAvg50": 480.0, "priceAvg200": 400.0, "exchange": "NASDAQ", "name": "NVIDIA"},
-        ]
-        mock_get.return_value = mock_response
+        ])
 
         quotes = provider.get_quotes_batch(["AAPL", "NVDA"])
 
@@ -135,6 +140,35 @@ class TestFMPProvider:
         assert quotes["AAPL"].price == 150.0
         assert quotes["NVDA"].price == 500.0
 
+    @patch("requests.Session.get")
+    def test_get_quotes_batch_splits_requests(self, mock_get, mock_config):
+        """Test that tickers are split into batches fetched concurrently."""
+        mock_config.batch_size = 2
+
+        def fake_get(url, params=None, timeout=None):
+            symbols = url.rsplit("/", 1)[-1].split(",")
+            return _mock_response([{"symbol": s, "price": 1.0} for s in symbols])
+
+        mock_get.side_effect = fake_get
+        provider = FMPProvider(config=mock_config)
+
+        quotes = provider.get_quotes_batch(["A", "B", "C", "D", "E"])
+
+        assert sorted(quotes) == ["A", "B", "C", "D", "E"]
+        assert mock_get.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_get_market_caps_batch(self, mock_get, provider):
+        """Test that market caps are read from raw quotes, skipping missing values."""
+        mock_get.return_value = _mock_response([
+            {"symbol": "AAPL", "marketCap": 2500000000000},
+            {"symbol": "NOCAP", "marketCap": None},
+        ])
+
+        caps = provider.get_market_caps_batch(["AAPL", "NOCAP"])
+
+        assert caps == {"AAPL": 2500000000000}
+
 
 @pytest.mark.integration
 class TestFMPProviderIntegration:
@@ -0,0 +1,73 @@
+"""Tests for NASDAQ FTP ticker lists."""
+
+import io
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from stock_finder.data import nasdaq_ftp
+
+SYMBOL_FILE = b"""Nasdaq Traded|Symbol|Security Name|Listing Exchange|Market Category|ETF|Round Lot Size|Test Issue|Financial Status|CQS Symbol|NASDAQ Symbol|NextShares
+Y|AAPL|Apple Inc. |Q|Q|N|100|N|N||AAPL|N
+Y|SPY|SPDR S&P 500|P| |Y|100|N||SPY|SPY|N
+Y|ZTEST|Test Issue|Q|Q|N|100|Y|N||ZTEST|N
+N|OLD|Not Traded|N| |N|100|N||OLD|OLD|N
+Y|BRK.A|Berkshire Hathaway|N| |N|100|N||BRK.A|BRK.A|N
+Y|IBM|IBM Corp|N| |N|100|N||IBM|IBM|N
+File Creation Time: 0101202400:00|||||||||||
+"""
+
+
+@pytest.fixture
+def ftp(tmp_path, monkeypatch):
+    """Point the symbol-file cache at a temp dir and fake the FTP download."""
+    monkeypatch.setattr(nasdaq_ftp, "NASDAQ_CACHE_PATH", tmp_path / "nasdaqtraded.txt")
+    nasdaq_ftp._cached_common_stock_tickers.cache_clear()
+    with patch("urllib.request.urlopen", side_effect=lambda *a, **k: io.BytesIO(SYMBOL_FILE)) as urlopen:
+        yield urlopen
+    nasdaq_ftp._cached_common_stock_tickers.cache_clear()
+
+
+class TestFetchNasdaqTickers:
+    """Tests for fetch_nasdaq_tickers."""
+
+    def test_filters_to_common_stocks(self, ftp):
+        """Test that ETFs, test issues, untraded and special symbols are dropped."""
+        df = nasdaq_ftp.fetch_nasdaq_tickers()
+        assert df["symbol"].tolist() == ["AAPL", "IBM"]
+        assert df["name"].tolist() == ["Apple Inc.", "IBM Corp"]
+
+    def test_etf_and_exchange_filters(self, ftp):
+        """Test include_etfs and exchanges arguments."""
+        df = nasdaq_ftp.fetch_nasdaq_tickers(include_etfs=True, exchanges=["P", "Q"])
+        assert df["symbol"].tolist() == ["AAPL", "SPY"]
+        assert df["etf"].tolist() == [False, True]
+
+    def test_fresh_file_is_reused(self, ftp):
+        """Test that a download within the TTL is served from disk."""
+        nasdaq_ftp.fetch_nasdaq_tickers()
+        nasdaq_ftp.fetch_nasdaq_tickers()
+        assert ftp.call_count == 1
+
+    def test_stale_file_is_refetched(self, ftp):
+        """Test that a file older than the TTL is downloaded again."""
+        nasdaq_ftp.fetch_nasdaq_tickers()
+        stale = time.time() - (nasdaq_ftp.NASDAQ_CACHE_TTL_HOURS + 1) * 3600
+        os.utime(nasdaq_ftp.NASDAQ_CACHE_PATH, (stale, stale))
+
+        nasdaq_ftp.fetch_nasdaq_tickers()
+        assert ftp.call_count == 2
+
+
+class TestCommonStockTickers:
+    """Tests for memoized ticker lists."""
+
+    def test_repeat_calls_are_memoized(self, ftp):
+        """Test that repeated lookups parse the file once per exchange set."""
+        with patch.object(nasdaq_ftp, "fetch_nasdaq_tickers", wraps=nasdaq_ftp.fetch_nasdaq_tickers) as fetch:
+            assert nasdaq_ftp.get_nyse_tickers() == ["IBM"]
+            assert nasdaq_ftp.get_nyse_tickers() == ["IBM"]
+            assert nasdaq_ftp.get_all_us_tickers() == ["AAPL", "IBM"]
+        assert fetch.call_count == 2
@@ -0,0 +1,461 @@
+"""Unit tests for research queries."""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from stock_finder.data.database import Database
+from stock_finder.research.queries import (
+    FILTERED_TABLE,
+    QueryResult,
+    ResearchQueries,
+    _round,
+)
+from stock_finder.research.runner import ResearchRunner
+
+# (ticker, score, drawdown, days_since_high, range_position, pct_from_sma50,
+#  pct_from_sma200, vol_ratio, gain_pct, days_to_peak)
+ROWS = [
+    ("AAA", 6, -0.90, 400, 0.05, -0.2, -0.4, 0.4, 900.0, 200),
+    ("BBB", 5, -0.70, 200, 0.08, -0.1, -0.3, 0.7, 500.0, 120),
+    ("CCC", 3, -0.40, 100, 0.30, 0.1, -0.1, 0.9, 300.0, 60),
+    ("DDD", 2, -0.20, 30, 0.60, 0.2, 0.1, 1.2, 150.0, 20),
+    ("EEE", 1, None, None, None, None, None, None, 120.0, 10),
+    ("FFF", 4, -0.95, 500, 0.02, -0.3, -0.5, 0.3, 99999.0, 400),
+]
+
+
+@pytest.fixture
+def research_db():
+    """Create a temporary database populated with Neumann scores."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        Database(db_path).close()
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO neumann_scores (
+                    scan_result_id, ticker, score, criteria_json, drawdown,
+                    days_since_high, range_position, pct_from_sma50, pct_from_sma200,
+                    vol_ratio, gain_pct, days_to_peak
+                ) VALUES (1, ?, ?, '{}', ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                ROWS,
+            )
+            conn.executemany(
+                "INSERT INTO themes (ticker, theme, wave) VALUES (?, ?, ?)",
+                [("AAA", "AI", 1), ("BBB", "AI", 1), ("CCC", "Nuclear", 2)],
+            )
+            conn.execute(
+                """
+                INSERT INTO scan_results (
+                    id, scan_run_id, ticker, gain_pct, low_price, low_date,
+                    high_price, high_date, current_price, days_to_peak
+                ) VALUES (1, 1, 'AAA', 900.0, 1.0, '2023-03-15', 10.0, '2023-10-01', 9.0, 200)
+                """
+            )
+        yield db_path
+
+
+class TestCriteriaLift:
+    """Tests for ResearchQueries.criteria_lift."""
+
+    def test_matches_per_criterion_scan(self, research_db):
+        """Test the single-pass query matches one scan per criterion."""
+        results = {r.finding_key: r for r in ResearchQueries(research_db).criteria_lift()}
+
+        drawdown_50 = results["drawdown_50"]
+        assert drawdown_50.metrics["count_pass"] == 2
+        assert drawdown_50.metrics["count_fail"] == 2
+        assert drawdown_50.metrics["avg_when_pass"] == 700.0
+        assert drawdown_50.metrics["avg_when_fail"] == 225.0
+        assert drawdown_50.metrics["lift"] == round(700.0 / 225.0, 2)
+        # Rows with a NULL drawdown are neither pass nor fail
+        assert drawdown_50.sample_size == 4
+
+    def test_skips_criteria_without_both_sides(self, research_db):
+        """Test criteria where every row passes produce no finding."""
+        results = {r.finding_key: r for r in ResearchQueries(research_db).criteria_lift(max_gain=200)}
+
+        assert "drawdown_50" not in results
+
+    def test_empty_table(self):
+        """Test an empty table yields no findings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            Database(db_path).close()
+            assert list(ResearchQueries(db_path).criteria_lift()) == []
+
+
+class TestGroupedAnalyses:
+    """Tests for analyses that share one join across two groupings."""
+
+    def test_theme_analyses(self, research_db):
+        """Test theme and themed/unthemed groupings come from one query."""
+        queries = ResearchQueries(research_db)
+        results = {(r.finding_type, r.finding_key): r for r in queries.theme_analyses()}
+
+        ai = results[("theme_performance", "ai_wave1")]
+        assert ai.sample_size == 2
+        assert ai.metrics["avg_gain"] == 700
+        # Highest gain, not the lexicographically largest label
+        assert ai.metrics["top_performer"] == "AAA: 900.0%"
+        assert results[("theme_performance", "nuclear_wave2")].sample_size == 1
+        assert results[("theme_comparison", "themed")].sample_size == 3
+        assert results[("theme_comparison", "unthemed")].sample_size == 2
+
+        assert list(queries.theme_performance()) == [
+            r for r in queries.theme_analyses() if r.finding_type == "theme_performance"
+        ]
+        assert [r.finding_key for r in queries.themed_vs_unthemed()] == ["themed", "unthemed"]
+
+    def test_timing_analyses(self, research_db):
+        """Test month and year groupings come from one query."""
+        queries = ResearchQueries(research_db)
+        results = list(queries.timing_analyses())
+
+        assert [(r.finding_type, r.finding_key) for r in results] == [
+            ("timing_month", "mar"),
+            ("timing_year", "2023"),
+        ]
+        assert all(r.sample_size == 5 for r in results)
+        assert list(queries.timing_by_month()) == results[:1]
+        assert list(queries.timing_by_year()) == results[1:]
+
+
+class TestScoreProfiles:
+    """Tests for the NumPy-bucketed score and volume analyses."""
+
+    def test_score_distribution(self, research_db):
+        """Test rows are grouped by score, highest first."""
+        results = list(ResearchQueries(research_db).score_distribution())
+
+        keys = [r.finding_key for r in results]
+        assert keys == ["score_6", "score_5", "score_3", "score_2", "score_1"]
+        assert results[0].metrics == {"avg_gain": 900.0, "avg_days": 200.0}
+
+    def test_simulated_score_skips_unknown_inputs(self, research_db):
+        """Test rows missing drawdown or volume are excluded from the weighted score."""
+        queries = ResearchQueries(research_db)
+        results = {r.finding_key: r for r in queries.simulated_score_distribution()}
+
+        # AAA: 3 + 2 + 2, BBB: 2 + 1 + 2, CCC/DDD: 0
+        assert results["score_7"].sample_size == 1
+        assert results["score_5"].sample_size == 1
+        assert results["score_0"].sample_size == 2
+        assert sum(r.sample_size for r in results.values()) == 4
+
+    def test_volume_profile(self, research_db):
+        """Test volume buckets come lowest first with velocity."""
+        results = list(ResearchQueries(research_db).volume_profile())
+
+        assert [r.finding_key for r in results] == ["very_low", "low", "below_avg", "normal"]
+        assert results[0].metrics == {"avg_gain": 900.0, "avg_days": 200.0, "velocity": 4.5}
+
+    def test_empty_table(self):
+        """Test an empty table yields no profiles."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            Database(db_path).close()
+            assert list(ResearchQueries(db_path).score_profiles()) == []
+
+
+class TestQueryPlans:
+    """Tests that the research joins use indexes on both sides."""
+
+    def test_timing_join_probes_scan_results_by_key(self, research_db):
+        """Test scores drive the join and scan_results is looked up by rowid."""
+        plan = ResearchQueries(research_db).explain(
+            """
+            SELECT ns.gain_pct, ns.days_to_peak, sr.low_date
+            FROM neumann_scores ns
+            JOIN scan_results sr ON ns.scan_result_id = sr.id
+            WHERE ns.gain_pct < ? AND sr.low_date IS NOT NULL
+            """,
+            (50000,),
+        )
+
+        assert "COVERING INDEX idx_neumann_research" in plan[0]
+        assert "INTEGER PRIMARY KEY" in plan[1]
+
+    def test_theme_join_uses_ticker_index(self, research_db):
+        """Test themes is probed by ticker rather than scanned."""
+        plan = ResearchQueries(research_db).explain(
+            """
+            SELECT ns.ticker, t.theme
+            FROM neumann_scores ns
+            LEFT JOIN themes t ON ns.ticker = t.ticker
+            WHERE ns.gain_pct < ?
+            """,
+            (50000,),
+        )
+
+        assert plan[1].startswith("SEARCH t")
+
+
+class TestSharedConnection:
+    """Tests for the cached ResearchQueries connection."""
+
+    def test_connection_is_cached(self, research_db):
+        """Test queries reuse one connection until closed."""
+        queries = ResearchQueries(research_db)
+        conn = queries.connection()
+
+        assert queries.connection() is conn
+        list(queries.summary_stats())
+        assert queries.connection() is conn
+
+        queries.close()
+        assert queries.connection() is not conn
+        queries.close()
+
+    def test_read_only_connection(self, research_db):
+        """Test a read_only instance cannot write through its shared connection."""
+        queries = ResearchQueries(research_db, read_only=True)
+
+        assert next(queries.summary_stats()).sample_size == 5
+        with pytest.raises(sqlite3.OperationalError):
+            queries.connection().execute("DELETE FROM neumann_scores")
+        queries.close()
+
+    def test_explicit_connection_is_used(self, research_db):
+        """Test a passed-in connection is used instead of the cached one."""
+        queries = ResearchQueries(research_db)
+        conn = sqlite3.connect(research_db)
+        conn.row_factory = sqlite3.Row
+
+        results = list(queries.summary_stats(conn=conn))
+
+        assert results[0].sample_size == 5
+        assert queries._conn is None
+        conn.close()
+
+
+class TestConnectionPool:
+    """Tests for concurrent analyses on read-only connections."""
+
+    def test_pool_connections_are_read_only(self, research_db):
+        """Test pooled connections reject writes."""
+        queries = ResearchQueries(research_db)
+
+        with queries.connection_pool(size=2) as pool:
+            assert pool.qsize() == 2
+            conn = pool.get()
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM neumann_scores")
+            pool.put(conn)
+
+    def test_pool_connections_read_one_snapshot(self, research_db):
+        """Test pooled connections keep their snapshot while another connection writes."""
+        queries = ResearchQueries(research_db)
+
+        with queries.connection_pool(size=1) as pool:
+            conn = pool.get()
+            assert conn.in_transaction
+            [before] = [r.sample_size for r in queries.summary_stats(conn=conn)]
+
+            with sqlite3.connect(research_db) as writer:
+                writer.execute("DELETE FROM neumann_scores WHERE ticker = 'AAA'")
+
+            assert next(queries.summary_stats(conn=conn)).sample_size == before
+            pool.put(conn)
+
+        assert next(queries.summary_stats()).sample_size == before - 1
+
+    def test_full_analysis_matches_sequential(self, research_db):
+        """Test concurrent full analysis stores the same findings as running each query."""
+        runner = ResearchRunner(research_db, max_workers=3)
+
+        summary = runner.run_full_analysis(run_id="concurrent")
+        findings = runner.db.get_findings(run_id="concurrent")
+
+        assert summary["findings_count"] == len(findings)
+        lift = {
+            (f["finding_key"], f["metric_name"]): f["metric_value"]
+            for f in findings
+            if f["finding_type"] == "criteria_lift"
+        }
+        for result in runner.queries.criteria_lift():
+            for metric_name, value in result.metrics.items():
+                assert lift[(result.finding_key, metric_name)] == value
+        runner.db.close()
+
+    def test_filtered_table_matches_source(self, research_db):
+        """Test queries on the materialized table match queries on neumann_scores."""
+        queries = ResearchQueries(research_db)
+
+        with queries.connection_pool(size=1, max_gain=50000) as pool:
+            conn = pool.get()
+            count = conn.execute(f"SELECT COUNT(*) FROM {FILTERED_TABLE}").fetchone()[0]
+            for method in (queries.criteria_lift, queries.summary_stats, queries.volume_profile):
+                assert list(method(conn=conn, table=FILTERED_TABLE)) == list(method())
+            pool.put(conn)
+
+        assert count == 5
+
+    def test_filtered_table_built_once_per_pool(self, research_db, monkeypatch):
+        """Test the pool makes one pass over neumann_scores however many connections it has."""
+        queries = ResearchQueries(research_db)
+        statements: list[str] = []
+        connect = queries._connect_read_only
+
+        def traced_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(queries, "_connect_read_only", traced_connect)
+
+        with queries.connection_pool(size=3, max_gain=50000) as pool:
+            conns = [pool.get() for _ in range(3)]
+            counts = [
+                conn.execute(f"SELECT COUNT(*) FROM temp.{FILTERED_TABLE}").fetchone()[0]
+                for conn in conns
+            ]
+            schemas = {row["name"] for row in conns[0].execute("PRAGMA database_list")}
+            for conn in conns:
+                pool.put(conn)
+
+        passes = [sql for sql in statements if "FROM neumann_scores" in sql]
+        assert len(passes) == 1
+        assert counts == [5, 5, 5]
+        assert schemas == {"main", "temp"}  # staging database detached
+
+
+class TestRunIds:
+    """Tests for generated research run IDs."""
+
+    def test_default_run_ids_are_unique(self, research_db):
+        """Test back-to-back runs without a run_id get distinct IDs."""
+        runner = ResearchRunner(research_db)
+
+        first = runner.run_full_analysis()["run_id"]
+        second = runner.run_full_analysis()["run_id"]
+
+        assert first.startswith("full_analysis_")
+        assert first != second
+        runner.db.close()
+
+
+class TestFindingStorage:
+    """Tests for writing findings from analysis results."""
+
+    def test_single_analysis_stores_numeric_metrics(self, research_db):
+        """Test only numeric metrics become findings rows."""
+        runner = ResearchRunner(research_db)
+
+        results = runner.run_single_analysis("theme_performance", run_id="single")
+        findings = runner.db.get_findings(run_id="single")
+
+        assert {f["metric_name"] for f in findings} == {"avg_gain", "avg_days"}
+        assert len(findings) == 2 * len(results)
+        runner.db.close()
+
+    def test_dict_findings_still_supported(self, research_db):
+        """Test add_findings_bulk stores dict findings with parameters."""
+        db = Database(research_db)
+
+        count = db.add_findings_bulk([{
+            "run_id": "manual",
+            "finding_type": "note",
+            "finding_key": "k",
+            "metric_name": "m",
+            "metric_value": 1.5,
+            "parameters": {"max_gain": 100},
+        }])
+
+        assert count == 1
+        [finding] = db.get_findings(run_id="manual")
+        assert finding["metric_value"] == 1.5
+        assert "max_gain" in finding["parameters"]
+        db.close()
+
+
+class TestResultCache:
+    """Tests for memoized query results."""
+
+    def test_repeat_calls_are_cached(self, research_db):
+        """Test an unchanged database serves repeated queries from the cache."""
+        queries = ResearchQueries(research_db)
+
+        first = list(queries.criteria_lift())
+        queries.close()
+        queries.connection = None  # any query that reaches SQLite would fail
+
+        assert list(queries.criteria_lift()) == first
+        with pytest.raises(TypeError):
+            list(queries.criteria_lift(max_gain=200))
+
+    def test_write_invalidates_cache(self, research_db):
+        """Test committed writes change the stamp and refresh results."""
+        queries = ResearchQueries(research_db)
+        assert next(queries.summary_stats()).sample_size == 5
+
+        with sqlite3.connect(research_db) as writer:
+            writer.execute("DELETE FROM neumann_scores WHERE ticker = 'AAA'")
+
+        assert next(queries.summary_stats()).sample_size == 4
+
+
+class TestFormatting:
+    """Tests for the text report formatters."""
+
+    def test_format_results(self, research_db):
+        """Test results are grouped under a heading per finding type."""
+        runner = ResearchRunner(research_db)
+        results = [
+            QueryResult("volume_profile", "low", {"avg_gain": 1234.5, "n": 3}, 3),
+            QueryResult("volume_profile", "high", {}, 1),
+        ]
+
+        assert runner.format_results(results) == (
+            "\n## Volume Profile\n\n"
+            "**low** (n=3)\n"
+            "  - avg_gain: 1,234.5\n"
+            "  - n: 3\n\n"
+            "**high** (n=1)\n"
+        )
+        assert runner.format_results([]) == ""
+        runner.db.close()
+
+    def test_format_comparison(self, research_db):
+        """Test comparisons render one markdown table per finding type."""
+        runner = ResearchRunner(research_db)
+        rows = [{
+            "finding_type": "criteria_lift",
+            "finding_key": "near_lows",
+            "metric_name": "lift",
+            "value_1": 1.5,
+            "value_2": 1.8,
+            "pct_change": 20.0,
+        }]
+
+        assert runner.format_comparison(rows) == (
+            "## Run Comparison\n\n\n"
+            "### Criteria Lift\n\n"
+            "| Key | Metric | Run 1 | Run 2 | Change |\n"
+            "|-----|--------|-------|-------|--------|\n"
+            "| near_lows | lift | 1.5 | 1.8 | +20.0% |"
+        )
+        runner.db.close()
+
+
+class TestRounding:
+    """Tests for rounding aggregates in Python."""
+
+    @pytest.mark.parametrize(
+        ("value", "digits"),
+        [(2.675, 2), (1.005, 2), (0.15, 1), (-2.675, 2), (0.5, 0), (2.5, 0), (123.456, 1)],
+    )
+    def test_round_matches_sqlite(self, value, digits):
+        """Test _round agrees with SQLite's ROUND, including decimal ties."""
+        expected = sqlite3.connect(":memory:").execute("SELECT ROUND(?, ?)", (value, digits))
+
+        assert _round(value, digits) == expected.fetchone()[0]
+
+    def test_round_maps_missing_to_none(self):
+        """Test NaN and None round to None."""
+        assert _round(float("nan"), 1) is None
+        assert _round(None, 1) is None
@@ -1,7 +1,9 @@
 """Unit tests for the gainer scanner."""
 
-import pytest
+from datetime import date
+from unittest.mock import MagicMock
 
+from stock_finder.config import DEFAULT_MAX_WORKERS, ParallelConfig
 from stock_finder.scanners.gainer_scanner import GainerScanner
 
 
@@ -85,3 +87,115 @@ class TestGainerScanner:
         results = scanner.scan([], show_progress=False)
 
         assert results == []
+
+    def test_parallel_scan_matches_sequential(self, mock_provider, scan_config):
+        """The thread-pool scan should find the same results as the sequential one."""
+        scan_config.min_gain_pct = 0.1
+        tickers = ["GAINER", "LOSER", "FLAT", "UNKNOWN"]
+        found = []
+
+        parallel = GainerScanner(mock_provider, scan_config, ParallelConfig(max_workers=2))
+        sequential = GainerScanner(mock_provider, scan_config, ParallelConfig(enabled=False))
+
+        results = parallel.scan(tickers, show_progress=False, on_result=found.append)
+
+        assert results == sequential.scan(tickers, show_progress=False)
+        assert sorted(r.ticker for r in found) == sorted(r.ticker for r in results)
+
+    def test_scan_records_errors(self, mock_provider, scan_config, monkeypatch):
+        """A failing fetch should be logged and skipped, not abort the scan."""
+        def fail(ticker, start, end):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(mock_provider, "get_historical_df", fail)
+        scanner = GainerScanner(mock_provider, scan_config)
+
+        assert scanner.scan(["GAINER", "LOSER"], show_progress=False) == []
+
+    def test_scan_computes_date_range_once(self, mock_provider, scan_config, monkeypatch):
+        """The lookback window should be computed once per scan, not per ticker."""
+        scanner = GainerScanner(mock_provider, scan_config, ParallelConfig(enabled=False))
+        calls = []
+        get_date_range = scanner._get_date_range
+        monkeypatch.setattr(scanner, "_get_date_range", lambda: calls.append(1) or get_date_range())
+
+        scanner.scan(["GAINER", "LOSER", "FLAT"], show_progress=False)
+
+        assert len(calls) == 1
+
+    def test_progress_updates_are_batched(self, monkeypatch):
+        """The progress bar should be updated a bounded number of times."""
+        progress = MagicMock()
+        monkeypatch.setattr(GainerScanner, "_make_progress", staticmethod(lambda: progress))
+
+        with GainerScanner._progress(True, "Scanning...", 10_000) as update_progress:
+            for completed in range(1, 10_001):
+                update_progress(completed)
+
+        updates = progress.__enter__.return_value.update.call_args_list
+        assert len(updates) == 200
+        assert updates[-1].kwargs["completed"] == 10_000
+
+    def test_progress_bars_do_not_share_columns(self):
+        """Each progress bar should get its own (stateful) column instances."""
+        first = GainerScanner._make_progress().columns
+        second = GainerScanner._make_progress().columns
+
+        assert not {id(column) for column in first} & {id(column) for column in second}
+
+    def test_top_k_keeps_biggest_gainers(self, mock_provider, scan_config):
+        """top_k should return the same leading results as a full scan."""
+        import pandas as pd
+
+        dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=300, freq="D")
+        tickers = []
+        for peak in (60, 90, 75, 120):
+            prices = [10] * 100 + list(range(10, peak)) + [peak] * (200 - (peak - 10))
+            mock_provider.data[f"UP{peak}"] = pd.DataFrame({"Close": prices}, index=dates)
+            tickers.append(f"UP{peak}")
+
+        scanner = GainerScanner(mock_provider, scan_config, ParallelConfig(enabled=False))
+        found = []
+
+        full = scanner.scan(tickers, show_progress=False)
+        top = scanner.scan(tickers, show_progress=False, on_result=found.append, top_k=2)
+
+        assert [r.ticker for r in full] == ["UP120", "UP90", "UP75", "UP60"]
+        assert top == full[:2]
+        assert len(found) == 4
+
+    def test_workers_default_to_provider_concurrency(self, mock_provider, scan_config, monkeypatch):
+        """Unset max_workers should follow the provider; an explicit value wins."""
+        monkeypatch.setattr(type(mock_provider), "suggested_concurrency", 3, raising=False)
+
+        assert GainerScanner(mock_provider, scan_config).parallel_config.max_workers == 3
+        explicit = GainerScanner(mock_provider, scan_config, ParallelConfig(max_workers=5))
+        assert explicit.parallel_config.max_workers == 5
+
+    def test_workers_fall_back_without_provider_concurrency(self, mock_provider, scan_config):
+        """A provider without an int suggested_concurrency should get the fixed default."""
+        scanner = GainerScanner(mock_provider, scan_config)
+
+        assert scanner.parallel_config.max_workers == DEFAULT_MAX_WORKERS
+
+    def test_sequential_prefetch_keeps_order_and_errors(self, mock_provider, scan_config, monkeypatch):
+        """Prefetching should not reorder results or misattribute fetch errors."""
+        fetch = mock_provider.get_historical_df
+
+        def flaky(ticker, start, end):
+            if ticker == "LOSER":
+                raise RuntimeError("boom")
+            return fetch(ticker, start, end)
+
+        monkeypatch.setattr(mock_provider, "get_historical_df", flaky)
+        scanner = GainerScanner(mock_provider, scan_config, ParallelConfig(enabled=False))
+        seen = []
+        monkeypatch.setattr(scanner, "_evaluate", lambda ticker, df: seen.append(ticker))
+
+        results, errors = scanner._scan_sequential(
+            ["GAINER", "LOSER", "FLAT"], date(2023, 1, 1), date.today(), False, None
+        )
+
+        assert results == []
+        assert errors == ["LOSER"]
+        assert seen == ["GAINER", "FLAT"]
@@ -1,7 +1,7 @@
 """Unit tests for NeumannScorer (TDD)."""
 
 import tempfile
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 
 import pandas as pd
@@ -171,6 +171,20 @@ class MockDataProvider:
         )
 
 
+class BatchMockDataProvider(MockDataProvider):
+    """Mock provider that also serves batch history downloads."""
+
+    def __init__(self, historical_data: dict[str, pd.DataFrame]):
+        super().__init__(historical_data)
+        self.batch_calls = 0
+
+    def get_historical_batch(self, tickers: list[str], start: date, end: date):
+        """Return mock historical data for all tickers at once."""
+        self.batch_calls += 1
+        results = (self.get_historical(ticker, start, end) for ticker in tickers)
+        return {r.ticker: r for r in results if r is not None}
+
+
 # =============================================================================
 # Tests for NeumannScorer
 # =============================================================================
@@ -288,7 +302,7 @@ class TestNeumannScorer:
         assert result.ticker == "MISSING"
         # Most criteria should fail due to missing historical data
         failed_count = sum(
-            1 for r in result.criteria_results.values() if not r["passed"]
+            1 for _, passed, *_ in result.criteria_results if not passed
         )
         assert failed_count >= 5  # At least 5 of 8 should fail
 
@@ -321,6 +335,95 @@ class TestNeumannScorer:
         saved = temp_db.get_neumann_scores()
         assert len(saved) == 3
 
+    def test_score_all_prefetches_with_batch_provider(
+        self, temp_db, sample_scan_results, mock_historical_data
+    ):
+        """A batch-capable provider should be called once instead of per stock."""
+        from stock_finder.scoring.scorer import NeumannScorer
+
+        scan_run_id = sample_scan_results[0]["scan_run_id"]
+        expected = NeumannScorer(
+            provider=MockDataProvider(mock_historical_data), db=temp_db
+        ).score_all(scan_run_id=scan_run_id)
+
+        provider = BatchMockDataProvider(mock_historical_data)
+        scores = NeumannScorer(provider=provider, db=temp_db).score_all(scan_run_id=scan_run_id)
+
+        assert provider.batch_calls == 3  # one per distinct ignition date
+        assert provider.call_count == 3  # once per ticker, inside the batches
+        assert {s.ticker: s for s in scores} == {s.ticker: s for s in expected}
+
+    def test_prefetch_groups_results_by_ignition_date(self, mock_historical_data):
+        """Results sharing an ignition date share one batch over their own window."""
+        from stock_finder.scoring.scorer import HISTORY_DAYS, NeumannScorer
+
+        windows = []
+
+        class WindowRecordingProvider(BatchMockDataProvider):
+            def get_historical_batch(self, tickers, start, end):
+                windows.append((tuple(tickers), start, end))
+                return super().get_historical_batch(tickers, start, end)
+
+        low = date(2019, 3, 1)
+        results = [
+            {"ticker": "WINNER1", "low_date": low},
+            {"ticker": "WINNER2", "low_date": low.isoformat()},
+            {"ticker": "WINNER3", "low_date": date(2019, 4, 1)},
+        ]
+        scorer = NeumannScorer(provider=WindowRecordingProvider(mock_historical_data))
+
+        histories = scorer._prefetch_histories(results)
+
+        assert sorted(windows) == [
+            (("WINNER1", "WINNER2"), low - timedelta(days=HISTORY_DAYS), low),
+            (("WINNER3",), date(2019, 4, 1) - timedelta(days=HISTORY_DAYS), date(2019, 4, 1)),
+        ]
+        assert histories[("WINNER3", date(2019, 4, 1))].index.max() == pd.Timestamp("2019-04-01")
+
+    def test_no_prefetch_when_cache_wraps_unbatched_provider(self, mock_historical_data):
+        """A cache over a per-ticker provider should not prefetch through serial fetches."""
+        from stock_finder.data.cached_provider import CachedDataProvider
+        from stock_finder.scoring.scorer import NeumannScorer
+
+        provider = CachedDataProvider(MockDataProvider(mock_historical_data), cache_manager=None)
+        scorer = NeumannScorer(provider=provider)
+
+        results = [{"ticker": "WINNER1", "low_date": date(2019, 3, 1)}]
+        assert scorer._prefetch_histories(results) is None
+        assert provider.provider.call_count == 0
+
+    def test_quote_fetched_once_per_ticker(self, mock_historical_data):
+        """Repeated tickers should reuse the first quote, including failures."""
+        from stock_finder.scoring.scorer import NeumannScorer
+
+        provider = MockDataProvider(mock_historical_data)
+        calls = []
+        get_quote = provider.get_quote
+
+        def counting_quote(ticker):
+            calls.append(ticker)
+            if ticker == "WINNER2":
+                raise RuntimeError("no quote")
+            return get_quote(ticker)
+
+        provider.get_quote = counting_quote
+        scorer = NeumannScorer(provider=provider)
+
+        for ticker in ["WINNER1", "WINNER2", "WINNER1", "WINNER2"]:
+            score = scorer.score_stock(
+                {
+                    "ticker": ticker,
+                    "low_date": "2019-03-01",
+                    "low_price": 10.0,
+                    "high_date": "2020-01-15",
+                    "high_price": 60.0,
+                    "gain_pct": 500.0,
+                }
+            )
+            assert (score.market_cap_estimate is None) == (ticker == "WINNER2")
+
+        assert calls == ["WINNER1", "WINNER2"]
+
 
 # =============================================================================
 # Tests for Database Neumann Score Methods
@@ -336,10 +439,10 @@ class TestDatabaseNeumannScores:
             ticker="TEST",
             scan_result_id=1,
             score=5,
-            criteria_results={
-                "drawdown": {"passed": True, "value": -0.60},
-                "extended_decline": {"passed": True, "value": 150},
-            },
+            criteria_results=(
+                ("drawdown", True, -0.60, -0.50, "Drawdown -60%"),
+                ("extended_decline", True, 150, 90, "150 days since high"),
+            ),
             drawdown=-0.60,
             days_since_high=150,
             range_position=0.15,
@@ -371,7 +474,7 @@ class TestDatabaseNeumannScores:
                     ticker=f"STOCK{i}",
                     scan_result_id=i,
                     score=score_val,
-                    criteria_results={},
+                    criteria_results=(),
                 )
             )
 
@@ -388,7 +491,7 @@ class TestDatabaseNeumannScores:
                     ticker=f"STOCK{i}",
                     scan_result_id=i,
                     score=score_val,
-                    criteria_results={},
+                    criteria_results=(),
                     gain_pct=float(gain),
                     days_to_peak=100,
                 )
@@ -409,7 +512,7 @@ class TestDatabaseNeumannScores:
                     ticker=f"STOCK{i}",
                     scan_result_id=i,
                     score=i,
-                    criteria_results={},
+                    criteria_results=(),
                 )
             )
 
@@ -472,6 +575,21 @@ class TestScorerEdgeCases:
         result = scorer.score_stock(scan_result)
         assert isinstance(result, NeumannScore)
 
+    def test_context_smas_match_pandas_and_skip_nans(self, mock_historical_data):
+        """SMAs should equal the pandas tail means, ignoring missing closes."""
+        from stock_finder.scoring.scorer import NeumannScorer
+
+        df = mock_historical_data["WINNER1"].copy()
+        df.iloc[-10:-5, df.columns.get_loc("Close")] = float("nan")
+        provider = MockDataProvider({"WINNER1": df})
+        scorer = NeumannScorer(provider=provider)
+
+        ignition = df.index[-1].date()
+        context = scorer._build_context("WINNER1", ignition, 10.0, ignition, 60.0, 500.0)
+
+        assert context.sma_data["sma50"] == pytest.approx(df["Close"].tail(50).mean())
+        assert context.sma_data["sma200"] == pytest.approx(df["Close"].tail(200).mean())
+
 
 # =============================================================================
 # Tests for Scoring Modes
@@ -611,6 +729,46 @@ class TestScorerModes:
 
         # Count passed criteria
         passed_count = sum(
-            1 for r in result.criteria_results.values() if r["passed"]
+            1 for _, passed, *_ in result.criteria_results if passed
         )
         assert result.score == passed_count
+
+
+# =============================================================================
+# Tests for Report Statistics
+# =============================================================================
+
+
+class TestCriteriaStats:
+    """Tests for per-criterion report statistics."""
+
+    def test_pass_rates_and_average_gains(self):
+        """Each criterion should tally its passes, failures and average gains."""
+        from stock_finder.scoring.report import _calculate_criteria_stats
+
+        scores = [
+            {"gain_pct": 100, "criteria_results": {"a": {"passed": True}, "b": {"passed": False}}},
+            {"gain_pct": None, "criteria_results": {"a": {"passed": False}}},
+            {"gain_pct": 300, "criteria_results": {"a": {"passed": True}}},
+            {"gain_pct": 50},
+        ]
+
+        stats = _calculate_criteria_stats(scores)
+
+        assert stats["a"] == {
+            "pass_rate": pytest.approx(2 / 3),
+            "passed_count": 2,
+            "failed_count": 1,
+            "avg_gain_when_passed": 200.0,
+            "avg_gain_when_failed": 0.0,
+        }
+        assert stats["b"]["pass_rate"] == 0
+        assert stats["b"]["avg_gain_when_passed"] == 0
+        assert stats["b"]["avg_gain_when_failed"] == 100.0
+
+    def test_no_criteria_results(self):
+        """Scores without criteria results should produce no statistics."""
+        from stock_finder.scoring.report import _calculate_criteria_stats
+
+        assert _calculate_criteria_stats([]) == {}
+        assert _calculate_criteria_stats([{"gain_pct": 10}]) == {}
@@ -0,0 +1,78 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+import math
+from datetime import date
+
+import numpy as np
+import pytest
+
+from stock_finder.models.results import NeumannScore, ScanResult
+from stock_finder.utils import serialization
+from stock_finder.utils.serialization import json_dumps, json_loads
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonDumps:
+    """Tests for json_dumps."""
+
+    def test_serializes_result_dataclasses(self, backend):
+        """Test that results encode directly, with dates as ISO strings."""
+        results = [
+            ScanResult(
+                ticker="AAAA",
+                gain_pct=600.0,
+                low_date=date(2022, 1, 15),
+                high_date=date(2022, 6, 15),
+                low_price=10.0,
+                high_price=70.0,
+                current_price=65.0,
+                days_to_peak=100,
+            )
+        ]
+
+        decoded = json_loads(json_dumps(results))
+
+        assert decoded[0]["ticker"] == "AAAA"
+        assert decoded[0]["low_date"] == "2022-01-15"
+        assert decoded[0]["days_to_peak"] == 100
+
+    def test_serializes_numpy_values(self, backend):
+        """Test that numpy scalars inside nested dicts are converted."""
+        score = NeumannScore(
+            ticker="BBBB",
+            scan_result_id=1,
+            score=5,
+            criteria_results=(("drawdown", np.bool_(True), np.float64(0.7), -0.5, "deep"),),
+        )
+
+        decoded = json_loads(json_dumps(score.criteria_dict()))
+
+        assert decoded["drawdown"]["passed"] is True
+        assert decoded["drawdown"]["value"] == 0.7
+
+    def test_non_finite_floats_encode_as_null(self, backend):
+        """Test that NaN and infinity are written as null by both encoders."""
+        encoded = json_dumps({"vol_ratio": float("nan"), "gain": np.float64("inf"), "n": 1})
+
+        assert encoded == '{"vol_ratio":null,"gain":null,"n":1}'
+
+
+class TestJsonLoads:
+    """Tests for json_loads."""
+
+    def test_reads_stdlib_nan_tokens(self, backend):
+        """Test that rows written with NaN/Infinity tokens still parse."""
+        decoded = json_loads(json.dumps({"vol_ratio": float("nan"), "gain": float("inf")}))
+
+        assert math.isnan(decoded["vol_ratio"])
+        assert decoded["gain"] == float("inf")
@@ -0,0 +1,152 @@
+"""Tests for Yahoo Finance provider."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_finder.config import DataConfig
+from stock_finder.data import yfinance_provider
+from stock_finder.data.yfinance_provider import YFinanceProvider
+
+
+def _download_frame(tickers: list[str], periods: int = 3) -> pd.DataFrame:
+    """Build a frame shaped like yf.download(..., group_by="ticker")."""
+    index = pd.date_range("2024-01-02", periods=periods, freq="D", name="Date")
+    columns = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Volume"]])
+    return pd.DataFrame(np.ones((periods, len(columns))), index=index, columns=columns)
+
+
+class TestGetHistorical:
+    """Tests for YFinanceProvider.get_historical."""
+
+    @patch("yfinance.Ticker")
+    def test_returns_ohlcv_without_actions(self, mock_ticker):
+        """Test that history is requested without actions and trimmed to OHLCV."""
+        df = _download_frame(["AAPL"]).droplevel(0, axis=1)
+        df["Dividends"] = 0.0
+        mock_ticker.return_value.history.return_value = df
+        provider = YFinanceProvider(config=DataConfig(rate_limit_delay=0))
+
+        result = provider.get_historical("AAPL", date(2024, 1, 1), date(2024, 1, 5))
+
+        assert list(result.data.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert mock_ticker.return_value.history.call_args.kwargs["actions"] is False
+
+
+class TestGetCurrentPrice:
+    """Tests for YFinanceProvider.get_current_price."""
+
+    @patch("yfinance.Ticker")
+    def test_reads_fast_info(self, mock_ticker):
+        """Test that the price comes from fast_info in one lookup."""
+        mock_ticker.return_value.fast_info = {"last_price": 187.5}
+        provider = YFinanceProvider(config=DataConfig(rate_limit_delay=0))
+
+        assert provider.get_current_price("AAPL") == 187.5
+
+    @patch("yfinance.Ticker")
+    def test_missing_price_returns_none(self, mock_ticker):
+        """Test that a missing last price returns None."""
+        mock_ticker.return_value.fast_info = {}
+        provider = YFinanceProvider(config=DataConfig(rate_limit_delay=0))
+
+        assert provider.get_current_price("AAPL") is None
+
+
+class TestGetHistoricalBatch:
+    """Tests for YFinanceProvider.get_historical_batch."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create a provider without rate limiting."""
+        return YFinanceProvider(config=DataConfig(rate_limit_delay=0))
+
+    @patch("yfinance.download")
+    def test_splits_multi_ticker_frame(self, mock_download, provider):
+        """Test that each ticker gets its own OHLCV frame."""
+        mock_download.return_value = _download_frame(["AAPL", "NVDA"])
+
+        result = provider.get_historical_batch(["AAPL", "NVDA"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert sorted(result) == ["AAPL", "NVDA"]
+        assert list(result["AAPL"].data.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert len(result["NVDA"].data) == 3
+        mock_download.assert_called_once()
+
+    @patch("yfinance.download")
+    def test_drops_tickers_without_data(self, mock_download, provider):
+        """Test that all-NaN and missing tickers are omitted."""
+        df = _download_frame(["AAPL", "DEAD"])
+        df["DEAD"] = np.nan
+        mock_download.return_value = df
+
+        result = provider.get_historical_batch(
+            ["AAPL", "DEAD", "MISSING"], date(2024, 1, 1), date(2024, 1, 5)
+        )
+
+        assert list(result) == ["AAPL"]
+
+    @patch("yfinance.download")
+    def test_handles_flat_single_ticker_frame(self, mock_download, provider):
+        """Test the flat-column shape returned for a single ticker."""
+        mock_download.return_value = _download_frame(["AAPL"]).droplevel(0, axis=1)
+
+        result = provider.get_historical_batch(["AAPL"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert list(result) == ["AAPL"]
+
+    @patch("yfinance.download")
+    def test_chunks_requests(self, mock_download, provider, monkeypatch):
+        """Test that tickers are downloaded DOWNLOAD_CHUNK_SIZE at a time."""
+        monkeypatch.setattr(yfinance_provider, "DOWNLOAD_CHUNK_SIZE", 2)
+        mock_download.side_effect = lambda tickers, **kwargs: _download_frame(tickers.split())
+
+        result = provider.get_historical_batch(["A", "B", "C"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert sorted(result) == ["A", "B", "C"]
+        assert mock_download.call_count == 2
+
+    @patch("yfinance.download")
+    def test_failed_chunk_is_skipped(self, mock_download, provider, monkeypatch):
+        """Test that one failing chunk does not lose the others."""
+        monkeypatch.setattr(yfinance_provider, "DOWNLOAD_CHUNK_SIZE", 1)
+
+        def fake_download(tickers, **kwargs):
+            if tickers == "BAD":
+                raise ConnectionError("boom")
+            return _download_frame([tickers])
+
+        mock_download.side_effect = fake_download
+
+        result = provider.get_historical_batch(["A", "BAD", "C"], date(2024, 1, 1), date(2024, 1, 5))
+
+        assert sorted(result) == ["A", "C"]
+
+
+class TestIterHistorical:
+    """Tests for DataProvider.iter_historical."""
+
+    @patch("yfinance.Ticker")
+    def test_yields_each_ticker_with_data(self, mock_ticker):
+        """Test that fetches run concurrently and empty tickers are skipped."""
+        def make_ticker(symbol):
+            ticker = MagicMock()
+            if symbol == "EMPTY":
+                ticker.history.return_value = pd.DataFrame()
+            elif symbol == "BAD":
+                ticker.history.side_effect = ConnectionError("boom")
+            else:
+                ticker.history.return_value = _download_frame([symbol]).droplevel(0, axis=1)
+            return ticker
+
+        mock_ticker.side_effect = make_ticker
+        provider = YFinanceProvider(config=DataConfig(rate_limit_delay=0))
+
+        results = provider.iter_historical(
+            ["AAPL", "EMPTY", "BAD", "NVDA"], date(2024, 1, 1), date(2024, 1, 5), max_workers=4
+        )
+
+        assert sorted(stock.ticker for stock in results) == ["AAPL", "NVDA"]